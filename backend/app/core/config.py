@@ -4,6 +4,11 @@ Configuration settings for LEGALS backend
 import os
 from typing import List
 
+# Section data shipped with the repository, the same file load_graph.py imports into Neo4j
+BUNDLED_GRAPH_SOURCE = os.path.join(
+    os.path.dirname(os.path.abspath(__file__)), "..", "..", "..", "data", "csv_friend", "bns_ch17_final_cleaned.csv"
+)
+
 
 class Settings:
     """Application settings"""
@@ -27,18 +32,67 @@ class Settings:
     POSTGRES_PASSWORD: str = os.getenv("POSTGRES_PASSWORD", "password")
     POSTGRES_DB: str = os.getenv("POSTGRES_DB", "legals_db")
     
+    # Write-behind storage of completed queries (app/services/persistence_queue.py)
+    PERSISTENCE_ENABLED: bool = os.getenv("PERSISTENCE_ENABLED", "true").lower() == "true"
+    PERSISTENCE_QUEUE_SIZE: int = int(os.getenv("PERSISTENCE_QUEUE_SIZE", "10000"))  # rows held before new rows are dropped
+    PERSISTENCE_BATCH_SIZE: int = int(os.getenv("PERSISTENCE_BATCH_SIZE", "500"))  # rows per insert
+    PERSISTENCE_FLUSH_INTERVAL: float = float(os.getenv("PERSISTENCE_FLUSH_INTERVAL", "0.5"))  # seconds a batch may wait to fill
+    PERSISTENCE_SHUTDOWN_TIMEOUT: float = float(os.getenv("PERSISTENCE_SHUTDOWN_TIMEOUT", "10"))  # seconds to drain at shutdown
+    # Rows still unwritten at shutdown are saved here and replayed on the next start; empty discards them
+    PERSISTENCE_SPILL_PATH: str = os.getenv("PERSISTENCE_SPILL_PATH", "pending_legal_queries.jsonl")
+    
+    # Connection pool, per engine (async for the API, sync for the write-behind queue and scripts)
+    POSTGRES_POOL_SIZE: int = int(os.getenv("POSTGRES_POOL_SIZE", "10"))
+    POSTGRES_MAX_OVERFLOW: int = int(os.getenv("POSTGRES_MAX_OVERFLOW", "20"))  # extra connections under bursts
+    POSTGRES_POOL_TIMEOUT: float = float(os.getenv("POSTGRES_POOL_TIMEOUT", "5"))  # seconds waiting for a free connection
+    POSTGRES_POOL_RECYCLE: int = int(os.getenv("POSTGRES_POOL_RECYCLE", "300"))  # seconds before a connection is replaced
+    # asyncpg prepared statements kept per connection; 0 disables them (required behind pgbouncer transaction pooling)
+    POSTGRES_STATEMENT_CACHE_SIZE: int = int(os.getenv("POSTGRES_STATEMENT_CACHE_SIZE", "100"))
+    
     @property
     def SQLALCHEMY_DATABASE_URI(self) -> str:
         return f"postgresql://{self.POSTGRES_USER}:{self.POSTGRES_PASSWORD}@{self.POSTGRES_SERVER}/{self.POSTGRES_DB}"
     
+    @property
+    def SQLALCHEMY_ASYNC_DATABASE_URI(self) -> str:
+        return (
+            f"postgresql+asyncpg://{self.POSTGRES_USER}:{self.POSTGRES_PASSWORD}@{self.POSTGRES_SERVER}/{self.POSTGRES_DB}"
+            f"?prepared_statement_cache_size={self.POSTGRES_STATEMENT_CACHE_SIZE}"
+        )
+    
     # Neo4j Configuration
     NEO4J_URI: str = os.getenv("NEO4J_URI", "bolt://localhost:7687")
     NEO4J_USER: str = os.getenv("NEO4J_USER", "neo4j")
     NEO4J_PASSWORD: str = os.getenv("NEO4J_PASSWORD", "Avirup@190204")
+    NEO4J_DATABASE: str = os.getenv("NEO4J_DATABASE", "legalknowledge")
+    SECTION_CATALOG_TTL: int = int(os.getenv("SECTION_CATALOG_TTL", "3600"))  # seconds
+    # Seconds to wait after a failed catalogue refresh before reloading again
+    SECTION_CATALOG_RETRY_INTERVAL: float = float(os.getenv("SECTION_CATALOG_RETRY_INTERVAL", "30"))
+    # Create constraints, indexes and PUNISHED_BY links when the service connects
+    NEO4J_BOOTSTRAP_SCHEMA: bool = os.getenv("NEO4J_BOOTSTRAP_SCHEMA", "true").lower() == "true"
+    # Gzipped graph snapshot (export_graph_snapshot.py) served when Neo4j is unreachable
+    GRAPH_SNAPSHOT_PATH: str = os.getenv("GRAPH_SNAPSHOT_PATH", "")
+    # Section source (.csv/.json) built into an in-memory snapshot when no snapshot file is set
+    GRAPH_SOURCE_PATH: str = os.getenv("GRAPH_SOURCE_PATH", BUNDLED_GRAPH_SOURCE)
+    # Serve only from the snapshot and never connect to Neo4j (edge deployments)
+    GRAPH_SNAPSHOT_ONLY: bool = os.getenv("GRAPH_SNAPSHOT_ONLY", "false").lower() == "true"
+    GRAPH_LOAD_BATCH_SIZE: int = int(os.getenv("GRAPH_LOAD_BATCH_SIZE", "1000"))  # rows per UNWIND transaction in load_graph.py
+    # Driver connection pool, one per driver (sync and async)
+    NEO4J_MAX_CONNECTION_POOL_SIZE: int = int(os.getenv("NEO4J_MAX_CONNECTION_POOL_SIZE", "100"))
+    NEO4J_CONNECTION_ACQUISITION_TIMEOUT: float = float(os.getenv("NEO4J_CONNECTION_ACQUISITION_TIMEOUT", "5"))  # seconds waiting for a free connection
+    NEO4J_CONNECTION_TIMEOUT: float = float(os.getenv("NEO4J_CONNECTION_TIMEOUT", "5"))  # seconds to open a new connection
+    NEO4J_MAX_CONNECTION_LIFETIME: float = float(os.getenv("NEO4J_MAX_CONNECTION_LIFETIME", "3600"))  # seconds
+    NEO4J_KEEP_ALIVE: bool = os.getenv("NEO4J_KEEP_ALIVE", "true").lower() == "true"
+    # Idle seconds after which a pooled connection is pinged before reuse
+    NEO4J_LIVENESS_CHECK_TIMEOUT: float = float(os.getenv("NEO4J_LIVENESS_CHECK_TIMEOUT", "30"))
     
     # Ollama Configuration
     OLLAMA_BASE_URL: str = os.getenv("OLLAMA_BASE_URL", "http://localhost:11434")
     OLLAMA_MODEL: str = os.getenv("OLLAMA_MODEL", "phi3:mini")
+    # Generate legal advice with Phi-3 instead of the templated fallback (off for demo reliability)
+    OLLAMA_RESPONSE_FORMATTING: bool = os.getenv("OLLAMA_RESPONSE_FORMATTING", "false").lower() == "true"
+    # Phi-3 calls in flight at once per batch stage (extraction, formatting)
+    OLLAMA_BATCH_CONCURRENCY: int = int(os.getenv("OLLAMA_BATCH_CONCURRENCY", "8"))
     
     # External Services
     AZURE_TRANSLATOR_KEY: str = os.getenv("AZURE_TRANSLATOR_KEY", "")
@@ -49,11 +103,29 @@ class Settings:
     
     # Security
     SECRET_KEY: str = os.getenv("SECRET_KEY", "your-secret-key-change-in-production")
+    ADMIN_API_KEY: str = os.getenv("ADMIN_API_KEY", "")  # empty disables the admin endpoints
     ACCESS_TOKEN_EXPIRE_MINUTES: int = 30
     
     # Application Settings
     MAX_QUERY_LENGTH: int = 1000
+    MAX_BATCH_SIZE: int = 500  # queries per /legal/query/batch call
     RESPONSE_TIMEOUT: int = 60  # seconds
+    RESPONSE_CACHE_SIZE: int = int(os.getenv("RESPONSE_CACHE_SIZE", "1024"))  # 0 disables the cache
+    RESPONSE_CACHE_TTL: int = int(os.getenv("RESPONSE_CACHE_TTL", "900"))  # seconds
+    STORED_QUERY_CACHE_SIZE: int = int(os.getenv("STORED_QUERY_CACHE_SIZE", "4096"))  # 0 disables the cache
+    STORED_QUERY_CACHE_TTL: int = int(os.getenv("STORED_QUERY_CACHE_TTL", "3600"))  # seconds
+    HISTORY_PAGE_SIZE: int = int(os.getenv("HISTORY_PAGE_SIZE", "20"))  # default queries per history page
+    
+    # Startup
+    COLD_START_BUDGET: float = float(os.getenv("COLD_START_BUDGET", "10"))  # seconds allowed for warm-up
+    
+    # Health Checks
+    HEALTH_CHECK_INTERVAL: float = float(os.getenv("HEALTH_CHECK_INTERVAL", "15"))  # seconds between pings
+    HEALTH_CHECK_TIMEOUT: float = float(os.getenv("HEALTH_CHECK_TIMEOUT", "2"))  # seconds per ping
+    # Dependencies that must be up for readiness; empty because the pipeline has fallbacks for all of them
+    HEALTH_REQUIRED_SERVICES: List[str] = [
+        name.strip() for name in os.getenv("HEALTH_REQUIRED_SERVICES", "").split(",") if name.strip()
+    ]
     
     def __init__(self):
         """Initialize settings with environment variables"""
@@ -66,6 +138,7 @@ class Settings:
         self.NEO4J_URI = os.getenv("NEO4J_URI", self.NEO4J_URI)
         self.NEO4J_USER = os.getenv("NEO4J_USER", self.NEO4J_USER)
         self.NEO4J_PASSWORD = os.getenv("NEO4J_PASSWORD", self.NEO4J_PASSWORD)
+        self.NEO4J_DATABASE = os.getenv("NEO4J_DATABASE", self.NEO4J_DATABASE)
         
         self.OLLAMA_BASE_URL = os.getenv("OLLAMA_BASE_URL", self.OLLAMA_BASE_URL)
         self.OLLAMA_MODEL = os.getenv("OLLAMA_MODEL", self.OLLAMA_MODEL)
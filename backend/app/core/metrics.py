@@ -0,0 +1,316 @@
+"""
+In-process metrics for LEGALS backend
+Counters, gauges and histograms rendered in the Prometheus text exposition format
+"""
+import asyncio
+import functools
+import math
+import threading
+import time
+from contextlib import contextmanager
+from typing import Callable, Dict, Iterable, List, Optional, Tuple
+
+from app.core.config import settings
+
+# Seconds; spans sub-millisecond cache lookups up to the Ollama timeout
+DEFAULT_BUCKETS = (0.0001, 0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 20.0, 30.0)
+
+
+def _format_value(value: float) -> str:
+    if math.isinf(value):
+        return "+Inf" if value > 0 else "-Inf"
+    return repr(float(value))
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _format_labels(names: Iterable[str], values: Iterable[str], extra: str = "") -> str:
+    pairs = [f'{name}="{_escape(str(value))}"' for name, value in zip(names, values)]
+    if extra:
+        pairs.append(extra)
+    return "{" + ",".join(pairs) + "}" if pairs else ""
+
+
+class _Metric:
+    """Shared label handling for all metric types"""
+    metric_type = "untyped"
+
+    def __init__(self, name: str, documentation: str, labelnames: Tuple[str, ...] = ()):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self._lock = threading.Lock()
+
+    def _label_values(self, labels: Dict[str, str]) -> Tuple[str, ...]:
+        if set(labels) != set(self.labelnames):
+            raise ValueError(f"{self.name} expects labels {self.labelnames}, got {tuple(labels)}")
+        return tuple(str(labels[name]) for name in self.labelnames)
+
+    def render(self) -> List[str]:
+        return [f"# HELP {self.name} {self.documentation}", f"# TYPE {self.name} {self.metric_type}"] + self._samples()
+
+    def _samples(self) -> List[str]:
+        raise NotImplementedError
+
+
+class Counter(_Metric):
+    """Monotonically increasing count"""
+    metric_type = "counter"
+
+    def __init__(self, name: str, documentation: str, labelnames: Tuple[str, ...] = ()):
+        super().__init__(name, documentation, labelnames)
+        self._values: Dict[Tuple[str, ...], float] = {}
+
+    def inc(self, amount: float = 1.0, **labels):
+        key = self._label_values(labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0.0) + amount
+
+    def value(self, **labels) -> float:
+        return self._values.get(self._label_values(labels), 0.0)
+
+    def _samples(self) -> List[str]:
+        with self._lock:
+            values = sorted(self._values.items())
+        return [f"{self.name}{_format_labels(self.labelnames, key)} {_format_value(value)}" for key, value in values]
+
+
+class Gauge(_Metric):
+    """Value that can go up and down, or is read from a callback at scrape time"""
+    metric_type = "gauge"
+
+    def __init__(self, name: str, documentation: str, labelnames: Tuple[str, ...] = (),
+                 function: Optional[Callable[[], float]] = None):
+        super().__init__(name, documentation, labelnames)
+        self._values: Dict[Tuple[str, ...], float] = {}
+        self._function = function
+
+    def set(self, value: float, **labels):
+        key = self._label_values(labels)
+        with self._lock:
+            self._values[key] = float(value)
+
+    def inc(self, amount: float = 1.0, **labels):
+        key = self._label_values(labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0.0) + amount
+
+    def dec(self, amount: float = 1.0, **labels):
+        self.inc(-amount, **labels)
+
+    def value(self, **labels) -> float:
+        if self._function is not None:
+            return float(self._function())
+        return self._values.get(self._label_values(labels), 0.0)
+
+    def _samples(self) -> List[str]:
+        if self._function is not None:
+            try:
+                return [f"{self.name} {_format_value(self._function())}"]
+            except Exception:
+                return []
+        with self._lock:
+            values = sorted(self._values.items())
+        return [f"{self.name}{_format_labels(self.labelnames, key)} {_format_value(value)}" for key, value in values]
+
+
+class Histogram(_Metric):
+    """Cumulative bucketed distribution of observed values"""
+    metric_type = "histogram"
+
+    def __init__(self, name: str, documentation: str, labelnames: Tuple[str, ...] = (),
+                 buckets: Tuple[float, ...] = DEFAULT_BUCKETS):
+        super().__init__(name, documentation, labelnames)
+        self.buckets = tuple(sorted(buckets)) + (math.inf,)
+        self._series: Dict[Tuple[str, ...], List] = {}  # label values -> [bucket counts, sum]
+
+    def observe(self, value: float, **labels):
+        key = self._label_values(labels)
+        with self._lock:
+            series = self._series.get(key)
+            if series is None:
+                series = self._series[key] = [[0] * len(self.buckets), 0.0]
+            for index, bound in enumerate(self.buckets):
+                if value <= bound:
+                    series[0][index] += 1
+                    break
+            series[1] += value
+
+    @contextmanager
+    def time(self, **labels):
+        """Observe the duration of a with-block"""
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(time.perf_counter() - start, **labels)
+
+    def timed(self, **labels):
+        """Decorator observing the duration of every call, for plain and async functions"""
+        def decorator(function):
+            if asyncio.iscoroutinefunction(function):
+                @functools.wraps(function)
+                async def async_wrapper(*args, **kwargs):
+                    with self.time(**labels):
+                        return await function(*args, **kwargs)
+                return async_wrapper
+
+            @functools.wraps(function)
+            def wrapper(*args, **kwargs):
+                with self.time(**labels):
+                    return function(*args, **kwargs)
+            return wrapper
+        return decorator
+
+    def count(self, **labels) -> int:
+        series = self._series.get(self._label_values(labels))
+        return sum(series[0]) if series else 0
+
+    def _samples(self) -> List[str]:
+        with self._lock:
+            snapshot = sorted((key, list(series[0]), series[1]) for key, series in self._series.items())
+
+        lines = []
+        for key, counts, total in snapshot:
+            cumulative = 0
+            for bound, bucket_count in zip(self.buckets, counts):
+                cumulative += bucket_count
+                labels = _format_labels(self.labelnames, key, f'le="{_format_value(bound)}"')
+                lines.append(f"{self.name}_bucket{labels} {cumulative}")
+            labels = _format_labels(self.labelnames, key)
+            lines.append(f"{self.name}_sum{labels} {_format_value(total)}")
+            lines.append(f"{self.name}_count{labels} {cumulative}")
+        return lines
+
+
+class MetricsRegistry:
+    """Collection of metrics rendered together by the /metrics endpoint"""
+
+    def __init__(self):
+        self._metrics: Dict[str, _Metric] = {}
+
+    def register(self, metric: _Metric) -> _Metric:
+        if metric.name in self._metrics:
+            raise ValueError(f"Metric {metric.name} already registered")
+        self._metrics[metric.name] = metric
+        return metric
+
+    def counter(self, name: str, documentation: str, labelnames: Tuple[str, ...] = ()) -> Counter:
+        return self.register(Counter(name, documentation, labelnames))
+
+    def gauge(self, name: str, documentation: str, labelnames: Tuple[str, ...] = (),
+              function: Optional[Callable[[], float]] = None) -> Gauge:
+        return self.register(Gauge(name, documentation, labelnames, function))
+
+    def histogram(self, name: str, documentation: str, labelnames: Tuple[str, ...] = (),
+                  buckets: Tuple[float, ...] = DEFAULT_BUCKETS) -> Histogram:
+        return self.register(Histogram(name, documentation, labelnames, buckets))
+
+    def get(self, name: str) -> Optional[_Metric]:
+        return self._metrics.get(name)
+
+    def render(self) -> str:
+        """Prometheus text exposition format (version 0.0.4)"""
+        lines = []
+        for metric in self._metrics.values():
+            lines.extend(metric.render())
+        return "\n".join(lines) + "\n"
+
+
+# Global registry and the metrics recorded by the services
+registry = MetricsRegistry()
+
+PIPELINE_STAGE_SECONDS = registry.histogram(
+    "legals_pipeline_stage_seconds",
+    "Time spent in each legal query pipeline stage",
+    ("stage",)
+)
+QUERIES_TOTAL = registry.counter(
+    "legals_queries_total",
+    "Legal queries processed by outcome",
+    ("outcome",)
+)
+NEO4J_QUERY_SECONDS = registry.histogram(
+    "legals_neo4j_query_seconds",
+    "Neo4j query round-trip time",
+    ("query",)
+)
+OLLAMA_REQUEST_SECONDS = registry.histogram(
+    "legals_ollama_request_seconds",
+    "Ollama API call time",
+    ("operation",)
+)
+CACHE_LOOKUP_SECONDS = registry.histogram(
+    "legals_cache_lookup_seconds",
+    "Response cache lookup time",
+    ("result",)
+)
+FALLBACK_REASONING_TOTAL = registry.counter(
+    "legals_fallback_reasoning_total",
+    "Legal reasoning served by the hardcoded fallback instead of Neo4j",
+    ("reason",)
+)
+DEPENDENCY_UP = registry.gauge(
+    "legals_dependency_up",
+    "1 when the dependency answered its last health ping",
+    ("service",)
+)
+COLD_START_SECONDS = registry.gauge(
+    "legals_cold_start_seconds",
+    "Duration of each service warm-up phase at startup",
+    ("phase",)
+)
+NEO4J_SESSIONS_IN_USE = registry.gauge(
+    "legals_neo4j_sessions_in_use",
+    "Open Neo4j sessions, each holding or waiting for a pooled connection",
+    ("driver",)
+)
+NEO4J_POOL_SIZE = registry.gauge(
+    "legals_neo4j_pool_max_size",
+    "Configured maximum connections per Neo4j driver pool",
+    function=lambda: settings.NEO4J_MAX_CONNECTION_POOL_SIZE
+)
+NEO4J_CONNECTION_WAIT_SECONDS = registry.histogram(
+    "legals_neo4j_connection_wait_seconds",
+    "Time from opening a Neo4j session until its read transaction started",
+    ("driver",)
+)
+NEO4J_POOL_SATURATED_TOTAL = registry.counter(
+    "legals_neo4j_pool_saturated_total",
+    "Neo4j sessions opened while every pooled connection was already in use",
+    ("driver",)
+)
+NEO4J_ACQUISITION_TIMEOUTS_TOTAL = registry.counter(
+    "legals_neo4j_acquisition_timeouts_total",
+    "Neo4j sessions that gave up waiting for a pooled connection",
+    ("driver",)
+)
+PERSISTENCE_FLUSH_SECONDS = registry.histogram(
+    "legals_persistence_flush_seconds",
+    "Time to write one batch of legal queries to PostgreSQL"
+)
+PERSISTENCE_BATCH_ROWS = registry.histogram(
+    "legals_persistence_batch_rows",
+    "Rows per legal query write batch",
+    buckets=(1, 5, 10, 25, 50, 100, 250, 500, 1000)
+)
+PERSISTENCE_LAG_SECONDS = registry.histogram(
+    "legals_persistence_lag_seconds",
+    "Time from a completed query entering the write-behind queue until its batch committed"
+)
+PERSISTENCE_QUEUE_DEPTH = registry.gauge(
+    "legals_persistence_queue_depth",
+    "Legal queries accepted by the write-behind queue and not yet written"
+)
+STORED_QUERY_LOOKUPS_TOTAL = registry.counter(
+    "legals_stored_query_lookups_total",
+    "GET /legal/query/{query_id} lookups by result: hit (cache), miss (database) or not_found",
+    ("result",)
+)
+PERSISTENCE_ROWS_TOTAL = registry.counter(
+    "legals_persistence_rows_total",
+    "Legal query rows handled by the write-behind queue by outcome",
+    ("outcome",)
+)
@@ -1,30 +1,99 @@
 """
 Database configuration for PostgreSQL
+Async engine (asyncpg) for the API; sync engine (psycopg2) for the write-behind queue thread and scripts
 """
+from typing import Any, AsyncIterator, Dict, Optional
+
 from sqlalchemy import create_engine
+from sqlalchemy.engine import Engine
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, async_sessionmaker, create_async_engine
 from sqlalchemy.ext.declarative import declarative_base
-from sqlalchemy.orm import sessionmaker
+from sqlalchemy.orm import Session, sessionmaker
 from app.core.config import settings
 
-# Create SQLAlchemy engine
-engine = create_engine(
-    settings.SQLALCHEMY_DATABASE_URI,
-    pool_pre_ping=True,
-    pool_recycle=300,
-    echo=False  # Set to True for SQL debugging
-)
+_engine: Optional[Engine] = None
+_async_engine: Optional[AsyncEngine] = None
+
+
+def pool_options() -> Dict[str, Any]:
+    """Connection pool arguments shared by both engines, from Settings"""
+    return {
+        "pool_size": settings.POSTGRES_POOL_SIZE,
+        "max_overflow": settings.POSTGRES_MAX_OVERFLOW,
+        "pool_timeout": settings.POSTGRES_POOL_TIMEOUT,
+        "pool_recycle": settings.POSTGRES_POOL_RECYCLE,
+        "pool_pre_ping": True,
+        "echo": False  # Set to True for SQL debugging
+    }
+
+
+def get_engine() -> Engine:
+    """Process-wide SQLAlchemy engine, created on first use so the models import without a driver"""
+    global _engine
+    if _engine is None:
+        _engine = create_engine(settings.SQLALCHEMY_DATABASE_URI, **pool_options())
+    return _engine
+
+
+def get_async_engine() -> AsyncEngine:
+    """Process-wide async engine used by the API routes, created on first use"""
+    global _async_engine
+    if _async_engine is None:
+        _async_engine = create_async_engine(settings.SQLALCHEMY_ASYNC_DATABASE_URI, **pool_options())
+    return _async_engine
+
+
+async def dispose_async_engine():
+    """Close pooled connections at shutdown"""
+    global _async_engine
+    if _async_engine is not None:
+        await _async_engine.dispose()
+        _async_engine = None
 
-# Create SessionLocal class
-SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+
+# Create SessionLocal class; bound to the engine when a session is opened
+SessionLocal = sessionmaker(autocommit=False, autoflush=False)
+# Loaded rows stay readable after commit without another round trip
+AsyncSessionLocal = async_sessionmaker(autocommit=False, autoflush=False, expire_on_commit=False)
 
 # Create Base class for models
 Base = declarative_base()
 
 
-def get_db():
-    """Dependency to get database session"""
-    db = SessionLocal()
+async def get_db() -> AsyncIterator[AsyncSession]:
+    """Dependency to get an async database session"""
+    async with AsyncSessionLocal(bind=get_async_engine()) as db:
+        yield db
+
+
+def get_sync_db():
+    """Sync database session, for scripts and code running outside the event loop"""
+    db = SessionLocal(bind=get_engine())
     try:
         yield db
     finally:
-        db.close()
\ No newline at end of file
+        db.close()
+
+
+def dialect_insert(bind, table):
+    """
+    INSERT for the bind's dialect (engine, connection or session), with
+    on_conflict_do_nothing / on_conflict_do_update on PostgreSQL and SQLite
+    """
+    if isinstance(bind, (Session, AsyncSession)):
+        bind = bind.get_bind()
+    dialect = bind.dialect.name
+    if dialect == "postgresql":
+        from sqlalchemy.dialects.postgresql import insert
+    elif dialect == "sqlite":
+        from sqlalchemy.dialects.sqlite import insert
+    else:
+        raise NotImplementedError(f"Upserts are not supported on {dialect}")
+    return insert(table)
+
+
+def __getattr__(name: str):
+    # Backward compatible global: `from app.models.database import engine`
+    if name == "engine":
+        return get_engine()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
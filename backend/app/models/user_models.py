@@ -1,11 +1,17 @@
 """
 User and session related database models
 """
-from sqlalchemy import Column, Integer, String, DateTime, Text, Float, Boolean, ForeignKey
+from sqlalchemy import (
+    JSON, Column, Integer, String, Date, DateTime, Text, Float, Boolean, ForeignKey, Index, UniqueConstraint
+)
+from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
 from .database import Base
 
+# JSONB on PostgreSQL (GIN indexable, @> containment); plain JSON elsewhere, e.g. SQLite in tests
+JSONDocument = JSONB().with_variant(JSON(), "sqlite")
+
 
 class User(Base):
     """User model for storing user information"""
@@ -33,8 +39,8 @@ class LegalQuery(Base):
     language = Column(String, default="en")
     
     # Processing results
-    extracted_entities = Column(Text)  # JSON string
-    applicable_laws = Column(Text)     # JSON string  
+    extracted_entities = Column(JSONDocument)  # {"objects": ["gold chain"], ...}
+    applicable_laws = Column(JSONDocument)     # [{"section": "BNS-303", ...}, ...]
     legal_advice = Column(Text)
     confidence_score = Column(Float)
     
@@ -45,6 +51,33 @@ class LegalQuery(Base):
     
     # Relationships
     user = relationship("User", back_populates="queries")
+    sections = relationship("QuerySection", back_populates="query", cascade="all, delete-orphan")
+    
+    __table_args__ = (
+        # User history pages: WHERE user_id = ? AND (created_at, id) < (?, ?) ORDER BY created_at DESC, id DESC
+        Index("ix_legal_queries_user_created_id", user_id, created_at, id),
+        # jsonb_path_ops: smaller and faster than the default opclass, and @> is the only operator used
+        Index("ix_legal_queries_entities_gin", extracted_entities,
+              postgresql_using="gin", postgresql_ops={"extracted_entities": "jsonb_path_ops"}),
+        Index("ix_legal_queries_laws_gin", applicable_laws,
+              postgresql_using="gin", postgresql_ops={"applicable_laws": "jsonb_path_ops"}),
+    )
+
+
+class QuerySection(Base):
+    """One row per section a stored query cites, for section lookups without reading the JSON"""
+    __tablename__ = "query_sections"
+    
+    query_id = Column(String, ForeignKey("legal_queries.query_id", ondelete="CASCADE"), primary_key=True)
+    section_number = Column(String, primary_key=True)  # e.g. "BNS-303"
+    # Copied from legal_queries so section + date range lookups are answered by one index
+    created_at = Column(DateTime(timezone=True), nullable=False)
+    
+    query = relationship("LegalQuery", back_populates="sections")
+    
+    __table_args__ = (
+        Index("ix_query_sections_section_created", "section_number", "created_at"),
+    )
 
 
 class QuerySession(Base):
@@ -62,4 +95,25 @@ class QuerySession(Base):
     
     # Session metadata
     queries_count = Column(Integer, default=0)
-    language_preference = Column(String, default="en")
\ No newline at end of file
+    language_preference = Column(String, default="en")
+
+
+class QueryDailyStats(Base):
+    """
+    Daily rollup of legal_queries per language, kept up to date as queries are stored.
+    The row with section_number "" counts every query; the others count queries citing that section.
+    """
+    __tablename__ = "query_daily_stats"
+    __table_args__ = (UniqueConstraint("day", "language", "section_number", name="uq_query_daily_stats_key"),)
+    
+    id = Column(Integer, primary_key=True)
+    day = Column(Date, nullable=False, index=True)  # UTC date of created_at
+    language = Column(String, nullable=False)
+    section_number = Column(String, nullable=False, default="")
+    
+    query_count = Column(Integer, nullable=False, default=0)
+    verified_count = Column(Integer, nullable=False, default=0)
+    # AVG(confidence_score) = confidence_sum / confidence_count, skipping NULL scores like AVG does
+    confidence_sum = Column(Float, nullable=False, default=0.0)
+    confidence_count = Column(Integer, nullable=False, default=0)
+    processing_time_sum = Column(Float, nullable=False, default=0.0)
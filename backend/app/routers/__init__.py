@@ -5,10 +5,12 @@ from fastapi import APIRouter
 
 from .legal_query import router as legal_router
 from .health import router as health_router
+from .admin import router as admin_router
 
 # Main API router
 api_router = APIRouter()
 
 # Include sub-routers
 api_router.include_router(health_router, prefix="/health", tags=["health"])
-api_router.include_router(legal_router, prefix="/legal", tags=["legal"])
\ No newline at end of file
+api_router.include_router(legal_router, prefix="/legal", tags=["legal"])
+api_router.include_router(admin_router, prefix="/admin", tags=["admin"])
\ No newline at end of file
@@ -0,0 +1,76 @@
+"""
+Administrative endpoints for cache and knowledge graph maintenance and query statistics
+"""
+import hmac
+from datetime import date
+from fastapi import APIRouter, Depends, Header, HTTPException, Query
+from sqlalchemy.ext.asyncio import AsyncSession
+from typing import Optional
+
+from app.core.config import settings
+from ..models.database import get_db
+from ..services.database_service import database_service
+from ..services.neo4j_service import get_neo4j_service
+from ..services.legal_processing_service import get_legal_processor
+
+router = APIRouter()
+
+
+def _check_admin_key(x_admin_key: Optional[str]):
+    """Reject the call unless it carries the configured admin key; without ADMIN_API_KEY every call is rejected"""
+    if not settings.ADMIN_API_KEY:
+        raise HTTPException(status_code=403, detail="Admin endpoints are disabled, set ADMIN_API_KEY to enable them")
+    if not x_admin_key or not hmac.compare_digest(x_admin_key.encode(), settings.ADMIN_API_KEY.encode()):
+        raise HTTPException(status_code=403, detail="Invalid admin key")
+
+
+@router.get("/catalog")
+async def get_catalog_status(x_admin_key: Optional[str] = Header(None)):
+    """Status of the in-memory section catalogue"""
+    _check_admin_key(x_admin_key)
+    return get_neo4j_service().catalog.stats()
+
+
+@router.post("/catalog/refresh")
+async def refresh_catalog(x_admin_key: Optional[str] = Header(None)):
+    """Reload the section catalogue after re-importing the knowledge graph"""
+    _check_admin_key(x_admin_key)
+    get_neo4j_service().catalog.invalidate()
+    # Cached answers were built from the old catalogue
+    get_legal_processor().cache.clear()
+    return await get_neo4j_service().refresh_catalog_async()
+
+
+@router.get("/cache")
+async def get_cache_status(x_admin_key: Optional[str] = Header(None)):
+    """Hit/miss counters of the legal query response cache"""
+    _check_admin_key(x_admin_key)
+    return get_legal_processor().cache.stats()
+
+
+@router.post("/cache/clear")
+async def clear_cache(x_admin_key: Optional[str] = Header(None)):
+    """Drop every cached legal query response"""
+    _check_admin_key(x_admin_key)
+    get_legal_processor().cache.clear()
+    return get_legal_processor().cache.stats()
+
+
+@router.get("/statistics")
+async def get_query_statistics(
+    start: Optional[date] = Query(None, description="First UTC day included"),
+    end: Optional[date] = Query(None, description="Last UTC day included"),
+    top_sections: int = Query(20, ge=1, le=500),
+    x_admin_key: Optional[str] = Header(None),
+    db: AsyncSession = Depends(get_db)
+):
+    """Stored query totals with per-day, per-language and per-section breakdowns"""
+    _check_admin_key(x_admin_key)
+    return await database_service.get_statistics_summary_async(db, start, end, top_sections)
+
+
+@router.post("/statistics/rebuild")
+async def rebuild_query_statistics(x_admin_key: Optional[str] = Header(None), db: AsyncSession = Depends(get_db)):
+    """Recompute the daily statistics rollup from legal_queries"""
+    _check_admin_key(x_admin_key)
+    return {"rollup_rows": await database_service.rebuild_query_statistics_async(db)}
@@ -2,8 +2,11 @@
 Health check endpoints
 """
 from fastapi import APIRouter
+from fastapi.responses import JSONResponse
 from datetime import datetime
 
+from ..services.health_monitor import health_monitor
+
 router = APIRouter()
 
 
@@ -19,14 +22,31 @@ async def health_check():
 
 @router.get("/detailed")
 async def detailed_health_check():
-    """Detailed health check including dependencies"""
+    """Detailed health check including dependencies (from the last background ping)"""
+    snapshot = health_monitor.snapshot()
     return {
-        "status": "healthy",
+        "status": snapshot["status"],
         "timestamp": datetime.utcnow().isoformat(),
         "service": "LEGALS Backend",
-        "dependencies": {
-            "postgres": "checking...",
-            "neo4j": "checking...",
-            "ollama": "checking..."
-        }
-    }
\ No newline at end of file
+        "checked_at": snapshot["checked_at"],
+        "dependencies": snapshot["services"],
+        "startup": health_monitor.startup
+    }
+
+
+@router.get("/live")
+async def liveness_check():
+    """Liveness: the process is serving requests; dependencies are not consulted"""
+    return {"status": "alive"}
+
+
+@router.get("/ready")
+async def readiness_check():
+    """Readiness: first dependency check finished and required services are up"""
+    snapshot = health_monitor.snapshot()
+    body = {
+        "status": "ready" if snapshot["ready"] else "not_ready",
+        "checked_at": snapshot["checked_at"],
+        "services": {name: service["status"] for name, service in snapshot["services"].items()}
+    }
+    return JSONResponse(body, status_code=200 if snapshot["ready"] else 503)
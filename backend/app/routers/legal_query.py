@@ -1,13 +1,20 @@
 """
 Legal query processing endpoints - Integrated with trained SLM
 """
-from fastapi import APIRouter, HTTPException, Depends, BackgroundTasks
-from pydantic import BaseModel, Field
+from fastapi import APIRouter, HTTPException, Depends, BackgroundTasks, Query
+from fastapi.responses import StreamingResponse
+from pydantic import BaseModel, Field, ValidationError
+from sqlalchemy.ext.asyncio import AsyncSession
 from typing import Optional, List, Dict, Any
 from datetime import datetime
+import json
 import logging
+import time
 
-from ..services.legal_processing_service import legal_processor
+from app.core.config import settings
+from ..models.database import get_db
+from ..services.database_service import database_service
+from ..services.legal_processing_service import get_legal_processor
 
 logger = logging.getLogger(__name__)
 router = APIRouter()
@@ -36,6 +43,49 @@ class LegalQueryResponse(BaseModel):
     system_info: Optional[Dict[str, str]] = None
 
 
+class LegalQueryBatchRequest(BaseModel):
+    """Batch of legal queries, validated item by item so one bad entry does not reject the rest"""
+    queries: List[Dict[str, Any]] = Field(
+        ..., min_length=1, max_length=settings.MAX_BATCH_SIZE,
+        description="Items with the LegalQueryRequest fields: query, language, user_id"
+    )
+
+
+class LegalQueryBatchItem(BaseModel):
+    """Outcome of one batch item"""
+    index: int
+    status: str  # "success" or "failed"
+    result: Optional[LegalQueryResponse] = None
+    error: Optional[str] = None
+
+
+class LegalQueryBatchResponse(BaseModel):
+    """Batch query response model"""
+    results: List[LegalQueryBatchItem]
+    total: int
+    succeeded: int
+    failed: int
+    processing_time: float
+
+
+def _build_query_response(result: Dict[str, Any]) -> LegalQueryResponse:
+    """Convert a pipeline result to the response model"""
+    return LegalQueryResponse(
+        query_id=result["query_id"],
+        query=result["query"],
+        language=result["language"],
+        entities=result["entities"],
+        applicable_laws=result["applicable_laws"],
+        legal_advice=result["legal_advice"],
+        confidence_score=result["confidence_score"],
+        processing_time=result["processing_time"],
+        timestamp=result["timestamp"],
+        verified=result.get("verified", False),
+        disclaimers=result["disclaimers"],
+        system_info=result.get("system_info")
+    )
+
+
 @router.post("/query", response_model=LegalQueryResponse)
 async def process_legal_query(request: LegalQueryRequest):
     """
@@ -48,8 +98,8 @@ async def process_legal_query(request: LegalQueryRequest):
     try:
         logger.info(f"Processing legal query: {request.query[:100]}...")
         
-        # Process through integrated SLM pipeline
-        result = legal_processor.process_legal_query(
+        # Process through integrated SLM pipeline without blocking the event loop
+        result = await get_legal_processor().process_legal_query_async(
             query=request.query,
             language=request.language,
             user_id=request.user_id
@@ -64,20 +114,7 @@ async def process_legal_query(request: LegalQueryRequest):
             )
         
         # Convert to response model
-        response = LegalQueryResponse(
-            query_id=result["query_id"],
-            query=result["query"],
-            language=result["language"],
-            entities=result["entities"],
-            applicable_laws=result["applicable_laws"],
-            legal_advice=result["legal_advice"],
-            confidence_score=result["confidence_score"],
-            processing_time=result["processing_time"],
-            timestamp=result["timestamp"],
-            verified=result.get("verified", False),
-            disclaimers=result["disclaimers"],
-            system_info=result.get("system_info")
-        )
+        response = _build_query_response(result)
         
         logger.info(f"Query processed successfully: {result['query_id']}")
         return response
@@ -92,17 +129,104 @@ async def process_legal_query(request: LegalQueryRequest):
         )
 
 
-@router.get("/query/{query_id}")
-async def get_query_result(query_id: str):
-    """Get results of a previously processed query"""
+@router.post("/query/stream")
+async def stream_legal_query(request: LegalQueryRequest):
+    """
+    Process a legal query and stream the result as Server-Sent Events:
+    - analysis: entities and applicable laws, sent as soon as legal reasoning is done
+    - token: chunks of the legal advice as they are generated
+    - done: query_id, full advice, disclaimers and timings
+    - error: processing failed
+    """
+    logger.info(f"Streaming legal query: {request.query[:100]}...")
+
+    async def event_stream():
+        async for event, data in get_legal_processor().stream_legal_query(
+            query=request.query,
+            language=request.language,
+            user_id=request.user_id
+        ):
+            yield f"event: {event}\ndata: {json.dumps(data, ensure_ascii=False)}\n\n"
+
+    return StreamingResponse(
+        event_stream(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+    )
+
+
+@router.post("/query/batch", response_model=LegalQueryBatchResponse)
+async def process_legal_query_batch(request: LegalQueryBatchRequest):
+    """
+    Process a batch of legal queries in one call.
+    Rules are evaluated for the whole batch and Neo4j is queried once; every item
+    reports its own success or failure.
+    """
+    start_time = time.time()
+    items: List[Optional[LegalQueryBatchItem]] = [None] * len(request.queries)
+    valid = []
+
+    for index, raw_item in enumerate(request.queries):
+        try:
+            valid.append((index, LegalQueryRequest.model_validate(raw_item)))
+        except ValidationError as e:
+            errors = "; ".join(f"{'.'.join(str(loc) for loc in err['loc'])}: {err['msg']}" for err in e.errors())
+            items[index] = LegalQueryBatchItem(index=index, status="failed", error=f"Invalid query: {errors}")
+
     try:
-        # This would retrieve from database when implemented
-        return {
-            "message": f"Query {query_id} retrieval not yet implemented",
-            "status": "pending_database_integration"
-        }
+        logger.info(f"Processing batch of {len(request.queries)} legal queries ({len(valid)} valid)")
+        results = await get_legal_processor().process_legal_query_batch_async([
+            {"query": item.query, "language": item.language, "user_id": item.user_id}
+            for _, item in valid
+        ])
     except Exception as e:
+        logger.error(f"Unexpected error processing query batch: {e}")
+        raise HTTPException(
+            status_code=500,
+            detail="Internal server error during batch legal query processing"
+        )
+
+    for (index, _), result in zip(valid, results):
+        if "error" in result:
+            items[index] = LegalQueryBatchItem(index=index, status="failed", error=f"Legal processing failed: {result['error']}")
+            continue
+        try:
+            items[index] = LegalQueryBatchItem(index=index, status="success", result=_build_query_response(result))
+        except Exception as e:
+            logger.error(f"Batch item {index} could not be converted: {e}")
+            items[index] = LegalQueryBatchItem(index=index, status="failed", error="Invalid processing result")
+
+    succeeded = sum(1 for item in items if item.status == "success")
+    return LegalQueryBatchResponse(
+        results=items,
+        total=len(items),
+        succeeded=succeeded,
+        failed=len(items) - succeeded,
+        processing_time=time.time() - start_time
+    )
+
+
+@router.get("/query/{query_id}")
+async def get_query_result(query_id: str, db: AsyncSession = Depends(get_db)):
+    """Get results of a previously processed query"""
+    record = await database_service.get_stored_query_async(db, query_id)
+    if record is None:
         raise HTTPException(status_code=404, detail=f"Query {query_id} not found")
+    return record
+
+
+@router.get("/history/{user_id}")
+async def get_query_history(
+    user_id: str,
+    limit: int = Query(settings.HISTORY_PAGE_SIZE, ge=1, le=100),
+    cursor: Optional[str] = Query(None, description="next_cursor of the previous page"),
+    db: AsyncSession = Depends(get_db)
+):
+    """A user's stored queries, newest first, one page at a time"""
+    try:
+        return await database_service.get_user_query_page_async(db, user_id, limit, cursor)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
 
 
 @router.get("/supported-laws")
@@ -139,7 +263,7 @@ async def extract_entities_only(request: Dict[str, Any]):
             raise HTTPException(status_code=400, detail="Query must be at least 10 characters long")
         
         # Extract entities using SLM
-        entities = legal_processor.ollama.extract_entities(query, language)
+        entities = get_legal_processor().ollama.extract_entities(query, language)
         
         return {
             "query": query,
@@ -157,7 +281,7 @@ async def extract_entities_only(request: Dict[str, Any]):
 async def get_system_status():
     """Get status of integrated legal processing system"""
     try:
-        status = legal_processor.get_system_status()
+        status = get_legal_processor().get_system_status()
         return status
     except Exception as e:
         return {
@@ -0,0 +1,159 @@
+"""
+Indian Amount Parser
+Finds money amounts in incident descriptions: digit groupings (50,000 / 1,00,000), k/thousand/lakh/crore
+multipliers, English and Hindi number words, and rupee markers, with their spans in the text
+"""
+import re
+from decimal import Decimal, ROUND_HALF_UP
+from functools import lru_cache
+from typing import NamedTuple, Optional, Tuple
+
+
+class AmountMention(NamedTuple):
+    """One amount in the text; spans index into text.lower()"""
+    start: int
+    end: int
+    text: str
+    value: int
+    currency: bool          # a rupee marker (Rs., INR, ₹, rupees, रुपये, /-) is attached
+    multiplier: Optional[str]  # normalised multiplier word, e.g. "lakh"
+    cued: bool              # preceded by worth / value / cost / price / कीमत ...
+
+    @property
+    def is_money(self) -> bool:
+        """Reads as a sum of money rather than a count, model number or time"""
+        return self.currency or self.multiplier is not None or self.cued
+
+
+MULTIPLIERS = {
+    "k": 1_000, "thousand": 1_000, "हज़ार": 1_000, "हजार": 1_000,
+    "lakh": 100_000, "lakhs": 100_000, "lac": 100_000, "lacs": 100_000, "लाख": 100_000,
+    "crore": 10_000_000, "crores": 10_000_000, "cr": 10_000_000, "करोड़": 10_000_000, "करोड": 10_000_000,
+    "million": 1_000_000, "mn": 1_000_000,
+}
+MULTIPLIER_NAMES = {
+    "thousand": "thousand", "हज़ार": "thousand", "हजार": "thousand", "k": "thousand",
+    "lakhs": "lakh", "lac": "lakh", "lacs": "lakh", "लाख": "lakh",
+    "crores": "crore", "cr": "crore", "करोड़": "crore", "करोड": "crore", "mn": "million",
+}
+
+NUMBER_WORDS = {
+    "a": 1, "an": 1, "one": 1, "two": 2, "three": 3, "four": 4, "five": 5, "six": 6, "seven": 7,
+    "eight": 8, "nine": 9, "ten": 10, "eleven": 11, "twelve": 12, "thirteen": 13, "fourteen": 14,
+    "fifteen": 15, "sixteen": 16, "seventeen": 17, "eighteen": 18, "nineteen": 19, "twenty": 20,
+    "thirty": 30, "forty": 40, "fifty": 50, "sixty": 60, "seventy": 70, "eighty": 80, "ninety": 90,
+    "एक": 1, "दो": 2, "तीन": 3, "चार": 4, "पांच": 5, "पाँच": 5, "छह": 6, "सात": 7, "आठ": 8, "नौ": 9,
+    "दस": 10, "बीस": 20, "तीस": 30, "चालीस": 40, "पचास": 50,
+}
+HUNDRED_WORDS = {"hundred", "सौ"}
+
+CURRENCY_PREFIX = r"(?:rs\.?|inr|₹|rupees?|रु\.?|रुपये|रुपए)"
+CURRENCY_SUFFIX = r"(?:rupees?|rs\.?|inr|₹|/-|रुपये|रुपए|रुपया|रु\.?)"
+_MULTIPLIER = "|".join(sorted((re.escape(word) for word in MULTIPLIERS), key=len, reverse=True))
+_NUMBER_WORD = "|".join(sorted((re.escape(word) for word in list(NUMBER_WORDS) + list(HUNDRED_WORDS)),
+                               key=len, reverse=True))
+
+# Built once per process. Matching starts only at a digit run or, when the text has a multiplier or
+# rupee word, at a number word; the rupee prefix is then looked for just before that anchor. Number
+# words only count when a multiplier or rupee marker follows, so "one person" or "a phone" never read
+# as amounts, and a trailing Latin letter ends the match so "s23" or "80kg" are not amounts either.
+DIGIT_ANCHOR_PATTERN = re.compile(r"\d+")
+WORD_ANCHOR_PATTERN = re.compile(rf"(?<!\w)(?:{_NUMBER_WORD})(?!\w)")
+AMOUNT_PATTERN = re.compile(
+    rf"(?:"
+    rf"(?P<digits>(?:\d{{1,3}}(?:,\d{{2,3}})+(?!\d)|\d+)(?:\.\d+)?)"
+    rf"|(?P<words>(?:{_NUMBER_WORD})(?:[\s-]+(?:{_NUMBER_WORD}))*"
+    rf"(?=[\s-]+(?:{_MULTIPLIER}|{CURRENCY_SUFFIX})(?![a-z])))"
+    rf")"
+    rf"(?:[\s-]*(?P<multiplier>{_MULTIPLIER})(?![a-z]))?"
+    rf"(?:\s*(?P<suffix>{CURRENCY_SUFFIX})(?![a-z]))?"
+    rf"(?![a-z\d])"
+)
+CURRENCY_PREFIX_PATTERN = re.compile(rf"(?<!\w){CURRENCY_PREFIX}\s*$")
+PREFIX_WINDOW = 12  # longest prefix ("rupees" / "रुपये") plus spacing
+
+# Substring checks run at C speed, so texts without amounts cost a few microseconds
+DIGITS = "0123456789०१२३४५६७८९"
+# Number words pair with the multipliers and rupee markers below; k, cr, mn and rs follow digits only,
+# being too common inside ordinary words ("years", "place") to justify the number word scan
+WORD_HINTS = ("thousand", "lakh", " lac", "-lac", "crore", "million", "rupee", "हज़ार", "हजार", "लाख", "करोड",
+              "रुप", "₹", "inr", "/-")
+VALUE_CUE_PATTERN = re.compile(r"(?:worth|valued?|cost(?:ing|s)?|price[ds]?|amount|कीमत|क़ीमत|मूल्य)\W*(?:\w+\W+){0,4}$")
+CUE_WINDOW = 40  # characters before an amount searched for a value cue
+
+
+def _word_value(words: str) -> Optional[int]:
+    """'twenty five' -> 25, 'two hundred' -> 200, 'पांच' -> 5"""
+    value = 0
+    for word in re.split(r"[\s-]+", words):
+        if word in HUNDRED_WORDS:
+            value = (value or 1) * 100
+        elif word in NUMBER_WORDS:
+            value += NUMBER_WORDS[word]
+        else:
+            return None
+    return value or None
+
+
+@lru_cache(maxsize=2048)
+def extract_amounts(text: str) -> Tuple[AmountMention, ...]:
+    """
+    Every amount in the text, in order of appearance
+
+    Memoised per text, so the extraction and reasoning steps of one query share a single parse.
+    """
+    lowered = text.lower()
+    has_digits = any(digit in lowered for digit in DIGITS)
+    has_words = any(hint in lowered for hint in WORD_HINTS)
+    if not has_digits and not has_words:
+        return ()
+
+    anchors = [match.start() for match in DIGIT_ANCHOR_PATTERN.finditer(lowered)] if has_digits else []
+    if has_words:
+        anchors = sorted(anchors + [match.start() for match in WORD_ANCHOR_PATTERN.finditer(lowered)])
+
+    mentions = []
+    last_end = 0
+    for anchor in anchors:
+        if anchor < last_end:
+            continue  # inside the previous amount, e.g. the "00" of "1,00,000"
+        match = AMOUNT_PATTERN.match(lowered, anchor)
+        if not match:
+            continue
+
+        prefix = CURRENCY_PREFIX_PATTERN.search(lowered, max(last_end, anchor - PREFIX_WINDOW), anchor)
+        if prefix:
+            start = prefix.start()
+        elif anchor and (lowered[anchor - 1].isalnum() or lowered[anchor - 1] in "_.,"):
+            continue  # part of a model name, decimal or list such as "s23" or "1.5.2"
+        else:
+            start = anchor
+
+        if match.group("digits"):
+            number = Decimal(match.group("digits").replace(",", ""))  # exact, however long
+        else:
+            number = _word_value(match.group("words"))
+            if number is None or not (match.group("multiplier") or match.group("suffix")):
+                continue
+
+        multiplier = match.group("multiplier")
+        if multiplier:
+            number *= MULTIPLIERS[multiplier]
+
+        end = match.end()
+        last_end = end
+        mentions.append(AmountMention(
+            start=start,
+            end=end,
+            text=text[start:end] if len(text) == len(lowered) else lowered[start:end],
+            value=int(Decimal(number).to_integral_value(ROUND_HALF_UP)),
+            currency=bool(prefix or match.group("suffix")),
+            multiplier=MULTIPLIER_NAMES.get(multiplier, multiplier),
+            cued=bool(VALUE_CUE_PATTERN.search(lowered, max(0, start - CUE_WINDOW), start))
+        ))
+    return tuple(mentions)
+
+
+def money_amounts(text: str) -> Tuple[AmountMention, ...]:
+    """Amounts that read as sums of money"""
+    return tuple(mention for mention in extract_amounts(text) if mention.is_money)
@@ -0,0 +1,113 @@
+"""
+PostgreSQL Schema Upgrade
+Creates missing tables and indexes, converts the JSON text columns of legal_queries to JSONB
+and backfills query_sections and the statistics rollup from existing rows
+"""
+import logging
+import time
+from typing import Any, Dict, List
+
+from sqlalchemy import inspect, select, text
+from sqlalchemy.orm import Session
+
+from app.models.database import Base, dialect_insert
+from app.models.user_models import LegalQuery, QuerySection
+from app.services.query_statistics import cited_sections, query_statistics
+
+logger = logging.getLogger(__name__)
+
+# Columns that held json.dumps strings before they became JSONB
+JSONB_COLUMNS = [("legal_queries", "extracted_entities"), ("legal_queries", "applicable_laws")]
+BACKFILL_BATCH_SIZE = 1000  # legal_queries rows per query_sections insert
+
+
+def _convert_to_jsonb(connection, table: str, column: str) -> bool:
+    """ALTER a text column to JSONB in place; False when it already is JSONB"""
+    data_type = connection.execute(text(
+        "SELECT data_type FROM information_schema.columns WHERE table_name = :table AND column_name = :column"
+    ), {"table": table, "column": column}).scalar()
+    if data_type != "text":
+        return False
+    # Empty strings were never valid JSON; store them as NULL
+    connection.execute(text(
+        f"ALTER TABLE {table} ALTER COLUMN {column} TYPE jsonb USING NULLIF({column}, '')::jsonb"
+    ))
+    return True
+
+
+def _create_indexes(connection) -> List[str]:
+    """Indexes declared on the models but missing from the database, e.g. added to an existing table"""
+    inspector = inspect(connection)
+    existing_tables = set(inspector.get_table_names())
+    created = []
+    for table in Base.metadata.sorted_tables:
+        if table.name not in existing_tables:
+            continue
+        existing = {index["name"] for index in inspector.get_indexes(table.name)}
+        for index in table.indexes:
+            if index.name not in existing:
+                index.create(connection)
+                created.append(index.name)
+    return created
+
+
+def backfill_query_sections(session: Session, batch_size: int = BACKFILL_BATCH_SIZE) -> int:
+    """
+    query_sections rows for every stored query; rows already present are skipped
+
+    Returns:
+        Number of (query, section) pairs sent
+    """
+    table = QuerySection.__table__
+    statement = dialect_insert(session, table).on_conflict_do_nothing(index_elements=["query_id", "section_number"])
+    result = session.execute(
+        select(LegalQuery.query_id, LegalQuery.applicable_laws, LegalQuery.created_at)
+        .execution_options(yield_per=batch_size)
+    )
+    pairs = 0
+    for chunk in result.partitions():
+        rows = [
+            {"query_id": query_id, "section_number": section, "created_at": created_at}
+            for query_id, applicable_laws, created_at in chunk
+            for section in cited_sections(applicable_laws)
+        ]
+        if rows:
+            session.execute(statement, rows)
+            pairs += len(rows)
+    session.commit()
+    return pairs
+
+
+def upgrade_schema(engine, backfill: bool = True) -> Dict[str, Any]:
+    """
+    Bring the database up to the models; safe to re-run
+
+    Args:
+        engine: SQLAlchemy engine on the LEGALS database
+        backfill: Also fill query_sections and rebuild the statistics rollup from legal_queries
+
+    Returns:
+        Created tables and indexes, converted columns, backfilled rows and timings
+    """
+    start = time.perf_counter()
+    report: Dict[str, Any] = {"tables": [], "indexes": [], "jsonb_columns": []}
+
+    with engine.begin() as connection:
+        existing = set(inspect(connection).get_table_names())
+        Base.metadata.create_all(connection)  # new tables come with their indexes
+        report["tables"] = [table.name for table in Base.metadata.sorted_tables if table.name not in existing]
+
+        if connection.dialect.name == "postgresql":
+            report["jsonb_columns"] = [
+                f"{table}.{column}" for table, column in JSONB_COLUMNS if _convert_to_jsonb(connection, table, column)
+            ]
+        report["indexes"] = _create_indexes(connection)
+
+    if backfill:
+        with Session(engine) as session:
+            report["query_sections"] = backfill_query_sections(session)
+            report["rollup_rows"] = query_statistics.rebuild(session)
+
+    report["seconds"] = round(time.perf_counter() - start, 3)
+    logger.info(f"Database schema upgraded: {report}")
+    return report
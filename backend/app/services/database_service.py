@@ -1,14 +1,63 @@
 """
 Database service for PostgreSQL operations
+
+Each read or write used by the API has an `_async` sibling taking an AsyncSession, so routes
+await the database instead of blocking the event loop. Simple reads are native async
+queries; multi-statement work reuses the sync implementation through AsyncSession.run_sync,
+which runs it on the async connection without a worker thread.
 """
+from sqlalchemy import exists, func, insert, select, tuple_
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
-from typing import List, Optional, Dict, Any
-from datetime import datetime
-import json
+from typing import List, Optional, Dict, Any, Tuple
+from datetime import date, datetime
+import base64
+import binascii
 import uuid
 
-from app.models.database import get_db
-from app.models.user_models import User, LegalQuery, QuerySession
+from app.models.database import dialect_insert, get_db
+from app.models.user_models import User, LegalQuery, QuerySection, QuerySession
+from app.services.persistence_queue import legal_query_row
+from app.services.query_statistics import cited_sections, query_statistics
+from app.services.stored_query_cache import stored_query_cache, stored_query_record
+
+
+def encode_history_cursor(query: LegalQuery) -> str:
+    """Opaque cursor pointing just past a query in its user's history"""
+    position = f"{query.created_at.isoformat()}|{query.id}"
+    return base64.urlsafe_b64encode(position.encode()).decode().rstrip("=")
+
+
+def decode_history_cursor(cursor: str) -> Tuple[datetime, int]:
+    """(created_at, id) of the last query on the previous page; ValueError for a malformed cursor"""
+    try:
+        position = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4)).decode()
+        created_at, row_id = position.rsplit("|", 1)
+        return datetime.fromisoformat(created_at), int(row_id)
+    except (binascii.Error, UnicodeDecodeError, ValueError) as e:
+        raise ValueError(f"Invalid history cursor: {cursor!r}") from e
+
+
+def _is_postgres(db: Session) -> bool:
+    return db.get_bind().dialect.name == "postgresql"
+
+
+def _entity_condition(db: Session, category: str, value: str):
+    """extracted_entities[category] contains value; JSONB @> (GIN index) on PostgreSQL"""
+    if not category.isidentifier():
+        raise ValueError(f"Invalid entity category: {category!r}")
+    if _is_postgres(db):
+        return LegalQuery.extracted_entities.contains({category: [value]})
+    items = func.json_each(LegalQuery.extracted_entities, f"$.{category}").table_valued("value")
+    return exists().select_from(items).where(items.c.value == value)
+
+
+def _section_condition(db: Session, section_number: str):
+    """applicable_laws cites section_number; JSONB @> (GIN index) on PostgreSQL"""
+    if _is_postgres(db):
+        return LegalQuery.applicable_laws.contains([{"section": section_number}])
+    laws = func.json_each(LegalQuery.applicable_laws).table_valued("value")
+    return exists().select_from(laws).where(func.json_extract(laws.c.value, "$.section") == section_number)
 
 
 class DatabaseService:
@@ -32,6 +81,10 @@ class DatabaseService:
         """Get user by user_id"""
         return db.query(User).filter(User.user_id == user_id).first()
     
+    async def get_user_async(self, db: AsyncSession, user_id: str) -> Optional[User]:
+        """Get user by user_id"""
+        return (await db.execute(select(User).where(User.user_id == user_id).limit(1))).scalars().first()
+    
     def create_query_session(self, db: Session, user_id: str = None) -> QuerySession:
         """Create a new query session"""
         session = QuerySession(
@@ -53,72 +106,259 @@ class DatabaseService:
         legal_advice: str,
         confidence_score: float,
         processing_time: float,
-        user_id: str = None
+        user_id: str = None,
+        query_id: str = None
     ) -> LegalQuery:
-        """Save a legal query and its results"""
+        """Save a legal query and its results synchronously; the pipeline uses persistence_queue instead"""
         
-        query = LegalQuery(
-            query_id=str(uuid.uuid4()),
-            user_id=user_id,
-            query_text=query_text,
-            language=language,
-            extracted_entities=json.dumps(entities),
-            applicable_laws=json.dumps(applicable_laws),
-            legal_advice=legal_advice,
-            confidence_score=confidence_score,
-            processing_time=processing_time
+        row = legal_query_row(
+            query_id or str(uuid.uuid4()), query_text, language, entities, applicable_laws,
+            legal_advice, confidence_score, processing_time, user_id
         )
+        query = LegalQuery(**row)
         
+        self.ensure_users(db, [row])
         db.add(query)
+        db.flush()
+        self.record_stored_queries(db, [row])
         db.commit()
         db.refresh(query)
         return query
     
+    async def save_legal_query_async(self, db: AsyncSession, *args, **kwargs) -> LegalQuery:
+        """save_legal_query on an AsyncSession (same arguments after db)"""
+        return await db.run_sync(lambda session: self.save_legal_query(session, *args, **kwargs))
+    
+    def ensure_users(self, connection, rows: List[Dict[str, Any]]):
+        """
+        Create the users rows referenced by legal_queries rows about to be inserted (connection or session).
+        Clients only send a user_id, so its first stored query registers the user.
+        """
+        user_ids = sorted({row["user_id"] for row in rows if row.get("user_id")})
+        if user_ids:
+            statement = dialect_insert(connection, User.__table__).on_conflict_do_nothing(index_elements=["user_id"])
+            connection.execute(statement, [{"user_id": user_id} for user_id in user_ids])
+    
+    def record_stored_queries(self, connection, rows: List[Dict[str, Any]]):
+        """
+        Index newly inserted legal_queries rows: their query_sections rows and the statistics rollup.
+        Call in the transaction that inserted them (connection or session).
+        """
+        sections = [
+            {"query_id": row["query_id"], "section_number": section, "created_at": row["created_at"]}
+            for row in rows
+            for section in cited_sections(row["applicable_laws"])
+        ]
+        if sections:
+            connection.execute(insert(QuerySection.__table__), sections)
+        query_statistics.record_queries(connection, rows)
+    
+    def get_queries_by_section(
+        self,
+        db: Session,
+        section_number: str,
+        start: Optional[datetime] = None,
+        end: Optional[datetime] = None,
+        limit: int = 100
+    ) -> List[LegalQuery]:
+        """Queries citing a section (e.g. "BNS-308") created in [start, end), newest first"""
+        statement = (
+            select(LegalQuery)
+            .join(QuerySection, QuerySection.query_id == LegalQuery.query_id)
+            .where(QuerySection.section_number == section_number)
+        )
+        if start:
+            statement = statement.where(QuerySection.created_at >= start)
+        if end:
+            statement = statement.where(QuerySection.created_at < end)
+        statement = statement.order_by(QuerySection.created_at.desc()).limit(limit)
+        return list(db.execute(statement).scalars())
+    
+    async def get_queries_by_section_async(self, db: AsyncSession, *args, **kwargs) -> List[LegalQuery]:
+        return await db.run_sync(lambda session: self.get_queries_by_section(session, *args, **kwargs))
+    
+    def count_queries_by_section(
+        self,
+        db: Session,
+        start: Optional[datetime] = None,
+        end: Optional[datetime] = None
+    ) -> Dict[str, int]:
+        """Queries citing each section in [start, end), from query_sections alone"""
+        statement = select(QuerySection.section_number, func.count()).group_by(QuerySection.section_number)
+        if start:
+            statement = statement.where(QuerySection.created_at >= start)
+        if end:
+            statement = statement.where(QuerySection.created_at < end)
+        return {section: count for section, count in db.execute(statement)}
+    
+    async def count_queries_by_section_async(self, db: AsyncSession, *args, **kwargs) -> Dict[str, int]:
+        return await db.run_sync(lambda session: self.count_queries_by_section(session, *args, **kwargs))
+    
+    def get_queries_citing_all(self, db: Session, section_numbers: List[str], limit: int = 100) -> List[LegalQuery]:
+        """Queries whose applicable laws include every given section, newest first"""
+        statement = select(LegalQuery)
+        for section_number in section_numbers:
+            statement = statement.where(_section_condition(db, section_number))
+        statement = statement.order_by(LegalQuery.created_at.desc()).limit(limit)
+        return list(db.execute(statement).scalars())
+    
+    async def get_queries_citing_all_async(self, db: AsyncSession, *args, **kwargs) -> List[LegalQuery]:
+        return await db.run_sync(lambda session: self.get_queries_citing_all(session, *args, **kwargs))
+    
+    def get_queries_by_entity(
+        self,
+        db: Session,
+        category: str,
+        value: str,
+        start: Optional[datetime] = None,
+        end: Optional[datetime] = None,
+        limit: int = 100
+    ) -> List[LegalQuery]:
+        """
+        Queries whose extracted entities include value, e.g. ("objects", "chain"), newest first
+
+        Matches whole entity values as extracted, which is what the GIN index can answer.
+        """
+        statement = select(LegalQuery).where(_entity_condition(db, category, value))
+        if start:
+            statement = statement.where(LegalQuery.created_at >= start)
+        if end:
+            statement = statement.where(LegalQuery.created_at < end)
+        statement = statement.order_by(LegalQuery.created_at.desc()).limit(limit)
+        return list(db.execute(statement).scalars())
+    
+    async def get_queries_by_entity_async(self, db: AsyncSession, *args, **kwargs) -> List[LegalQuery]:
+        return await db.run_sync(lambda session: self.get_queries_by_entity(session, *args, **kwargs))
+    
     def get_query_by_id(self, db: Session, query_id: str) -> Optional[LegalQuery]:
         """Get query by query_id"""
         return db.query(LegalQuery).filter(LegalQuery.query_id == query_id).first()
     
+    async def get_query_by_id_async(self, db: AsyncSession, query_id: str) -> Optional[LegalQuery]:
+        """Get query by query_id"""
+        statement = select(LegalQuery).where(LegalQuery.query_id == query_id).limit(1)
+        return (await db.execute(statement)).scalars().first()
+    
+    def get_stored_query(self, db: Session, query_id: str) -> Optional[Dict[str, Any]]:
+        """API record of a stored query, read through the stored query cache"""
+        def load(missing_id: str) -> Optional[Dict[str, Any]]:
+            query = self.get_query_by_id(db, missing_id)
+            return stored_query_record(query) if query else None
+        
+        return stored_query_cache.get_or_load(query_id, load)
+    
+    async def get_stored_query_async(self, db: AsyncSession, query_id: str) -> Optional[Dict[str, Any]]:
+        """API record of a stored query, read through the stored query cache"""
+        async def load(missing_id: str) -> Optional[Dict[str, Any]]:
+            query = await self.get_query_by_id_async(db, missing_id)
+            return stored_query_record(query) if query else None
+        
+        return await stored_query_cache.get_or_load_async(query_id, load)
+    
     def get_user_queries(self, db: Session, user_id: str, limit: int = 10) -> List[LegalQuery]:
         """Get recent queries for a user"""
-        return (
-            db.query(LegalQuery)
-            .filter(LegalQuery.user_id == user_id)
-            .order_by(LegalQuery.created_at.desc())
-            .limit(limit)
-            .all()
-        )
+        return self._user_history(db, user_id, limit)
+    
+    async def get_user_queries_async(self, db: AsyncSession, user_id: str, limit: int = 10) -> List[LegalQuery]:
+        """Get recent queries for a user"""
+        return list((await db.execute(self._user_history_statement(user_id, limit))).scalars())
+    
+    def get_user_query_page(
+        self,
+        db: Session,
+        user_id: str,
+        limit: int = 20,
+        cursor: Optional[str] = None
+    ) -> Dict[str, Any]:
+        """
+        One page of a user's query history, newest first
+        
+        Keyset pagination on (created_at, id): every page is one range scan of
+        ix_legal_queries_user_created_id however deep it is, unlike OFFSET.
+        
+        Returns:
+            {"items": [...], "next_cursor": cursor for the following page, or None on the last page}
+        """
+        after = decode_history_cursor(cursor) if cursor else None
+        return self._history_page(self._user_history(db, user_id, limit + 1, after), limit)
+    
+    async def get_user_query_page_async(
+        self,
+        db: AsyncSession,
+        user_id: str,
+        limit: int = 20,
+        cursor: Optional[str] = None
+    ) -> Dict[str, Any]:
+        """get_user_query_page on an AsyncSession"""
+        after = decode_history_cursor(cursor) if cursor else None
+        queries = list((await db.execute(self._user_history_statement(user_id, limit + 1, after))).scalars())
+        return self._history_page(queries, limit)
+    
+    def _history_page(self, queries: List[LegalQuery], limit: int) -> Dict[str, Any]:
+        page = queries[:limit]
+        return {
+            "items": [stored_query_record(query) for query in page],
+            "next_cursor": encode_history_cursor(page[-1]) if len(queries) > limit else None
+        }
+    
+    def _user_history(
+        self,
+        db: Session,
+        user_id: str,
+        limit: int,
+        after: Optional[Tuple[datetime, int]] = None
+    ) -> List[LegalQuery]:
+        return list(db.execute(self._user_history_statement(user_id, limit, after)).scalars())
+    
+    def _user_history_statement(self, user_id: str, limit: int, after: Optional[Tuple[datetime, int]] = None):
+        statement = select(LegalQuery).where(LegalQuery.user_id == user_id)
+        if after:
+            statement = statement.where(tuple_(LegalQuery.created_at, LegalQuery.id) < tuple_(*after))
+        return statement.order_by(LegalQuery.created_at.desc(), LegalQuery.id.desc()).limit(limit)
     
     def update_query_verification(self, db: Session, query_id: str, verified: bool) -> bool:
         """Update query verification status"""
         query = self.get_query_by_id(db, query_id)
         if query:
+            query_statistics.record_verification(db, query, verified)
             query.verified = verified
             db.commit()
+            stored_query_cache.invalidate(query_id)
             return True
         return False
     
+    async def update_query_verification_async(self, db: AsyncSession, query_id: str, verified: bool) -> bool:
+        return await db.run_sync(lambda session: self.update_query_verification(session, query_id, verified))
+    
     def get_query_statistics(self, db: Session) -> Dict[str, Any]:
-        """Get query statistics for analytics"""
-        total_queries = db.query(LegalQuery).count()
-        verified_queries = db.query(LegalQuery).filter(LegalQuery.verified == True).count()
-        
-        avg_confidence = (
-            db.query(LegalQuery.confidence_score)
-            .filter(LegalQuery.confidence_score.isnot(None))
-            .all()
-        )
-        
-        if avg_confidence:
-            avg_confidence_score = sum(score[0] for score in avg_confidence) / len(avg_confidence)
-        else:
-            avg_confidence_score = 0.0
-        
-        return {
-            "total_queries": total_queries,
-            "verified_queries": verified_queries,
-            "verification_rate": verified_queries / total_queries if total_queries > 0 else 0,
-            "average_confidence": avg_confidence_score
-        }
+        """Get query statistics for analytics (summed from the daily rollup)"""
+        return query_statistics.overview(db)
+    
+    async def get_query_statistics_async(self, db: AsyncSession) -> Dict[str, Any]:
+        return await db.run_sync(query_statistics.overview)
+    
+    def get_statistics_summary(
+        self,
+        db: Session,
+        start: Optional[date] = None,
+        end: Optional[date] = None,
+        top_sections: int = 20
+    ) -> Dict[str, Any]:
+        """Totals plus per-day, per-language and per-section breakdowns from the daily rollup"""
+        return query_statistics.summary(db, start, end, top_sections)
+    
+    async def get_statistics_summary_async(
+        self,
+        db: AsyncSession,
+        start: Optional[date] = None,
+        end: Optional[date] = None,
+        top_sections: int = 20
+    ) -> Dict[str, Any]:
+        return await db.run_sync(lambda session: query_statistics.summary(session, start, end, top_sections))
+    
+    async def rebuild_query_statistics_async(self, db: AsyncSession) -> int:
+        """Recompute the statistics rollup from legal_queries"""
+        return await db.run_sync(query_statistics.rebuild)
 
 
 # Global database service instance
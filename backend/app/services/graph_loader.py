@@ -0,0 +1,207 @@
+"""
+Bulk Knowledge Graph Loader
+Reads BNS sections from JSON or CSV and writes them to Neo4j in UNWIND batches
+"""
+import csv
+import json
+import logging
+import os
+import re
+import time
+from typing import Any, Callable, Dict, Iterable, List, Optional
+
+from app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+
+# Offence type per section, as assigned by neo4j_import.cypher; anything else is 'other'
+OFFENCE_TYPES = {
+    303: "theft",
+    304: "snatching",
+    305: "dwelling_theft",
+    306: "employee_theft",
+    307: "prepared_theft",
+    308: "extortion",
+    309: "robbery",
+    310: "dacoity",
+    311: "armed_robbery",
+    316: "breach_of_trust",
+    318: "cheating",
+    324: "mischief",
+    329: "criminal_trespass",
+}
+
+# Punishment clause inside a JSON section_text, which has no separate punishment field
+PUNISHMENT_PATTERN = re.compile(r"(?:Punishment:|shall be punished with)\s*(.+)$", re.IGNORECASE | re.DOTALL)
+
+# One statement per step; every write is a MERGE on a constrained key, so reloading is idempotent
+LOAD_STEPS = [
+    ("chapters", """
+        UNWIND $rows AS row
+        MERGE (c:Chapter {number: row.chapter_number})
+        SET c.title = row.chapter_title
+    """),
+    ("sections", """
+        UNWIND $rows AS row
+        MERGE (s:Section {section_id: row.section_id})
+        SET s.section_number = row.section_number, s.title = row.title,
+            s.text = row.text, s.keywords = row.keywords
+        WITH s, row
+        MATCH (c:Chapter {number: row.chapter_number})
+        MERGE (c)-[:CONTAINS]->(s)
+    """),
+    ("offences", """
+        UNWIND $rows AS row
+        MERGE (o:Offence {section_id: row.section_id})
+        SET o.type = row.offence_type, o.section_number = row.section_number
+        WITH o, row
+        MATCH (s:Section {section_id: row.section_id})
+        MERGE (s)-[:DEFINES]->(o)
+    """),
+    ("punishments", """
+        UNWIND $rows AS row
+        MERGE (p:Punishment {punishment_id: row.punishment_id})
+        SET p.section_id = row.section_id, p.description = row.punishment,
+            p.punishment_type = row.punishment_type
+        WITH p, row
+        MATCH (s:Section {section_id: row.section_id})
+        MERGE (s)-[:PUNISHED_BY]->(p)
+    """),
+]
+
+
+def section_row(chapter_number: str, chapter_title: str, section_number: Any, title: str, text: str,
+                punishment: Optional[str] = None, keywords: Optional[List[str]] = None) -> Dict[str, Any]:
+    """Normalised row with every property the load steps write"""
+    number = int(section_number)
+    if not punishment:
+        match = PUNISHMENT_PATTERN.search(text or "")
+        punishment = match.group(1).strip() if match else text
+    return {
+        "chapter_number": chapter_number,
+        "chapter_title": chapter_title,
+        "section_id": f"BNS-{number}",
+        "section_number": number,
+        "title": title,
+        "text": text,
+        "keywords": keywords or [],
+        "offence_type": OFFENCE_TYPES.get(number, "other"),
+        "punishment_id": f"PUN_{number}",
+        "punishment": punishment,
+        "punishment_type": "imprisonment_and_fine",
+    }
+
+
+def read_json(path: str) -> List[Dict[str, Any]]:
+    """Rows from a chapter file shaped like data/bns_data/bns_ch17_clean.json"""
+    with open(path, encoding="utf-8-sig") as f:
+        data = json.load(f)
+
+    chapters = data if isinstance(data, list) else [data]
+    return [
+        section_row(
+            chapter["chapter_number"], chapter["chapter_title"], section["section_number"],
+            section["section_title"], section["section_text"],
+            section.get("punishment"), section.get("keywords")
+        )
+        for chapter in chapters
+        for section in chapter["sections"]
+    ]
+
+
+def read_csv(path: str) -> List[Dict[str, Any]]:
+    """Rows from a CSV with the neo4j_import.cypher columns (c_number, s_section_number, ...)"""
+    with open(path, encoding="utf-8-sig", newline="") as f:
+        return [
+            section_row(
+                row["c_number"], row["c_title"], row["s_section_number"],
+                row["s_section_title"], row["s_section_text"], row.get("punishment")
+            )
+            for row in csv.DictReader(f)
+            if row.get("s_section_number", "").strip()
+        ]
+
+
+def read_source(path: str) -> List[Dict[str, Any]]:
+    """Rows from a .json or .csv source file"""
+    extension = os.path.splitext(path)[1].lower()
+    if extension == ".json":
+        return read_json(path)
+    if extension == ".csv":
+        return read_csv(path)
+    raise ValueError(f"Unsupported graph source {path}: expected .json or .csv")
+
+
+def _write_batch(tx, query: str, rows: List[Dict[str, Any]]):
+    tx.run(query, rows=rows).consume()
+
+
+class GraphLoader:
+    """Writes normalised section rows to the knowledge graph in fixed-size batches"""
+
+    def __init__(self, session_factory: Callable, batch_size: Optional[int] = None,
+                 progress: Optional[Callable[[Dict[str, Any]], None]] = None):
+        """
+        Args:
+            session_factory: Callable returning a Neo4j session context manager
+            batch_size: Rows per UNWIND transaction
+            progress: Called with the stats of every committed batch
+        """
+        self.session_factory = session_factory
+        self.batch_size = batch_size or settings.GRAPH_LOAD_BATCH_SIZE
+        self.progress = progress
+
+    def load(self, rows: Iterable[Dict[str, Any]]) -> Dict[str, Any]:
+        """
+        Merge chapters, sections, offences and punishments with their relationships
+
+        Returns:
+            Per-step and per-batch row counts and throughput
+        """
+        rows = self._dedupe(rows)
+        chapters = list({row["chapter_number"]: row for row in rows}.values())
+        start = time.perf_counter()
+        steps = {}
+
+        with self.session_factory() as session:
+            for step, query in LOAD_STEPS:
+                step_rows = chapters if step == "chapters" else rows
+                steps[step] = self._load_step(session, step, query, step_rows)
+
+        elapsed = time.perf_counter() - start
+        report = {
+            "rows": len(rows),
+            "batch_size": self.batch_size,
+            "seconds": round(elapsed, 3),
+            "rows_per_second": round(len(rows) / elapsed, 1) if elapsed else None,
+            "steps": steps
+        }
+        logger.info(f"Graph load finished: {len(rows)} sections in {elapsed:.2f}s")
+        return report
+
+    def _load_step(self, session, step: str, query: str, rows: List[Dict[str, Any]]) -> Dict[str, Any]:
+        batches = []
+        for index, offset in enumerate(range(0, len(rows), self.batch_size)):
+            batch = rows[offset:offset + self.batch_size]
+            batch_start = time.perf_counter()
+            session.execute_write(_write_batch, query, batch)
+            elapsed = time.perf_counter() - batch_start
+
+            stats = {
+                "step": step,
+                "batch": index + 1,
+                "rows": len(batch),
+                "seconds": round(elapsed, 4),
+                "rows_per_second": round(len(batch) / elapsed, 1) if elapsed else None
+            }
+            batches.append(stats)
+            if self.progress:
+                self.progress(stats)
+
+        return {"rows": len(rows), "batches": batches}
+
+    @staticmethod
+    def _dedupe(rows: Iterable[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """Last row per section wins, so overlapping sources load each section once"""
+        return list({row["section_id"]: row for row in rows}.values())
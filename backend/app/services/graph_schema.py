@@ -0,0 +1,72 @@
+"""
+Knowledge Graph Schema Bootstrap
+Constraints, indexes and the Section-[:PUNISHED_BY]->Punishment relationship the lookups rely on
+"""
+import logging
+from typing import Any, Dict, List
+
+logger = logging.getLogger(__name__)
+
+
+# Uniqueness constraints also back MERGE on the key property with an index
+CONSTRAINTS = [
+    "CREATE CONSTRAINT chapter_number_unique IF NOT EXISTS FOR (c:Chapter) REQUIRE c.number IS UNIQUE",
+    "CREATE CONSTRAINT section_id_unique IF NOT EXISTS FOR (s:Section) REQUIRE s.section_id IS UNIQUE",
+    "CREATE CONSTRAINT punishment_id_unique IF NOT EXISTS FOR (p:Punishment) REQUIRE p.punishment_id IS UNIQUE",
+    "CREATE CONSTRAINT offence_section_id_unique IF NOT EXISTS FOR (o:Offence) REQUIRE o.section_id IS UNIQUE",
+]
+
+INDEXES = [
+    "CREATE INDEX section_number_index IF NOT EXISTS FOR (s:Section) ON (s.section_number)",
+    "CREATE INDEX offence_section_number_index IF NOT EXISTS FOR (o:Offence) ON (o.section_number)",
+    "CREATE INDEX punishment_section_id_index IF NOT EXISTS FOR (p:Punishment) ON (p.section_id)",
+]
+
+# Link punishments imported before the relationship existed; idempotent
+PUNISHED_BY_BACKFILL = """
+    MATCH (p:Punishment)
+    MATCH (s:Section {section_id: p.section_id})
+    MERGE (s)-[r:PUNISHED_BY]->(p)
+    RETURN count(r) as linked
+"""
+
+
+def _backfill_punished_by(tx) -> int:
+    return tx.run(PUNISHED_BY_BACKFILL).single()["linked"]
+
+
+def bootstrap_schema(session) -> Dict[str, Any]:
+    """
+    Create the constraints and indexes and backfill PUNISHED_BY relationships
+
+    Every statement is attempted even if an earlier one fails (for example a
+    uniqueness constraint over duplicated legacy nodes), so one bad statement
+    does not leave the rest of the schema missing.
+
+    Args:
+        session: Neo4j session on the knowledge graph database
+
+    Returns:
+        Applied statement count, linked punishments and any errors
+    """
+    applied = 0
+    errors: List[str] = []
+
+    # Schema commands cannot share a transaction with data writes, so each runs on its own
+    for statement in CONSTRAINTS + INDEXES:
+        try:
+            session.run(statement).consume()
+            applied += 1
+        except Exception as e:
+            logger.warning(f"Schema statement failed: {statement}: {e}")
+            errors.append(str(e))
+
+    linked = None
+    try:
+        linked = session.execute_write(_backfill_punished_by)
+    except Exception as e:
+        logger.warning(f"PUNISHED_BY backfill failed: {e}")
+        errors.append(str(e))
+
+    logger.info(f"Graph schema bootstrapped: {applied} schema statements, {linked} punishments linked")
+    return {"statements": applied, "punishments_linked": linked, "errors": errors}
@@ -0,0 +1,198 @@
+"""
+Knowledge Graph Snapshot
+Exports the legal knowledge graph to a compact file and answers section lookups from memory
+"""
+import gzip
+import json
+import logging
+import os
+from datetime import datetime
+from typing import Any, Dict, Iterable, List, Mapping, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+SNAPSHOT_FORMAT = 1
+
+# Key property of each exported label (the constrained keys from graph_schema)
+NODE_KEYS = {
+    "Chapter": "number",
+    "Section": "section_id",
+    "Offence": "section_id",
+    "Punishment": "punishment_id",
+}
+
+# (type, source label, target label) of every exported relationship
+RELATIONSHIPS = [
+    ("CONTAINS", "Chapter", "Section"),
+    ("DEFINES", "Section", "Offence"),
+    ("PUNISHED_BY", "Section", "Punishment"),
+]
+
+NodeRef = Tuple[str, Any]  # (label, key)
+
+
+def _read_nodes(tx, label: str) -> List[Dict[str, Any]]:
+    # Labels come from NODE_KEYS, never from user input
+    return [record["props"] for record in tx.run(f"MATCH (n:{label}) RETURN properties(n) as props")]
+
+
+def _read_relationships(tx, rel_type: str, source: str, target: str) -> List[List[Any]]:
+    query = (
+        f"MATCH (a:{source})-[:{rel_type}]->(b:{target}) "
+        f"RETURN a.{NODE_KEYS[source]} as source, b.{NODE_KEYS[target]} as target"
+    )
+    return [[record["source"], record["target"]] for record in tx.run(query)]
+
+
+class GraphSnapshot:
+    """
+    Nodes keyed by (label, key) with outgoing adjacency lists per relationship type
+
+    Holds the same Chapter/Section/Offence/Punishment graph as Neo4j and
+    answers the lookups the service sends there, without a round-trip.
+    """
+
+    def __init__(self, nodes: Dict[str, Dict[Any, Dict[str, Any]]], edges: Dict[str, List[List[Any]]],
+                 metadata: Optional[Dict[str, Any]] = None):
+        self.nodes = nodes
+        self.edges = edges
+        self.metadata = metadata or {}
+
+        self._adjacency: Dict[NodeRef, Dict[str, List[NodeRef]]] = {}
+        for rel_type, source_label, target_label in RELATIONSHIPS:
+            for source, target in edges.get(rel_type, []):
+                self._adjacency.setdefault((source_label, source), {}).setdefault(rel_type, []).append(
+                    (target_label, target)
+                )
+
+        self._sections_by_number = {
+            props["section_number"]: section_id
+            for section_id, props in nodes.get("Section", {}).items()
+            if props.get("section_number") is not None
+        }
+
+    @classmethod
+    def export(cls, session, database: Optional[str] = None) -> "GraphSnapshot":
+        """Read every exported label and relationship from a Neo4j session"""
+        nodes = {}
+        for label, key in NODE_KEYS.items():
+            nodes[label] = {props[key]: props for props in session.execute_read(_read_nodes, label)}
+
+        edges = {
+            rel_type: session.execute_read(_read_relationships, rel_type, source, target)
+            for rel_type, source, target in RELATIONSHIPS
+        }
+        return cls(nodes, edges, {"database": database, "exported_at": datetime.utcnow().isoformat()})
+
+    @classmethod
+    def from_rows(cls, rows: Iterable[Dict[str, Any]], source: Optional[str] = None) -> "GraphSnapshot":
+        """Build the graph load_graph.py would write for graph_loader rows, without Neo4j"""
+        nodes: Dict[str, Dict[Any, Dict[str, Any]]] = {label: {} for label in NODE_KEYS}
+        chapters: Dict[str, Any] = {}
+        punishments: Dict[str, Any] = {}
+
+        # Later rows replace earlier ones for the same section, as MERGE + SET does
+        for row in rows:
+            section_id = row["section_id"]
+            chapters[section_id] = row["chapter_number"]
+            punishments[section_id] = row["punishment_id"]
+            nodes["Chapter"][row["chapter_number"]] = {"number": row["chapter_number"], "title": row["chapter_title"]}
+            nodes["Section"][section_id] = {
+                "section_id": section_id, "section_number": row["section_number"],
+                "title": row["title"], "text": row["text"], "keywords": row["keywords"]
+            }
+            nodes["Offence"][section_id] = {
+                "section_id": section_id, "type": row["offence_type"], "section_number": row["section_number"]
+            }
+            nodes["Punishment"][row["punishment_id"]] = {
+                "punishment_id": row["punishment_id"], "section_id": section_id,
+                "description": row["punishment"], "punishment_type": row["punishment_type"]
+            }
+
+        edges = {
+            "CONTAINS": [[chapter, section_id] for section_id, chapter in chapters.items()],
+            "DEFINES": [[section_id, section_id] for section_id in nodes["Section"]],
+            "PUNISHED_BY": [[section_id, punishment_id] for section_id, punishment_id in punishments.items()],
+        }
+        return cls(nodes, edges, {"source": source, "exported_at": datetime.utcnow().isoformat()})
+
+    def save(self, path: str) -> int:
+        """Write the snapshot as gzipped JSON, returns the file size in bytes"""
+        document = {
+            "format": SNAPSHOT_FORMAT,
+            "metadata": self.metadata,
+            "nodes": {label: list(nodes.values()) for label, nodes in self.nodes.items()},
+            "edges": self.edges
+        }
+        directory = os.path.dirname(os.path.abspath(path))
+        os.makedirs(directory, exist_ok=True)
+
+        # Write then rename so a running service never reads a half-written snapshot
+        temporary = f"{path}.tmp"
+        with gzip.open(temporary, "wt", encoding="utf-8") as f:
+            json.dump(document, f, separators=(",", ":"), ensure_ascii=False)
+        os.replace(temporary, path)
+        return os.path.getsize(path)
+
+    @classmethod
+    def load(cls, path: str) -> "GraphSnapshot":
+        """Read a snapshot written by save()"""
+        with gzip.open(path, "rt", encoding="utf-8") as f:
+            document = json.load(f)
+
+        if document.get("format") != SNAPSHOT_FORMAT:
+            raise ValueError(f"Unsupported graph snapshot format {document.get('format')} in {path}")
+
+        nodes = {
+            label: {props[NODE_KEYS[label]]: props for props in document["nodes"].get(label, [])}
+            for label in NODE_KEYS
+        }
+        return cls(nodes, document["edges"], document.get("metadata"))
+
+    def neighbours(self, label: str, key: Any, rel_type: str) -> List[Dict[str, Any]]:
+        """Properties of the nodes reached over outgoing rel_type relationships"""
+        targets = self._adjacency.get((label, key), {}).get(rel_type, [])
+        return [self.nodes[target_label][target] for target_label, target in targets
+                if target in self.nodes.get(target_label, {})]
+
+    def section_records(self, section_numbers: Iterable[int]) -> Dict[int, List[Dict[str, Any]]]:
+        """Same records as SECTION_LOOKUP_QUERY, grouped by section number"""
+        records = {}
+        for section_number in dict.fromkeys(section_numbers):
+            section_id = self._sections_by_number.get(section_number)
+            if section_id is not None:
+                rows = self._section_rows(section_id)
+                if rows:
+                    records[section_number] = rows
+        return records
+
+    def catalog_rows(self) -> List[Dict[str, Any]]:
+        """Same rows as the section catalogue query, ordered by section number"""
+        return [
+            row
+            for section_number in sorted(self._sections_by_number)
+            for row in self._section_rows(self._sections_by_number[section_number])
+        ]
+
+    def _section_rows(self, section_id: str) -> List[Dict[str, Any]]:
+        section = self.nodes["Section"][section_id]
+        return [
+            {
+                "section_number": section["section_number"],
+                "section": section_id,
+                "title": section.get("title"),
+                "description": section.get("text"),
+                "punishment": punishment.get("description"),
+                "severity": punishment.get("punishment_type"),
+                "offence_type": offence.get("type")
+            }
+            for offence in self.neighbours("Section", section_id, "DEFINES")
+            for punishment in self.neighbours("Section", section_id, "PUNISHED_BY")
+        ]
+
+    def stats(self) -> Mapping[str, Any]:
+        return {
+            "nodes": {label: len(nodes) for label, nodes in self.nodes.items()},
+            "relationships": {rel_type: len(edges) for rel_type, edges in self.edges.items()},
+            **self.metadata
+        }
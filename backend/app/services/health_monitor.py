@@ -0,0 +1,157 @@
+"""
+Dependency Health Monitor
+Pings Ollama, Neo4j and PostgreSQL in the background so health endpoints answer from a snapshot
+"""
+import asyncio
+import logging
+import time
+from datetime import datetime
+from typing import Any, Awaitable, Callable, Dict, Iterable, Optional
+
+from app.core.config import settings
+from app.core.metrics import DEPENDENCY_UP
+from app.services.ollama_service import get_ollama_service
+from app.services.neo4j_service import get_neo4j_service
+
+logger = logging.getLogger(__name__)
+
+HealthCheck = Callable[[], Awaitable[Optional[Dict[str, Any]]]]
+
+# Statuses of a dependency that can serve requests; "snapshot" is Neo4j replaced by the in-memory graph
+SERVING_STATUSES = ("up", "snapshot")
+
+
+async def check_ollama() -> Dict[str, Any]:
+    """GET /api/version - no model generation involved"""
+    ollama_service = get_ollama_service()
+    version = await ollama_service.ping_async(timeout=settings.HEALTH_CHECK_TIMEOUT)
+    return {"version": version, "model": ollama_service.model}
+
+
+async def check_neo4j() -> Dict[str, Any]:
+    """RETURN 1 on the knowledge graph database, unless the service answers from the graph snapshot"""
+    neo4j_service = get_neo4j_service()
+    await neo4j_service.ensure_connected_async()
+    mode = neo4j_service.mode
+    if mode == "snapshot":
+        # Neo4j is not used, so it cannot degrade the service
+        return {"status": "snapshot", "mode": mode}
+    if mode == "fallback":
+        raise RuntimeError("Neo4j unreachable and no graph snapshot loaded")
+
+    await neo4j_service.ping_async()
+    return {
+        "mode": mode,
+        "pool": neo4j_service.pool.stats()
+    }
+
+
+async def check_postgres() -> None:
+    """SELECT 1 through the async SQLAlchemy engine"""
+    from sqlalchemy import text
+    from app.models.database import get_async_engine
+
+    async with get_async_engine().connect() as connection:
+        await connection.execute(text("SELECT 1"))
+
+
+DEFAULT_CHECKS: Dict[str, HealthCheck] = {
+    "ollama": check_ollama,
+    "neo4j": check_neo4j,
+    "postgres": check_postgres,
+}
+
+
+class HealthMonitor:
+    """Periodically refreshed, read-only snapshot of dependency health"""
+
+    def __init__(
+        self,
+        checks: Optional[Dict[str, HealthCheck]] = None,
+        interval: Optional[float] = None,
+        timeout: Optional[float] = None,
+        required: Optional[Iterable[str]] = None
+    ):
+        self.checks = DEFAULT_CHECKS if checks is None else checks
+        self.interval = settings.HEALTH_CHECK_INTERVAL if interval is None else interval
+        self.timeout = settings.HEALTH_CHECK_TIMEOUT if timeout is None else timeout
+        self.required = set(settings.HEALTH_REQUIRED_SERVICES if required is None else required)
+        self._task: Optional[asyncio.Task] = None
+        self.startup: Optional[Dict[str, Any]] = None  # warm-up report, set by the lifespan
+        self._snapshot: Dict[str, Any] = {
+            "status": "starting",
+            "ready": False,
+            "checked_at": None,
+            "services": {name: {"status": "unknown"} for name in self.checks}
+        }
+
+    def snapshot(self) -> Dict[str, Any]:
+        """Latest dependency status; never performs I/O"""
+        return self._snapshot
+
+    def is_ready(self) -> bool:
+        return self._snapshot["ready"]
+
+    async def refresh(self) -> Dict[str, Any]:
+        """Run every check concurrently and publish a new snapshot"""
+        names = list(self.checks)
+        results = await asyncio.gather(*(self._run_check(name) for name in names))
+        services = dict(zip(names, results))
+
+        up = {name for name, result in services.items() if result["status"] in SERVING_STATUSES}
+        self._snapshot = {
+            "status": "healthy" if len(up) == len(services) else "degraded",
+            "ready": self.required <= up,
+            "checked_at": datetime.utcnow().isoformat(),
+            "services": services
+        }
+        return self._snapshot
+
+    async def _run_check(self, name: str) -> Dict[str, Any]:
+        start = time.perf_counter()
+        result: Dict[str, Any] = {"status": "up", "error": None}
+        try:
+            details = await asyncio.wait_for(self.checks[name](), timeout=self.timeout)
+            if details:
+                result.update(details)
+        except asyncio.TimeoutError:
+            result.update(status="down", error=f"timed out after {self.timeout}s")
+        except Exception as e:
+            result.update(status="down", error=str(e) or type(e).__name__)
+
+        result["latency_ms"] = round((time.perf_counter() - start) * 1000, 2)
+        result["checked_at"] = datetime.utcnow().isoformat()
+        DEPENDENCY_UP.set(1 if result["status"] == "up" else 0, service=name)
+
+        previous = self._snapshot["services"].get(name, {}).get("status")
+        if previous != result["status"]:
+            logger.info(f"Dependency {name} is {result['status']}" + (f": {result['error']}" if result["error"] else ""))
+        return result
+
+    async def _run(self):
+        while True:
+            if self._snapshot["checked_at"] is not None:
+                # Warm-up or the previous round already produced a fresh snapshot
+                await asyncio.sleep(self.interval)
+            try:
+                await self.refresh()
+            except Exception as e:
+                logger.error(f"Health refresh failed: {e}")
+
+    def start(self):
+        """Start background refreshing on the running event loop"""
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self):
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+
+# Global health monitor instance
+health_monitor = HealthMonitor()
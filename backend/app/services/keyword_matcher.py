@@ -0,0 +1,163 @@
+"""
+Aho-Corasick Multi-Pattern Keyword Matcher
+Finds every keyword occurrence in a single linear pass over the text
+"""
+try:
+    import ahocorasick
+    AHOCORASICK_AVAILABLE = True
+except ImportError:
+    AHOCORASICK_AVAILABLE = False
+    ahocorasick = None
+
+from collections import deque
+from typing import Any, Dict, Iterable, Iterator, List, NamedTuple, Optional, Tuple
+
+# Plural endings a keyword may carry and still match ("laptop" in "laptops", "bus" in "buses")
+INFLECTION_SUFFIXES = ("es", "s")
+# Shorter keywords match whole words only, so "i" does not match "is"
+MIN_INFLECTED_LENGTH = 3
+
+
+class KeywordHit(NamedTuple):
+    """One keyword occurrence: text span plus the payload registered for the keyword"""
+    start: int
+    end: int
+    keyword: str
+    payload: Any
+
+
+class AhoCorasickMatcher:
+    """
+    Automaton over a fixed keyword set, built once and reused for every query.
+    Uses the pyahocorasick C extension when installed, otherwise a pure Python automaton.
+    """
+
+    def __init__(self, keywords: Iterable[Tuple[str, Any]], word_boundaries: bool = True,
+                 suffixes: Iterable[str] = INFLECTION_SUFFIXES):
+        """
+        Args:
+            keywords: (keyword, payload) pairs; a keyword may be registered more than once
+            word_boundaries: only report hits that start on a word boundary and end on one,
+                optionally after one of suffixes
+            suffixes: endings allowed between a keyword of MIN_INFLECTED_LENGTH or more
+                characters and its closing word boundary
+        """
+        self.word_boundaries = word_boundaries
+        self.suffixes = tuple(suffixes)
+        self._goto: List[Dict[str, int]] = [{}]
+        self._fail: List[int] = [0]
+        self._outputs: List[List[Tuple[int, str, Any]]] = [[]]
+        self._automaton = None
+
+        registered: Dict[str, List[Any]] = {}
+        for keyword, payload in keywords:
+            keyword = keyword.lower()
+            if keyword:
+                registered.setdefault(keyword, []).append(payload)
+
+        if AHOCORASICK_AVAILABLE:
+            self._automaton = ahocorasick.Automaton()
+            for keyword, payloads in registered.items():
+                self._automaton.add_word(keyword, (len(keyword), keyword, tuple(payloads)))
+            self._automaton.make_automaton()
+        else:
+            for keyword, payloads in registered.items():
+                for payload in payloads:
+                    self._add(keyword, payload)
+            self._build_failure_links()
+
+    def _add(self, keyword: str, payload: Any):
+        state = 0
+        for char in keyword:
+            next_state = self._goto[state].get(char)
+            if next_state is None:
+                next_state = len(self._goto)
+                self._goto[state][char] = next_state
+                self._goto.append({})
+                self._fail.append(0)
+                self._outputs.append([])
+            state = next_state
+        self._outputs[state].append((len(keyword), keyword, payload))
+
+    def _build_failure_links(self):
+        """Breadth-first pass linking every state to its longest proper suffix state"""
+        queue = deque(self._goto[0].values())
+        while queue:
+            state = queue.popleft()
+            for char, next_state in self._goto[state].items():
+                queue.append(next_state)
+                fallback = self._fail[state]
+                while fallback and char not in self._goto[fallback]:
+                    fallback = self._fail[fallback]
+                target = self._goto[fallback].get(char, 0)
+                self._fail[next_state] = target if target != next_state else 0
+                # Inherit the suffix state's outputs so each state reports every match ending here
+                self._outputs[next_state] = self._outputs[next_state] + self._outputs[self._fail[next_state]]
+
+    def iter_matches(self, text: str) -> Iterator[KeywordHit]:
+        """
+        Yield every (possibly overlapping) keyword occurrence, ordered by end position.
+        Spans index into text.lower(), which is the text itself for lowercased input.
+        """
+        text = text.lower()
+
+        for index, keyword_length, keyword, payloads in self._scan(text):
+            start = index - keyword_length + 1
+            end = index + 1
+            if self.word_boundaries:
+                end = self._word_end(text, start, end)
+                if end is None:
+                    continue
+            for payload in payloads:
+                yield KeywordHit(start, end, keyword, payload)
+
+    def payloads(self, text: str) -> List[Any]:
+        """Payloads of every hit, skipping span construction (extraction hot path)"""
+        text = text.lower()
+        found = []
+        for index, keyword_length, keyword, payloads in self._scan(text):
+            if self.word_boundaries and self._word_end(text, index - keyword_length + 1, index + 1) is None:
+                continue
+            found.extend(payloads)
+        return found
+
+    def _word_end(self, text: str, start: int, end: int) -> Optional[int]:
+        """End of the word a hit at [start, end) covers, including a plural suffix; None inside a word"""
+        if start > 0 and text[start - 1].isalnum():
+            return None
+        if end == len(text) or not text[end].isalnum():
+            return end
+        if end - start >= MIN_INFLECTED_LENGTH:
+            for suffix in self.suffixes:
+                suffix_end = end + len(suffix)
+                if text.startswith(suffix, end) and (suffix_end == len(text) or not text[suffix_end].isalnum()):
+                    return suffix_end
+        return None
+
+    def _scan(self, text: str) -> Iterator[Tuple[int, int, str, Tuple[Any, ...]]]:
+        """Raw automaton output: (end index, keyword length, keyword, payloads)"""
+        if self._automaton is not None:
+            for index, (keyword_length, keyword, payloads) in self._automaton.iter(text):
+                yield index, keyword_length, keyword, payloads
+            return
+
+        goto = self._goto
+        fail = self._fail
+        outputs = self._outputs
+        state = 0
+
+        for index, char in enumerate(text):
+            while state and char not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(char, 0)
+
+            for keyword_length, keyword, payload in outputs[state]:
+                yield index, keyword_length, keyword, (payload,)
+
+    def find_all(self, text: str) -> List[KeywordHit]:
+        """All keyword hits in the text"""
+        return list(self.iter_matches(text))
+
+    def found_keywords(self, text: str) -> set:
+        """Distinct keywords present in the text"""
+        return {hit.keyword for hit in self.iter_matches(text)}
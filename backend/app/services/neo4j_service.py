@@ -2,54 +2,416 @@
 Neo4j Knowledge Graph Service for Legal Reasoning
 """
 try:
-    from neo4j import GraphDatabase
+    from neo4j import AsyncGraphDatabase, GraphDatabase
+    from neo4j.exceptions import ClientError, ConfigurationError
     NEO4J_AVAILABLE = True
 except ImportError:
     NEO4J_AVAILABLE = False
+    AsyncGraphDatabase = None
     GraphDatabase = None
+    ClientError = ConfigurationError = None
 
+# Driver-level liveness checks only exist in newer 5.x drivers than the pinned 5.14;
+# open_driver() tries them and clears this the first time the driver rejects the option
+LIVENESS_CHECK_SUPPORTED = True
+
+from contextlib import asynccontextmanager, contextmanager
 from typing import List, Dict, Any, Optional
+import asyncio
 import logging
+import threading
+import time
 from app.core.config import settings
+from app.core.metrics import (
+    FALLBACK_REASONING_TOTAL,
+    NEO4J_ACQUISITION_TIMEOUTS_TOTAL,
+    NEO4J_CONNECTION_WAIT_SECONDS,
+    NEO4J_POOL_SATURATED_TOTAL,
+    NEO4J_QUERY_SECONDS,
+    NEO4J_SESSIONS_IN_USE,
+)
+from app.services.graph_loader import read_source
+from app.services.graph_schema import bootstrap_schema
+from app.services.graph_snapshot import GraphSnapshot
 from app.services.property_value_estimator import PropertyValueEstimator
+from app.services.section_catalog import SectionCatalog
+from app.services.rule_engine import rule_engine
 
 logger = logging.getLogger(__name__)
 
 
+# Single parameterised lookup for every section whose rule fired
+SECTION_LOOKUP_QUERY = """
+    UNWIND $sections AS section_number
+    MATCH (s:Section {section_number: section_number})-[:DEFINES]->(o:Offence)
+    MATCH (s)-[:PUNISHED_BY]->(p:Punishment)
+    RETURN section_number, s.section_id as section, s.title as title,
+           s.text as description, p.description as punishment,
+           p.punishment_type as severity, o.type as offence_type
+"""
+
+# Metadata attached to a hit of each applicability rule, in evaluation order
+# (the decisions themselves come from the compiled rule engine)
+APPLICABILITY_RULES = [
+    {
+        "section_number": 303,
+        "confidence": 0.8,
+        "reasoning": "Basic theft elements detected",
+        "default_description": None,
+        "extra": {"property_value_consideration": True}  # Section 303 has value thresholds
+    },
+    {
+        "section_number": 305,
+        "confidence": 0.9,
+        "reasoning": "Theft in dwelling house detected",
+        "default_description": None
+    },
+    {
+        "section_number": 306,
+        "confidence": 0.85,
+        "reasoning": "Employee theft scenario detected",
+        "default_description": None
+    },
+    {
+        "section_number": 309,
+        "confidence": 0.9,
+        "reasoning": "Robbery elements detected (violence/force used)",
+        "default_description": None
+    },
+    {
+        "section_number": 304,
+        "confidence": 0.85,
+        "reasoning": "Snatching elements detected (sudden forceful taking)",
+        "default_description": "Snatching involves sudden and forceful taking of property"
+    },
+    {
+        "section_number": 318,
+        "confidence": 0.9,
+        "reasoning": "Cheating elements detected (deception/fraud identified)",
+        "default_description": "Cheating involves dishonest inducement to deliver property or do/omit an act"
+    },
+    {
+        "section_number": 316,
+        "confidence": 0.9,
+        "reasoning": "Breach of trust elements detected (trust relationship violated)",
+        "default_description": "Criminal breach of trust involves dishonest misappropriation of entrusted property"
+    },
+    {
+        "section_number": 308,
+        "confidence": 0.9,
+        "reasoning": "Extortion elements detected (threat-based coercion)",
+        "default_description": "Extortion involves threatening someone to obtain money, property, or compliance"
+    },
+    {
+        "section_number": 329,
+        "confidence": 0.85,
+        "reasoning": "Criminal trespass elements detected (unlawful entry)",
+        "default_description": "Criminal trespass involves unlawfully entering someone's property"
+    },
+    {
+        "section_number": 324,
+        "confidence": 0.85,
+        "reasoning": "Mischief elements detected (property damage)",
+        "default_description": "Mischief involves intentional damage or destruction of property"
+    },
+]
+
+
+def driver_config() -> Dict[str, Any]:
+    """Connection pool settings shared by the sync and async drivers"""
+    config = {
+        "max_connection_pool_size": settings.NEO4J_MAX_CONNECTION_POOL_SIZE,
+        "connection_acquisition_timeout": settings.NEO4J_CONNECTION_ACQUISITION_TIMEOUT,
+        "connection_timeout": settings.NEO4J_CONNECTION_TIMEOUT,
+        "max_connection_lifetime": settings.NEO4J_MAX_CONNECTION_LIFETIME,
+        "keep_alive": settings.NEO4J_KEEP_ALIVE,
+    }
+    if LIVENESS_CHECK_SUPPORTED:
+        config["liveness_check_timeout"] = settings.NEO4J_LIVENESS_CHECK_TIMEOUT
+    return config
+
+
+def open_driver(factory=None):
+    """
+    Driver from factory (GraphDatabase or AsyncGraphDatabase) built with driver_config()
+
+    Drivers that predate liveness checks reject the option, so it is dropped and the
+    driver is built again without it.
+    """
+    global LIVENESS_CHECK_SUPPORTED
+    factory = factory or GraphDatabase
+    auth = (settings.NEO4J_USER, settings.NEO4J_PASSWORD)
+    if LIVENESS_CHECK_SUPPORTED:
+        try:
+            return factory.driver(settings.NEO4J_URI, auth=auth, **driver_config())
+        except (ConfigurationError, TypeError) as e:
+            LIVENESS_CHECK_SUPPORTED = False
+            logger.info(f"Neo4j driver has no liveness checks, relying on keep_alive: {e}")
+    return factory.driver(settings.NEO4J_URI, auth=auth, **driver_config())
+
+
+def is_acquisition_timeout(error: Exception) -> bool:
+    """The driver raises a ClientError without a server status code when no pooled connection frees up in time"""
+    return NEO4J_AVAILABLE and isinstance(error, ClientError) and error.code is None
+
+
+def _read_sections(tx, sections: List[int]) -> List[Dict[str, Any]]:
+    """Transaction function for SECTION_LOOKUP_QUERY; records are consumed inside the transaction"""
+    return [record.data() for record in tx.run(SECTION_LOOKUP_QUERY, sections=sections)]
+
+
+async def _read_sections_async(tx, sections: List[int]) -> List[Dict[str, Any]]:
+    result = await tx.run(SECTION_LOOKUP_QUERY, sections=sections)
+    return await result.data()
+
+
+class PoolMonitor:
+    """
+    Tracks sessions per driver against the pool size
+
+    The driver does not expose its pool, so every session opened through the
+    service is counted: a read session holds one connection at a time, so more
+    open sessions than pooled connections means callers are queueing.
+    """
+
+    def __init__(self, max_size: Optional[int] = None):
+        self.max_size = settings.NEO4J_MAX_CONNECTION_POOL_SIZE if max_size is None else max_size
+        self._in_use = {"sync": 0, "async": 0}
+        self._lock = threading.Lock()  # sync sessions are opened from worker threads
+
+    @contextmanager
+    def track(self, driver: str):
+        with self._lock:
+            self._in_use[driver] += 1
+            in_use = self._in_use[driver]
+        NEO4J_SESSIONS_IN_USE.set(in_use, driver=driver)
+        if in_use > self.max_size:
+            NEO4J_POOL_SATURATED_TOTAL.inc(driver=driver)
+        try:
+            yield
+        except Exception as e:
+            if is_acquisition_timeout(e):
+                NEO4J_ACQUISITION_TIMEOUTS_TOTAL.inc(driver=driver)
+                logger.warning(f"Neo4j {driver} pool exhausted: {in_use} sessions for {self.max_size} connections")
+            raise
+        finally:
+            with self._lock:
+                self._in_use[driver] -= 1
+                in_use = self._in_use[driver]
+            NEO4J_SESSIONS_IN_USE.set(in_use, driver=driver)
+
+    def wait_timer(self, work, driver: str):
+        """Wrap a transaction function to observe how long it waited for a connection"""
+        opened = time.perf_counter()
+        observed = False
+
+        def observe():
+            nonlocal observed
+            if not observed:  # managed transactions retry the function; only the first start counts
+                observed = True
+                NEO4J_CONNECTION_WAIT_SECONDS.observe(time.perf_counter() - opened, driver=driver)
+
+        if asyncio.iscoroutinefunction(work):
+            async def async_wrapper(tx, *args, **kwargs):
+                observe()
+                return await work(tx, *args, **kwargs)
+            return async_wrapper
+
+        def wrapper(tx, *args, **kwargs):
+            observe()
+            return work(tx, *args, **kwargs)
+        return wrapper
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "max_pool_size": self.max_size,
+            "sessions_in_use": dict(self._in_use),
+            "saturated": {driver: NEO4J_POOL_SATURATED_TOTAL.value(driver=driver) for driver in self._in_use},
+            "acquisition_timeouts": {
+                driver: NEO4J_ACQUISITION_TIMEOUTS_TOTAL.value(driver=driver) for driver in self._in_use
+            }
+        }
+
+
 class Neo4jService:
     """Neo4j service for legal knowledge graph operations"""
     
     def __init__(self):
         self.driver = None
+        self.async_driver = None  # created on first async lookup, bound to the serving event loop
+        self._catalog_refresh: Optional[asyncio.Lock] = None
+        self._connect_attempted = False
         self.available = NEO4J_AVAILABLE
+        self.pool = PoolMonitor()
+        self.snapshot: Optional[GraphSnapshot] = None  # in-memory graph used when Neo4j is not
+        self._fallback_snapshot: Optional[GraphSnapshot] = None  # answers failed Neo4j lookups while connected
         self.property_estimator = PropertyValueEstimator()
-        if self.available:
-            self.connect()
-        else:
+        self.catalog = SectionCatalog()
+        self.rule_engine = rule_engine
+        # No network I/O here: the connection is opened by connect() during warm-up or on first use
+        if not self.available:
             logger.warning("Neo4j driver not available - using fallback legal reasoning")
+
+    @property
+    def mode(self) -> str:
+        """'graph' when backed by Neo4j, 'snapshot' when by the in-memory graph, else 'fallback'"""
+        if self.available and self.driver is not None:
+            return "graph"
+        return "snapshot" if self.snapshot is not None else "fallback"
+
+    def ensure_connected(self):
+        """Connect once, on first use, if nobody has tried yet"""
+        if self.driver is None and not self._connect_attempted:
+            self.connect()
+
+    async def ensure_connected_async(self):
+        """Same as ensure_connected, without blocking the event loop"""
+        if self.driver is None and not self._connect_attempted:
+            await asyncio.to_thread(self.connect)
     
     def connect(self):
-        """Establish connection to Neo4j database"""
-        if not self.available:
+        """Establish connection to Neo4j database, or load the graph snapshot instead"""
+        self._connect_attempted = True
+
+        if not self.available or settings.GRAPH_SNAPSHOT_ONLY:
+            self.load_snapshot()
             return
             
         try:
-            self.driver = GraphDatabase.driver(
-                settings.NEO4J_URI,
-                auth=(settings.NEO4J_USER, settings.NEO4J_PASSWORD)
-            )
+            self.driver = open_driver(GraphDatabase)
             # Test connection
-            with self.driver.session(database="legalknowledge") as session:
+            with self.session() as session:
                 result = session.run("RETURN 1 as test")
                 logger.info("Neo4j connection established successfully")
         except Exception as e:
-            logger.warning(f"Neo4j connection failed, using fallback: {e}")
+            logger.warning(f"Neo4j connection failed, using snapshot or fallback: {e}")
             self.available = False
+            self.load_snapshot()
+            return
+
+        if settings.NEO4J_BOOTSTRAP_SCHEMA:
+            self.bootstrap_schema()
+        self.refresh_catalog()
+
+    def bootstrap_schema(self) -> Dict[str, Any]:
+        """Create constraints and indexes and link punishments before the first lookup"""
+        try:
+            with self.session() as session:
+                return bootstrap_schema(session)
+        except Exception as e:
+            logger.warning(f"Graph schema bootstrap failed: {e}")
+            return {"statements": 0, "punishments_linked": None, "errors": [str(e)]}
+
+    def load_snapshot(self, path: Optional[str] = None) -> Optional[Dict[str, Any]]:
+        """
+        Load a graph snapshot and serve the section catalogue from it: the snapshot file when one
+        is configured, otherwise the bundled section source (GRAPH_SOURCE_PATH) built in memory
+        """
+        snapshot = self._read_snapshot(path)
+        if snapshot is None:
+            return None
+
+        self.snapshot = snapshot
+        self.catalog.replace(self.snapshot.catalog_rows())
+        logger.info(f"Serving the knowledge graph from snapshot {path or settings.GRAPH_SNAPSHOT_PATH or settings.GRAPH_SOURCE_PATH}")
+        return dict(self.snapshot.stats())
+
+    def fallback_snapshot(self) -> Optional[GraphSnapshot]:
+        """Snapshot answering lookups Neo4j could not, read on first use while connected to Neo4j"""
+        if self.snapshot is None and self._fallback_snapshot is None:
+            self._fallback_snapshot = self._read_snapshot()
+        return self.snapshot or self._fallback_snapshot
+
+    def _read_snapshot(self, path: Optional[str] = None) -> Optional[GraphSnapshot]:
+        path = path or settings.GRAPH_SNAPSHOT_PATH
+        try:
+            if path:
+                return GraphSnapshot.load(path)
+            if settings.GRAPH_SOURCE_PATH:
+                return GraphSnapshot.from_rows(read_source(settings.GRAPH_SOURCE_PATH), source=settings.GRAPH_SOURCE_PATH)
+        except Exception as e:
+            logger.warning(f"Graph snapshot {path or settings.GRAPH_SOURCE_PATH} could not be loaded: {e}")
+        return None
+
+    def refresh_catalog(self) -> Dict[str, Any]:
+        """Reload the in-memory section catalogue from the knowledge graph"""
+        if not self.available or not self.driver:
+            if self.snapshot is not None:
+                self.catalog.replace(self.snapshot.catalog_rows())
+            return self.catalog.stats()
+
+        try:
+            with self.session() as session:
+                with NEO4J_QUERY_SECONDS.time(query="catalog_load"):
+                    self.catalog.load(session)
+        except Exception as e:
+            # Keep serving the previous snapshot; lookups fall back to Neo4j if there is none
+            self.catalog.mark_failed()
+            logger.warning(f"Section catalogue refresh failed, retrying in {self.catalog.retry_interval:g}s: {e}")
+
+        return self.catalog.stats()
     
+    async def refresh_catalog_async(self) -> Dict[str, Any]:
+        """refresh_catalog() over the async driver; concurrent callers share one reload"""
+        if not self.available or not self.driver:
+            return self.refresh_catalog()
+
+        if self._catalog_refresh is None:
+            self._catalog_refresh = asyncio.Lock()
+        if self._catalog_refresh.locked():
+            # A reload is already in flight; keep serving the current snapshot meanwhile
+            return self.catalog.stats()
+
+        async with self._catalog_refresh:
+            try:
+                async with self.session_async() as session:
+                    with NEO4J_QUERY_SECONDS.time(query="catalog_load"):
+                        await self.catalog.load_async(session)
+            except Exception as e:
+                self.catalog.mark_failed()
+                logger.warning(f"Section catalogue refresh failed, retrying in {self.catalog.retry_interval:g}s: {e}")
+
+        return self.catalog.stats()
+
+    async def ping_async(self):
+        """RETURN 1 round-trip used by the health monitor"""
+        if not NEO4J_AVAILABLE:
+            raise RuntimeError("neo4j driver not installed")
+
+        async with self.session_async() as session:
+            result = await session.run("RETURN 1 as test")
+            await result.consume()
+
+    @contextmanager
+    def session(self):
+        """Session on the sync driver's pool, counted by the pool monitor"""
+        with self.pool.track("sync"):
+            with self.driver.session(database=settings.NEO4J_DATABASE) as session:
+                yield session
+
+    @asynccontextmanager
+    async def session_async(self):
+        """Session on the async driver's pool, counted by the pool monitor"""
+        with self.pool.track("async"):
+            async with self._get_async_driver().session(database=settings.NEO4J_DATABASE) as session:
+                yield session
+
+    def _get_async_driver(self):
+        """Async driver sharing the sync driver's settings"""
+        if self.async_driver is None:
+            self.async_driver = open_driver(AsyncGraphDatabase)
+        return self.async_driver
+
     def close(self):
         """Close Neo4j connection"""
         if self.driver:
             self.driver.close()
+
+    async def aclose(self):
+        """Close the async Neo4j driver"""
+        if self.async_driver is not None:
+            await self.async_driver.close()
+            self.async_driver = None
     
     def find_applicable_laws(self, entities: Dict[str, List[str]]) -> List[Dict[str, Any]]:
         """
@@ -61,489 +423,181 @@ class Neo4jService:
         Returns:
             List of applicable law sections with confidence scores
         """
-        # Use fallback reasoning if Neo4j not available
-        if not self.available or not self.driver:
-            return self._fallback_legal_reasoning(entities)
+        fired_sections = set(self.rule_engine.evaluate(entities))
+        self.ensure_connected()
 
-        applicable_laws = []
+        # Use fallback reasoning if neither Neo4j nor a snapshot is available
+        if self.mode == "fallback":
+            return self._fallback_legal_reasoning(entities, fired_sections)
+
+        matched_rules = self._matched_rules(fired_sections)
+        if not matched_rules:
+            return []
+
+        if self.catalog.is_stale():
+            self.refresh_catalog()
+
+        section_numbers = [rule["section_number"] for rule in matched_rules]
 
         try:
-            with self.driver.session(database="legalknowledge") as session:
-                # Rule 1: Basic theft detection (Section 303)
-                if self._has_theft_elements(entities):
-                    result = session.run("""
-                        MATCH (s:Section)-[:DEFINES]->(o:Offence)
-                        MATCH (p:Punishment)
-                        WHERE s.section_number = 303 AND p.section_id = s.section_id
-                        RETURN s.section_id as section, s.title as title,
-                               s.text as description, p.description as punishment,
-                               p.punishment_type as severity, o.type as offence_type
-                    """)
-
-                    for record in result:
-                        applicable_laws.append({
-                            "section": record["section"],
-                            "title": record["title"],
-                            "description": record["description"],
-                            "punishment": record["punishment"],
-                            "severity": record["severity"],
-                            "offence_type": record["offence_type"],
-                            "confidence": 0.8,
-                            "reasoning": "Basic theft elements detected",
-                            "property_value_consideration": True  # Section 303 has value thresholds
-                        })
-
-                # Rule 2: Dwelling house theft (Section 305)
-                if self._has_dwelling_theft_elements(entities):
-                    result = session.run("""
-                        MATCH (s:Section)-[:DEFINES]->(o:Offence)
-                        MATCH (p:Punishment)
-                        WHERE s.section_number = 305 AND p.section_id = s.section_id
-                        RETURN s.section_id as section, s.title as title,
-                               s.text as description, p.description as punishment,
-                               p.punishment_type as severity, o.type as offence_type
-                    """)
-
-                    for record in result:
-                        applicable_laws.append({
-                            "section": record["section"],
-                            "title": record["title"],
-                            "description": record["description"],
-                            "punishment": record["punishment"],
-                            "severity": record["severity"],
-                            "offence_type": record["offence_type"],
-                            "confidence": 0.9,
-                            "reasoning": "Theft in dwelling house detected"
-                        })
-
-                # Rule 3: Employee theft (Section 306)
-                if self._has_employee_theft_elements(entities):
-                    result = session.run("""
-                        MATCH (s:Section)-[:DEFINES]->(o:Offence)
-                        MATCH (p:Punishment)
-                        WHERE s.section_number = 306 AND p.section_id = s.section_id
-                        RETURN s.section_id as section, s.title as title,
-                               s.text as description, p.description as punishment,
-                               p.punishment_type as severity, o.type as offence_type
-                    """)
-
-                    for record in result:
-                        applicable_laws.append({
-                            "section": record["section"],
-                            "title": record["title"],
-                            "description": record["description"],
-                            "punishment": record["punishment"],
-                            "severity": record["severity"],
-                            "offence_type": record["offence_type"],
-                            "confidence": 0.85,
-                            "reasoning": "Employee theft scenario detected"
-                        })
-
-                # Rule 4: Robbery detection (Section 309)
-                if self._has_robbery_elements(entities):
-                    result = session.run("""
-                        MATCH (s:Section)-[:DEFINES]->(o:Offence)
-                        MATCH (p:Punishment)
-                        WHERE s.section_number = 309 AND p.section_id = s.section_id
-                        RETURN s.section_id as section, s.title as title,
-                               s.text as description, p.description as punishment,
-                               p.punishment_type as severity, o.type as offence_type
-                    """)
-
-                    for record in result:
-                        applicable_laws.append({
-                            "section": record["section"],
-                            "title": record["title"],
-                            "description": record["description"],
-                            "punishment": record["punishment"],
-                            "severity": record["severity"],
-                            "offence_type": record["offence_type"],
-                            "confidence": 0.9,
-                            "reasoning": "Robbery elements detected (violence/force used)"
-                        })
-
-                # Rule 5: Snatching detection (Section 304)
-                if self._has_snatching_elements(entities):
-                    result = session.run("""
-                        MATCH (s:Section)-[:DEFINES]->(o:Offence)
-                        MATCH (p:Punishment)
-                        WHERE s.section_number = 304 AND p.section_id = s.section_id
-                        RETURN s.section_id as section, s.title as title,
-                               s.text as description, p.description as punishment,
-                               p.punishment_type as severity, o.type as offence_type
-                    """)
-
-                    for record in result:
-                        applicable_laws.append({
-                            "section": record["section"],
-                            "title": record["title"],
-                            "description": record["description"] or "Snatching involves sudden and forceful taking of property",
-                            "punishment": record["punishment"],
-                            "severity": record["severity"],
-                            "offence_type": record["offence_type"],
-                            "confidence": 0.85,
-                            "reasoning": "Snatching elements detected (sudden forceful taking)"
-                        })
-
-                # Rule 6: Cheating detection (Section 318)
-                if self._has_cheating_elements(entities):
-                    result = session.run("""
-                        MATCH (s:Section)-[:DEFINES]->(o:Offence)
-                        MATCH (p:Punishment)
-                        WHERE s.section_number = 318 AND p.section_id = s.section_id
-                        RETURN s.section_id as section, s.title as title,
-                               s.text as description, p.description as punishment,
-                               p.punishment_type as severity, o.type as offence_type
-                    """)
-
-                    for record in result:
-                        applicable_laws.append({
-                            "section": record["section"],
-                            "title": record["title"],
-                            "description": record["description"] or "Cheating involves dishonest inducement to deliver property or do/omit an act",
-                            "punishment": record["punishment"],
-                            "severity": record["severity"],
-                            "offence_type": record["offence_type"],
-                            "confidence": 0.9,
-                            "reasoning": "Cheating elements detected (deception/fraud identified)"
-                        })
-
-                # Rule 7: Criminal breach of trust detection (Section 316)
-                if self._has_breach_of_trust_elements(entities):
-                    result = session.run("""
-                        MATCH (s:Section)-[:DEFINES]->(o:Offence)
-                        MATCH (p:Punishment)
-                        WHERE s.section_number = 316 AND p.section_id = s.section_id
-                        RETURN s.section_id as section, s.title as title,
-                               s.text as description, p.description as punishment,
-                               p.punishment_type as severity, o.type as offence_type
-                    """)
-
-                    for record in result:
-                        applicable_laws.append({
-                            "section": record["section"],
-                            "title": record["title"],
-                            "description": record["description"] or "Criminal breach of trust involves dishonest misappropriation of entrusted property",
-                            "punishment": record["punishment"],
-                            "severity": record["severity"],
-                            "offence_type": record["offence_type"],
-                            "confidence": 0.9,
-                            "reasoning": "Breach of trust elements detected (trust relationship violated)"
-                        })
-
-                # Rule 8: Extortion detection (Section 308)
-                if self._has_extortion_elements(entities):
-                    result = session.run("""
-                        MATCH (s:Section)-[:DEFINES]->(o:Offence)
-                        MATCH (p:Punishment)
-                        WHERE s.section_number = 308 AND p.section_id = s.section_id
-                        RETURN s.section_id as section, s.title as title,
-                               s.text as description, p.description as punishment,
-                               p.punishment_type as severity, o.type as offence_type
-                    """)
-
-                    for record in result:
-                        applicable_laws.append({
-                            "section": record["section"],
-                            "title": record["title"],
-                            "description": record["description"] or "Extortion involves threatening someone to obtain money, property, or compliance",
-                            "punishment": record["punishment"],
-                            "severity": record["severity"],
-                            "offence_type": record["offence_type"],
-                            "confidence": 0.9,
-                            "reasoning": "Extortion elements detected (threat-based coercion)"
-                        })
-
-                # Rule 9: Criminal trespass detection (Section 329)
-                if self._has_trespass_elements(entities):
-                    result = session.run("""
-                        MATCH (s:Section)-[:DEFINES]->(o:Offence)
-                        MATCH (p:Punishment)
-                        WHERE s.section_number = 329 AND p.section_id = s.section_id
-                        RETURN s.section_id as section, s.title as title,
-                               s.text as description, p.description as punishment,
-                               p.punishment_type as severity, o.type as offence_type
-                    """)
-
-                    for record in result:
-                        applicable_laws.append({
-                            "section": record["section"],
-                            "title": record["title"],
-                            "description": record["description"] or "Criminal trespass involves unlawfully entering someone's property",
-                            "punishment": record["punishment"],
-                            "severity": record["severity"],
-                            "offence_type": record["offence_type"],
-                            "confidence": 0.85,
-                            "reasoning": "Criminal trespass elements detected (unlawful entry)"
-                        })
-
-                # Rule 10: Mischief detection (Section 324)
-                if self._has_mischief_elements(entities):
-                    result = session.run("""
-                        MATCH (s:Section)-[:DEFINES]->(o:Offence)
-                        MATCH (p:Punishment)
-                        WHERE s.section_number = 324 AND p.section_id = s.section_id
-                        RETURN s.section_id as section, s.title as title,
-                               s.text as description, p.description as punishment,
-                               p.punishment_type as severity, o.type as offence_type
-                    """)
-
-                    for record in result:
-                        applicable_laws.append({
-                            "section": record["section"],
-                            "title": record["title"],
-                            "description": record["description"] or "Mischief involves intentional damage or destruction of property",
-                            "punishment": record["punishment"],
-                            "severity": record["severity"],
-                            "offence_type": record["offence_type"],
-                            "confidence": 0.85,
-                            "reasoning": "Mischief elements detected (property damage)"
-                        })
-
-            return applicable_laws
+            if self.catalog.is_loaded:
+                section_records = self.catalog.get_records(section_numbers)
+            else:
+                with self.session() as session:
+                    section_records = self._fetch_sections(session, section_numbers)
+
+            return self._assemble_laws(matched_rules, section_records)
 
         except Exception as e:
             logger.error(f"Neo4j query failed, using fallback: {e}")
-            return self._fallback_legal_reasoning(entities)
-    
-    def _has_theft_elements(self, entities: Dict[str, List[str]]) -> bool:
-        """Check if entities indicate basic theft"""
-        actions = entities.get("actions", [])
-        objects = entities.get("objects", [])
-        intentions = entities.get("intentions", [])
-        
-        theft_actions = ["took", "stolen", "stole", "theft", "stealing", "grabbed", "snatched", "broke into", "borrowed", "taken", "kept", "appropriated"]
-        property_objects = ["phone", "mobile", "iphone", "smartphone", "wallet", "money", "cash", "bag", "purse", "jewelry", "laptop", "computer"]
-        dishonest_intentions = ["without permission", "dishonest", "wrongfully", "dishonestly"]
+            return self._fallback_legal_reasoning(entities, fired_sections)
 
-        has_theft_action = any(theft_action.lower() in action.lower() for action in actions for theft_action in theft_actions)
-        has_property = any(prop.lower() in obj.lower() for obj in objects for prop in property_objects)
-        has_dishonest_intent = any(intent.lower() in dishonest_intentions for intent in intentions)
-        
-        # For basic theft, we only require theft action + property (intention is implied)
-        return has_theft_action and has_property
-    
-    def _has_dwelling_theft_elements(self, entities: Dict[str, List[str]]) -> bool:
-        """Check if entities indicate theft in dwelling"""
-        locations = entities.get("locations", [])
-        actions = entities.get("actions", [])
-        
-        dwelling_locations = ["house", "home", "apartment", "residence", "building", "room"]
-        theft_actions = ["took", "stolen", "stole", "theft", "stealing", "grabbed", "snatched", "broke into", "borrowed", "taken", "kept", "appropriated"]
+    async def find_applicable_laws_async(self, entities: Dict[str, List[str]]) -> List[Dict[str, Any]]:
+        """Non-blocking variant of find_applicable_laws for async request handlers"""
+        fired_sections = set(self.rule_engine.evaluate(entities))
+        await self.ensure_connected_async()
 
-        has_dwelling = any(dwelling.lower() in loc.lower() for loc in locations for dwelling in dwelling_locations)
-        has_theft = any(theft_action.lower() in action.lower() for action in actions for theft_action in theft_actions)
-        
-        return has_dwelling and has_theft
-    
-    def _has_employee_theft_elements(self, entities: Dict[str, List[str]]) -> bool:
-        """Check if entities indicate employee theft"""
-        persons = entities.get("persons", [])
-        relationships = entities.get("relationships", [])
-        actions = entities.get("actions", [])
-
-        employee_terms = ["employee", "worker", "staff", "clerk", "servant"]
-        employer_terms = ["employer", "boss", "company", "master"]
-        theft_actions = ["took", "stolen", "stole", "theft", "stealing", "grabbed", "snatched", "broke into", "borrowed", "taken", "kept", "appropriated"]
-
-        has_employee = any(person.lower() in employee_terms for person in persons)
-        has_employer = any(rel.lower() in employer_terms for rel in relationships)
-        has_theft = any(action.lower() in theft_actions for action in actions)
-
-        return has_employee and has_employer and has_theft
-
-    def _has_robbery_elements(self, entities: Dict[str, List[str]]) -> bool:
-        """Check if entities indicate robbery (theft with violence/force)"""
-        actions = entities.get("actions", [])
-        violence_indicators = entities.get("violence", [])
-        objects = entities.get("objects", [])
-
-        theft_actions = ["took", "stolen", "theft", "stealing", "robbed", "snatched", "grabbed"]
-        violence_terms = ["violence", "force", "hurt", "threatened", "attacked", "beaten", "knife", "gun", "weapon"]
-        property_objects = ["phone", "mobile", "iphone", "smartphone", "wallet", "money", "cash", "bag", "purse", "jewelry", "laptop", "computer"]
-
-        has_theft = any(action.lower() in theft_actions for action in actions)
-        has_violence = any(
-            violence.lower() in violence_terms for violence in violence_indicators
-        ) or any(action.lower() in violence_terms for action in actions)
-        has_property = any(obj.lower() in property_objects for obj in objects)
-
-        return has_theft and has_violence and has_property
-
-    def _has_snatching_elements(self, entities: Dict[str, List[str]]) -> bool:
-        """Check if entities indicate snatching (sudden forceful taking)"""
-        actions = entities.get("actions", [])
-        objects = entities.get("objects", [])
-        circumstances = entities.get("circumstances", [])
-        locations = entities.get("locations", [])
-
-        # Snatching-specific indicators
-        snatching_actions = ["snatched", "grabbed", "yanked", "pulled", "jerked", "ripped", "tore", "forcefully took"]
-        snatching_circumstances = ["suddenly", "quickly", "fast", "running", "speeding", "motorcycle", "bike", "scooter"]
-        snatching_objects = ["chain", "necklace", "bag", "purse", "phone", "mobile", "wallet", "earrings", "watch"]
-        public_locations = ["street", "road", "footpath", "market", "bus stop", "station", "park", "outside"]
-
-        has_snatching_action = any(snatch_action.lower() in action.lower() for action in actions for snatch_action in snatching_actions)
-        has_sudden_element = any(circumstance.lower() in snatching_circumstances for circumstance in circumstances)
-        has_snatching_object = any(obj.lower() in snatching_objects for obj in objects)
-        has_public_location = any(location.lower() in public_locations for location in locations)
-
-        # Snatching requires forceful action + property + (sudden element OR public location)
-        return has_snatching_action and has_snatching_object and (has_sudden_element or has_public_location)
-
-    def _has_cheating_elements(self, entities: Dict[str, List[str]]) -> bool:
-        """Check if entities indicate cheating/fraud"""
-        actions = entities.get("actions", [])
-        intentions = entities.get("intentions", [])
-        circumstances = entities.get("circumstances", [])
-
-        # Cheating-specific indicators
-        cheating_actions = ["cheated", "deceived", "defrauded", "scammed", "tricked", "misled", "promised", "lied", "convinced", "persuaded", "fooled"]
-        fraud_intentions = ["dishonest", "fraudulent", "fake", "false", "misleading", "deceptive"]
-        fraud_circumstances = ["online", "phone call", "fake website", "false documents", "impersonation", "lottery", "prize"]
-
-        # Common fraud patterns
-        fraud_patterns = ["investment", "loan", "credit card", "bank account", "OTP", "ATM", "digital payment", "cryptocurrency"]
-
-        # Check all entity types for fraud indicators
-        all_text = " ".join(actions + intentions + circumstances).lower()
-
-        has_cheating_action = any(cheat_action.lower() in action.lower() for action in actions for cheat_action in cheating_actions)
-        has_fraud_intention = any(fraud_int.lower() in intention.lower() for intention in intentions for fraud_int in fraud_intentions)
-        has_fraud_circumstance = any(fraud_circ.lower() in circumstance.lower() for circumstance in circumstances for fraud_circ in fraud_circumstances)
-        has_fraud_pattern = any(pattern in all_text for pattern in fraud_patterns)
-
-        # Cheating can be detected by:
-        # 1. Strong cheating action (scammed, defrauded) alone
-        # 2. OR (cheating action OR fraud intention) + (fraud circumstance OR fraud pattern)
-        strong_cheating_actions = ["scammed", "defrauded", "cheated", "fraudulently"]
-        has_strong_cheating = any(strong_action.lower() in action.lower() for action in actions for strong_action in strong_cheating_actions)
-
-        return has_strong_cheating or ((has_cheating_action or has_fraud_intention) and (has_fraud_circumstance or has_fraud_pattern))
-
-    def _has_breach_of_trust_elements(self, entities: Dict[str, List[str]]) -> bool:
-        """Check if entities indicate criminal breach of trust"""
-        actions = entities.get("actions", [])
-        relationships = entities.get("relationships", [])
-        circumstances = entities.get("circumstances", [])
-        intentions = entities.get("intentions", [])
-
-        # Trust-specific indicators
-        trust_actions = ["misappropriated", "misused", "betrayed", "violated trust", "dishonestly used", "converted", "embezzled"]
-        trust_relationships = ["entrusted", "trustee", "fiduciary", "agent", "guardian", "manager", "executor", "director"]
-        trust_circumstances = ["entrusted with", "given responsibility", "in charge of", "managing", "handling", "responsible for"]
-        dishonest_intentions = ["dishonest", "wrongful", "unauthorized", "personal use", "own benefit"]
-
-        # Check all entity types for trust indicators
-        all_text = " ".join(actions + relationships + circumstances + intentions).lower()
-
-        has_trust_action = any(trust_action.lower() in action.lower() for action in actions for trust_action in trust_actions)
-        has_trust_relationship = any(trust_rel.lower() in rel.lower() for rel in relationships for trust_rel in trust_relationships)
-        has_trust_circumstance = any(trust_circ.lower() in circumstance.lower() for circumstance in circumstances for trust_circ in trust_circumstances)
-        has_dishonest_intention = any(dishonest_int.lower() in intention.lower() for intention in intentions for dishonest_int in dishonest_intentions)
-
-        # Also check for trust indicators in the combined text
-        has_trust_pattern = any(pattern in all_text for pattern in trust_relationships + trust_circumstances)
-
-        # Check for dishonest elements in circumstances as well
-        has_dishonest_circumstance = any(dishonest_int.lower() in circumstance.lower() for circumstance in circumstances for dishonest_int in dishonest_intentions)
-
-        # Breach of trust requires: trust relationship/circumstance + (dishonest action OR intention OR circumstance)
-        return (has_trust_relationship or has_trust_circumstance or has_trust_pattern) and (has_trust_action or has_dishonest_intention or has_dishonest_circumstance)
-
-    def _has_extortion_elements(self, entities: Dict[str, List[str]]) -> bool:
-        """Check if entities indicate extortion"""
-        actions = entities.get("actions", [])
-        circumstances = entities.get("circumstances", [])
-        intentions = entities.get("intentions", [])
-        methods = entities.get("methods", [])
-
-        # Extortion-specific indicators (including semantic mappings)
-        threat_actions = ["threatened", "blackmailed", "intimidated", "coerced", "forced", "demanded", "extorted", "pressured", "warned", "told"]
-        threat_methods = ["violence", "harm", "exposure", "reputation damage", "legal action", "physical harm"]
-        threat_circumstances = ["under threat", "fear", "pressure", "demanding money", "pay or else"]
-        threat_objects = ["money", "property", "compliance", "silence", "cooperation"]
-
-        # Check all entity types for threat indicators
-        all_text = " ".join(actions + circumstances + intentions + methods).lower()
-
-        has_threat_action = any(threat_action.lower() in action.lower() for action in actions for threat_action in threat_actions)
-        has_threat_method = any(threat_method.lower() in method.lower() for method in methods for threat_method in threat_methods)
-        has_threat_circumstance = any(threat_circ.lower() in circumstance.lower() for circumstance in circumstances for threat_circ in threat_circumstances)
-
-        # Also check for threat patterns in combined text
-        has_threat_pattern = any(pattern in all_text for pattern in threat_actions + threat_methods + threat_circumstances)
-
-        # Extortion requires threat indicators
-        return has_threat_action or has_threat_method or has_threat_circumstance or has_threat_pattern
-
-    def _has_trespass_elements(self, entities: Dict[str, List[str]]) -> bool:
-        """Check if entities indicate criminal trespass"""
-        actions = entities.get("actions", [])
-        locations = entities.get("locations", [])
-        circumstances = entities.get("circumstances", [])
-        intentions = entities.get("intentions", [])
-
-        # Trespass-specific indicators (including semantic mappings)
-        trespass_actions = ["entered", "broke into", "trespassed", "intruded", "invaded", "climbed over", "jumped over", "snuck into", "came inside", "went into", "accessed"]
-        trespass_locations = ["house", "home", "property", "land", "building", "apartment", "office", "compound", "premises", "yard", "garden", "roof"]
-        unlawful_circumstances = ["without permission", "unauthorized", "illegally", "unlawfully", "forcibly", "broke in", "climbed", "scaled", "fence", "wall", "gate", "boundary"]
-        trespass_intentions = ["to steal", "to commit", "unlawful purpose", "criminal intent"]
-
-        # Check all entity types for trespass indicators
-        all_text = " ".join(actions + locations + circumstances + intentions).lower()
-
-        has_trespass_action = any(trespass_action.lower() in action.lower() for action in actions for trespass_action in trespass_actions)
-        has_property_location = any(location.lower() in loc.lower() for loc in locations for location in trespass_locations)
-        has_unlawful_circumstance = any(unlawful_circ.lower() in circumstance.lower() for circumstance in circumstances for unlawful_circ in unlawful_circumstances)
-
-        # Also check for trespass patterns in combined text
-        has_trespass_pattern = any(pattern in all_text for pattern in trespass_actions + unlawful_circumstances)
-
-        # Criminal trespass requires entry action + property location OR unlawful circumstances
-        return (has_trespass_action and has_property_location) or has_unlawful_circumstance or has_trespass_pattern
-
-    def _has_mischief_elements(self, entities: Dict[str, List[str]]) -> bool:
-        """Check if entities indicate mischief (property damage)"""
-        actions = entities.get("actions", [])
-        objects = entities.get("objects", [])
-        circumstances = entities.get("circumstances", [])
-        intentions = entities.get("intentions", [])
-
-        # Mischief-specific indicators
-        damage_actions = ["damaged", "destroyed", "broke", "vandalized", "defaced", "demolished", "ruined", "smashed", "burnt", "torn", "cut", "scratched"]
-        property_objects = ["car", "vehicle", "window", "door", "wall", "fence", "property", "building", "house", "furniture", "equipment", "machine", "computer", "phone"]
-        damage_circumstances = ["intentionally", "deliberately", "maliciously", "willfully", "on purpose", "angry", "revenge"]
-        malicious_intentions = ["to harm", "to damage", "revenge", "anger", "spite", "malice"]
-
-        # Check all entity types for mischief indicators
-        all_text = " ".join(actions + objects + circumstances + intentions).lower()
-
-        has_damage_action = any(damage_action.lower() in action.lower() for action in actions for damage_action in damage_actions)
-        has_property_object = any(prop_obj.lower() in obj.lower() for obj in objects for prop_obj in property_objects)
-        has_damage_circumstance = any(damage_circ.lower() in circumstance.lower() for circumstance in circumstances for damage_circ in damage_circumstances)
-        has_malicious_intention = any(malicious_int.lower() in intention.lower() for intention in intentions for malicious_int in malicious_intentions)
-
-        # Also check for damage patterns in combined text
-        has_damage_pattern = any(pattern in all_text for pattern in damage_actions + damage_circumstances)
-
-        # Check for accidental indicators (should exclude mischief)
-        accidental_indicators = ["accidentally", "accidental", "by mistake", "unintentionally", "fell", "dropped", "slipped"]
-        has_accidental_indicator = any(acc_ind in all_text for acc_ind in accidental_indicators)
-
-        # Mischief requires intentional damage: (damage action + property object + intent) OR intentional circumstances
-        has_intentional_damage = has_damage_action and has_property_object and (has_damage_circumstance or has_malicious_intention)
+        if self.mode == "fallback":
+            return self._fallback_legal_reasoning(entities, fired_sections)
+
+        matched_rules = self._matched_rules(fired_sections)
+        if not matched_rules:
+            return []
+
+        if self.catalog.is_stale():
+            await self.refresh_catalog_async()
+
+        section_numbers = [rule["section_number"] for rule in matched_rules]
+
+        try:
+            if self.catalog.is_loaded:
+                section_records = self.catalog.get_records(section_numbers)
+            else:
+                async with self.session_async() as session:
+                    section_records = await self._fetch_sections_async(session, section_numbers)
+
+            return self._assemble_laws(matched_rules, section_records)
+
+        except Exception as e:
+            logger.error(f"Neo4j query failed, using fallback: {e}")
+            return self._fallback_legal_reasoning(entities, fired_sections)
+
+    def find_applicable_laws_batch(self, entity_sets: List[Dict[str, List[str]]]) -> List[List[Dict[str, Any]]]:
+        """
+        find_applicable_laws for many entity sets at once: rules are evaluated for the
+        whole batch first and every fired section is resolved in a single lookup
+        """
+        fired = [set(self.rule_engine.evaluate(entities)) for entities in entity_sets]
+        self.ensure_connected()
+
+        if self.mode == "fallback":
+            return [self._fallback_legal_reasoning(entities, sections) for entities, sections in zip(entity_sets, fired)]
+
+        matched = [self._matched_rules(sections) for sections in fired]
+        section_numbers = sorted({rule["section_number"] for rules in matched for rule in rules})
+        if not section_numbers:
+            return [[] for _ in entity_sets]
+
+        if self.catalog.is_stale():
+            self.refresh_catalog()
+
+        try:
+            if self.catalog.is_loaded:
+                section_records = self.catalog.get_records(section_numbers)
+            else:
+                with self.session() as session:
+                    section_records = self._fetch_sections(session, section_numbers)
+        except Exception as e:
+            logger.error(f"Neo4j batch query failed, using fallback: {e}")
+            return [self._fallback_legal_reasoning(entities, sections) for entities, sections in zip(entity_sets, fired)]
+
+        return [self._assemble_laws(rules, section_records) for rules in matched]
+
+    async def find_applicable_laws_batch_async(self, entity_sets: List[Dict[str, List[str]]]) -> List[List[Dict[str, Any]]]:
+        """Non-blocking variant of find_applicable_laws_batch"""
+        fired = [set(self.rule_engine.evaluate(entities)) for entities in entity_sets]
+        await self.ensure_connected_async()
+
+        if self.mode == "fallback":
+            return [self._fallback_legal_reasoning(entities, sections) for entities, sections in zip(entity_sets, fired)]
 
-        # Also allow strong damage actions that imply intent (like vandalized, defaced)
-        strong_damage_actions = ["vandalized", "defaced", "demolished", "smashed", "burnt"]
-        has_strong_damage_action = any(strong_action.lower() in action.lower() for action in actions for strong_action in strong_damage_actions)
-        has_strong_intentional_damage = has_strong_damage_action and has_property_object
-
-        # Exclude accidental damage
-        return (has_intentional_damage or has_strong_intentional_damage or has_damage_circumstance or has_malicious_intention) and not has_accidental_indicator
+        matched = [self._matched_rules(sections) for sections in fired]
+        section_numbers = sorted({rule["section_number"] for rules in matched for rule in rules})
+        if not section_numbers:
+            return [[] for _ in entity_sets]
 
-    def enhance_with_property_analysis(self, applicable_laws: List[Dict[str, Any]], entities: Dict[str, List[str]]) -> List[Dict[str, Any]]:
-        """Enhance legal analysis with property value considerations"""
+        if self.catalog.is_stale():
+            await self.refresh_catalog_async()
+
+        try:
+            if self.catalog.is_loaded:
+                section_records = self.catalog.get_records(section_numbers)
+            else:
+                async with self.session_async() as session:
+                    section_records = await self._fetch_sections_async(session, section_numbers)
+        except Exception as e:
+            logger.error(f"Neo4j batch query failed, using fallback: {e}")
+            return [self._fallback_legal_reasoning(entities, sections) for entities, sections in zip(entity_sets, fired)]
+
+        return [self._assemble_laws(rules, section_records) for rules in matched]
+
+    def _matched_rules(self, fired_sections) -> List[Dict[str, Any]]:
+        """Applicability rules whose section fired, in evaluation order"""
+        return [
+            rule for rule in APPLICABILITY_RULES
+            if rule["section_number"] in fired_sections
+        ]
+
+    def _assemble_laws(self, matched_rules: List[Dict[str, Any]], section_records: Dict[int, List[Dict[str, Any]]]) -> List[Dict[str, Any]]:
+        """One law entry per section record of every matched rule"""
+        applicable_laws = []
+        for rule in matched_rules:
+            for record in section_records.get(rule["section_number"], []):
+                applicable_laws.append(self._build_law(rule, record))
+        return applicable_laws
+
+    @NEO4J_QUERY_SECONDS.timed(query="section_lookup")
+    def _fetch_sections(self, session, section_numbers: List[int]) -> Dict[int, List[Dict[str, Any]]]:
+        """Fetch sections, offences and punishments for all matched rules in one read transaction"""
+        rows = session.execute_read(
+            self.pool.wait_timer(_read_sections, "sync"), list(dict.fromkeys(section_numbers))
+        )
+
+        records: Dict[int, List[Dict[str, Any]]] = {}
+        for data in rows:
+            records.setdefault(data["section_number"], []).append(data)
+        return records
+
+    @NEO4J_QUERY_SECONDS.timed(query="section_lookup")
+    async def _fetch_sections_async(self, session, section_numbers: List[int]) -> Dict[int, List[Dict[str, Any]]]:
+        """_fetch_sections() for an async session"""
+        rows = await session.execute_read(
+            self.pool.wait_timer(_read_sections_async, "async"), list(dict.fromkeys(section_numbers))
+        )
+
+        records: Dict[int, List[Dict[str, Any]]] = {}
+        for data in rows:
+            records.setdefault(data["section_number"], []).append(data)
+        return records
+
+    def _build_law(self, rule: Dict[str, Any], record: Dict[str, Any]) -> Dict[str, Any]:
+        """Combine a fired rule with its Neo4j section record"""
+        law = {
+            "section": record["section"],
+            "title": record["title"],
+            "description": record["description"] or rule["default_description"],
+            "punishment": record["punishment"],
+            "severity": record["severity"],
+            "offence_type": record["offence_type"],
+            "confidence": rule["confidence"],
+            "reasoning": rule["reasoning"]
+        }
+        law.update(rule.get("extra", {}))
+        return law
+    
+    def enhance_with_property_analysis(self, applicable_laws: List[Dict[str, Any]], entities: Dict[str, List[str]],
+                                       query: Optional[str] = None) -> List[Dict[str, Any]]:
+        """Enhance legal analysis with property value considerations, crediting amounts stated in the query"""
         enhanced_laws = []
 
         for law in applicable_laws:
@@ -551,9 +605,8 @@ class Neo4jService:
 
             # Special handling for Section 303 (Theft) - property value matters
             if law.get("section") == "BNS-303" and law.get("property_value_consideration"):
-                objects = entities.get("objects", [])
-                if objects:
-                    property_analysis = self.property_estimator.estimate_value(objects)
+                property_analysis = self.property_estimator.estimate_value(entities.get("objects", []), query=query)
+                if property_analysis["breakdown"]:
                     enhanced_law["property_analysis"] = property_analysis["breakdown"]
 
                     # Check if total value is below Rs.5,000 threshold
@@ -586,123 +639,49 @@ class Neo4jService:
         
         return max_confidence
     
-    def _fallback_legal_reasoning(self, entities: Dict[str, List[str]]) -> List[Dict[str, Any]]:
-        """Fallback legal reasoning when Neo4j is not available"""
-        applicable_laws = []
-        
-        # Rule-based fallback reasoning
-        if self._has_theft_elements(entities):
-            applicable_laws.append({
-                "section": "BNS-303",
-                "title": "Theft",
-                "description": "Taking movable property dishonestly without consent",
-                "punishment": "Imprisonment up to 3 years or fine or both",
-                "severity": "moderate",
-                "confidence": 0.8,
-                "reasoning": "Basic theft elements detected (fallback reasoning)"
-            })
-        
-        if self._has_dwelling_theft_elements(entities):
-            applicable_laws.append({
-                "section": "BNS-305",
-                "title": "Theft in dwelling house",
-                "description": "Theft committed in dwelling or custody place",
-                "punishment": "Imprisonment up to 7 years and fine",
-                "severity": "high", 
-                "confidence": 0.9,
-                "reasoning": "Dwelling theft detected (fallback reasoning)"
-            })
-        
-        if self._has_employee_theft_elements(entities):
-            applicable_laws.append({
-                "section": "BNS-306",
-                "title": "Theft by employee",
-                "description": "Theft by clerk/servant of employer's property",
-                "punishment": "Imprisonment up to 7 years and fine",
-                "severity": "high",
-                "confidence": 0.85,
-                "reasoning": "Employee theft detected (fallback reasoning)"
-            })
-
-        if self._has_snatching_elements(entities):
-            applicable_laws.append({
-                "section": "BNS-304",
-                "title": "Snatching",
-                "description": "Snatching involves sudden and forceful taking of property",
-                "punishment": "Imprisonment up to 3 years and fine",
-                "severity": "moderate",
-                "confidence": 0.85,
-                "reasoning": "Snatching elements detected (fallback reasoning)"
-            })
-
-        if self._has_cheating_elements(entities):
-            applicable_laws.append({
-                "section": "BNS-318",
-                "title": "Cheating",
-                "description": "Cheating involves dishonest inducement to deliver property or do/omit an act",
-                "punishment": "Imprisonment up to 7 years and fine",
-                "severity": "high",
-                "confidence": 0.9,
-                "reasoning": "Cheating elements detected (fallback reasoning)"
-            })
-
-        if self._has_breach_of_trust_elements(entities):
-            applicable_laws.append({
-                "section": "BNS-316",
-                "title": "Criminal breach of trust",
-                "description": "Criminal breach of trust involves dishonest misappropriation of entrusted property",
-                "punishment": "Imprisonment up to 7 years or fine or both",
-                "severity": "high",
-                "confidence": 0.9,
-                "reasoning": "Breach of trust elements detected (fallback reasoning)"
-            })
-
-        if self._has_extortion_elements(entities):
-            applicable_laws.append({
-                "section": "BNS-308",
-                "title": "Extortion",
-                "description": "Extortion involves threatening someone to obtain money, property, or compliance",
-                "punishment": "Imprisonment up to 7 years or fine or both",
-                "severity": "high",
-                "confidence": 0.9,
-                "reasoning": "Extortion elements detected (fallback reasoning)"
-            })
-
-        if self._has_trespass_elements(entities):
-            applicable_laws.append({
-                "section": "BNS-329",
-                "title": "Criminal trespass and house-trespass",
-                "description": "Criminal trespass involves unlawfully entering someone's property",
-                "punishment": "Imprisonment up to 3 months or fine up to Rs.5,000 or both",
-                "severity": "moderate",
-                "confidence": 0.85,
-                "reasoning": "Criminal trespass elements detected (fallback reasoning)"
-            })
-
-        if self._has_mischief_elements(entities):
-            applicable_laws.append({
-                "section": "BNS-324",
-                "title": "Mischief",
-                "description": "Mischief involves intentional damage or destruction of property",
-                "punishment": "Imprisonment up to 6 months or fine or both",
-                "severity": "moderate",
-                "confidence": 0.85,
-                "reasoning": "Mischief elements detected (fallback reasoning)"
-            })
-
-        return applicable_laws
+    def _fallback_legal_reasoning(self, entities: Dict[str, List[str]], fired_sections: Optional[set] = None) -> List[Dict[str, Any]]:
+        """Laws for the fired rules from the graph snapshot, when Neo4j cannot answer"""
+        reason = "query_failed" if self.available and self.driver else "neo4j_unavailable"
+        FALLBACK_REASONING_TOTAL.inc(reason=reason)
+        if fired_sections is None:
+            fired_sections = set(self.rule_engine.evaluate(entities))
+
+        snapshot = self.fallback_snapshot()
+        if snapshot is None:
+            logger.error("No graph snapshot or section source available, no laws can be cited")
+            return []
+        matched_rules = self._matched_rules(fired_sections)
+        section_records = snapshot.section_records(rule["section_number"] for rule in matched_rules)
+        return self._assemble_laws(matched_rules, section_records)
     
     def verify_legal_facts(self, analysis_result: Dict[str, Any]) -> Dict[str, Any]:
         """Verify legal analysis against knowledge base"""
         # This would cross-check the analysis results against the knowledge graph
         # For now, return the analysis as-is with verification flag
-        analysis_result["verified"] = True if self.available else False
-        analysis_result["verification_notes"] = (
-            "Analysis verified against BNS knowledge base" if self.available 
-            else "Fallback reasoning used - Neo4j not available"
-        )
+        analysis_result["verified"] = self.mode != "fallback"
+        analysis_result["verification_notes"] = {
+            "graph": "Analysis verified against BNS knowledge base",
+            "snapshot": "Analysis verified against BNS knowledge base snapshot",
+        }.get(self.mode, "Fallback reasoning used - Neo4j not available")
         return analysis_result
 
 
-# Global Neo4j service instance
-neo4j_service = Neo4jService()
\ No newline at end of file
+_neo4j_service: Optional[Neo4jService] = None
+
+
+def get_neo4j_service() -> Neo4jService:
+    """Process-wide Neo4j service, created on first call without connecting"""
+    global _neo4j_service
+    if _neo4j_service is None:
+        _neo4j_service = Neo4jService()
+    return _neo4j_service
+
+
+def __getattr__(name: str):
+    # Backward compatible global: `from app.services.neo4j_service import neo4j_service`
+    # returns the shared service, connected as the old import-time instance was
+    if name == "neo4j_service":
+        service = get_neo4j_service()
+        service.ensure_connected()
+        return service
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
\ No newline at end of file
@@ -2,16 +2,48 @@
 Ollama Service for Phi-3 SLM Integration
 Handles Entity Extraction and Template Response Formation
 """
+import asyncio
 import requests
 import json
-from typing import Dict, List, Any, Optional, Tuple
+import time
+try:
+    import httpx
+    HTTPX_AVAILABLE = True
+except ImportError:
+    HTTPX_AVAILABLE = False
+    httpx = None
+
+from typing import AsyncIterator, Dict, List, Any, Optional, Tuple
 import logging
 from app.core.config import settings
+from app.core.metrics import OLLAMA_REQUEST_SECONDS
 from app.services.property_value_estimator import PropertyValueEstimator
+from app.services.keyword_matcher import AhoCorasickMatcher, KeywordHit
 
 logger = logging.getLogger(__name__)
 
 
+# Keyword lists for fallback entity extraction, in reporting order per category
+ENTITY_KEYWORDS = {
+    "persons": ["victim", "accused", "employee", "employer", "person", "someone", "i", "me", "my"],
+    "objects": ["phone", "mobile", "iphone", "smartphone", "laptop", "computer", "wallet", "money", "cash", "property", "bag", "jewelry", "purse", "chain", "necklace", "earrings", "watch", "bracelet", "funds", "account", "assets", "car", "vehicle", "window", "door", "wall", "fence", "furniture", "equipment", "machine", "handbag", "bicycle", "ring", "flowerpot", "stones"],
+    "actions": ["took", "stole", "grabbed", "snatched", "entered", "threatened", "broke into", "stolen", "theft", "stealing", "cheated", "deceived", "defrauded", "scammed", "tricked", "misled", "promised", "lied", "fraudulently", "misappropriated", "misused", "betrayed", "embezzled", "used", "blackmailed", "intimidated", "coerced", "forced", "demanded", "extorted", "trespassed", "intruded", "invaded", "climbed over", "jumped over", "snuck into", "damaged", "destroyed", "broke", "vandalized", "defaced", "demolished", "ruined", "smashed", "burnt", "torn", "cut", "scratched", "pulled", "yanked", "jerked", "ripped", "convinced", "borrowed", "took away", "came inside", "walked around", "threw", "made dents", "spent", "kept"],
+    "locations": ["house", "home", "apartment", "office", "street", "building", "shop", "room", "residence", "property", "land", "compound", "premises", "yard", "garden", "roof"],
+    "circumstances": ["night", "sleeping", "dark", "alone", "forcibly", "secretly", "suddenly", "quickly", "fast", "running", "speeding", "motorcycle", "bike", "scooter", "online", "phone call", "fake website", "false documents", "impersonation", "lottery", "prize", "investment", "loan", "credit card", "bank account", "otp", "atm", "bank", "pretending", "called", "entrusted", "managing", "handling", "responsible", "in charge", "unauthorized", "personal", "dishonest", "under threat", "fear", "pressure", "demanding money", "pay or else", "violence", "harm", "reputation damage", "legal action", "physical harm", "without permission", "illegally", "unlawfully", "climbed", "scaled", "fence", "wall", "gate", "boundary", "intentionally", "deliberately", "maliciously", "willfully", "on purpose", "angry", "revenge", "came fast", "walking", "uninvited", "charity", "never returned", "vacation", "multiple requests"],
+    "relationships": ["agent", "manager", "director", "trustee", "partner", "employee", "employer", "guardian", "executor", "fiduciary"],
+}
+
+# Keywords reported under a different entity value
+ENTITY_LABELS = {("persons", keyword): "victim" for keyword in ["i", "me", "my"]}
+
+# Built once per process; hits carry (category, rank within the category list)
+ENTITY_KEYWORD_MATCHER = AhoCorasickMatcher(
+    (keyword, (category, rank))
+    for category, keywords in ENTITY_KEYWORDS.items()
+    for rank, keyword in enumerate(keywords)
+)
+
+
 class OllamaService:
     """Service for Ollama Phi-3 model integration"""
     
@@ -19,6 +51,7 @@ class OllamaService:
         self.base_url = settings.OLLAMA_BASE_URL
         self.model = settings.OLLAMA_MODEL
         self.session = requests.Session()
+        self.async_client = None  # created on first use inside the event loop
         self.value_estimator = PropertyValueEstimator()
     
     def is_available(self) -> bool:
@@ -30,6 +63,17 @@ class OllamaService:
             logger.error(f"Ollama service unavailable: {e}")
             return False
     
+    async def ping_async(self, timeout: float = 2.0) -> Optional[str]:
+        """Cheap liveness ping via /api/version (no generation), returns the Ollama version"""
+        if not HTTPX_AVAILABLE:
+            response = await asyncio.to_thread(self.session.get, f"{self.base_url}/api/version", timeout=timeout)
+        else:
+            response = await self._get_async_client().get("/api/version", timeout=timeout)
+
+        if response.status_code != 200:
+            raise Exception(f"Ollama API error: {response.status_code}")
+        return response.json().get("version")
+    
     def extract_entities(self, user_query: str, language: str = "en") -> Dict[str, List[str]]:
         """
         Extract factual entities from user query using Phi-3
@@ -40,13 +84,9 @@ class OllamaService:
         logger.info("Using fallback entity extraction for demo reliability")
         entities = self._extract_entities_fallback(user_query.lower())
 
-        # Add property value estimation for objects
-        if "objects" in entities and entities["objects"]:
-            property_items = entities["objects"]
-
-            # Estimate property values
-            value_analysis = self.value_estimator.estimate_value(property_items)
-
+        # Add property value estimation for objects, and for cash amounts stated without one
+        value_analysis = self.value_estimator.estimate_value(entities.get("objects", []), query=user_query)
+        if value_analysis["breakdown"]:
             # Add value information to entities
             entities["property_value_analysis"] = value_analysis
 
@@ -65,26 +105,73 @@ class OllamaService:
         #     logger.error(f"Entity extraction failed: {e}")
         #     return self._get_empty_entities()
     
+    async def extract_entities_async(self, user_query: str, language: str = "en") -> Dict[str, List[str]]:
+        """
+        Async variant of extract_entities for the event-loop pipeline
+        Fallback extraction is CPU-only keyword matching, so it runs inline without a thread hop
+        """
+        return self.extract_entities(user_query, language)
+
     def format_legal_response(self, legal_analysis: Dict[str, Any], language: str = "en") -> str:
         """
         Generate citizen-friendly response from Neo4j legal analysis
         Uses template-based approach with Phi-3 for natural language generation
         """
 
-        # For demo reliability, skip Phi-3 and use improved fallback directly
-        logger.info("Using fallback response for demo reliability")
-        return self._get_fallback_response(legal_analysis, language)
+        if not settings.OLLAMA_RESPONSE_FORMATTING:
+            # For demo reliability, skip Phi-3 and use improved fallback directly
+            logger.info("Using fallback response for demo reliability")
+            return self._get_fallback_response(legal_analysis, language)
 
-        # Original Phi-3 code (commented for demo)
-        # prompt = self._create_response_template_prompt(legal_analysis, language)
-        # try:
-        #     response = self._call_ollama(prompt)
-        #     formatted_response = self._clean_response_text(response)
-        #     logger.info("Generated citizen-friendly legal response")
-        #     return formatted_response
-        # except Exception as e:
-        #     logger.error(f"Response formatting failed: {e}")
-        #     return self._get_fallback_response(legal_analysis, language)
+        prompt = self._create_response_template_prompt(legal_analysis, language)
+        try:
+            response = self._call_ollama(prompt)
+            formatted_response = self._clean_response_text(response)
+            logger.info("Generated citizen-friendly legal response")
+            return formatted_response
+        except Exception as e:
+            logger.error(f"Response formatting failed: {e}")
+            return self._get_fallback_response(legal_analysis, language)
+
+    async def format_legal_response_async(self, legal_analysis: Dict[str, Any], language: str = "en") -> str:
+        """Async variant of format_legal_response; Phi-3 calls go through _call_ollama_async"""
+
+        if not settings.OLLAMA_RESPONSE_FORMATTING:
+            # For demo reliability, skip Phi-3 and use improved fallback directly
+            logger.info("Using fallback response for demo reliability")
+            return self._get_fallback_response(legal_analysis, language)
+
+        prompt = self._create_response_template_prompt(legal_analysis, language)
+        try:
+            response = await self._call_ollama_async(prompt)
+            formatted_response = self._clean_response_text(response)
+            logger.info("Generated citizen-friendly legal response")
+            return formatted_response
+        except Exception as e:
+            logger.error(f"Response formatting failed: {e}")
+            return self._get_fallback_response(legal_analysis, language)
+
+    async def stream_legal_response(self, legal_analysis: Dict[str, Any], language: str = "en") -> AsyncIterator[str]:
+        """
+        Yield the citizen-friendly response in chunks as Phi-3 generates it
+        The templated fallback response is yielded as a single chunk
+        """
+        if not settings.OLLAMA_RESPONSE_FORMATTING:
+            yield self._get_fallback_response(legal_analysis, language)
+            return
+
+        prompt = self._create_response_template_prompt(legal_analysis, language)
+        streamed = False
+        try:
+            async for token in self._stream_ollama_async(prompt):
+                streamed = True
+                yield token
+        except Exception as e:
+            if streamed:
+                # Part of the answer is already with the client, let the caller report it
+                raise
+            logger.error(f"Response streaming failed: {e}")
+            yield self._get_fallback_response(legal_analysis, language)
     
     def _create_entity_extraction_prompt(self, user_query: str, language: str) -> str:
         """Create prompt for factual entity extraction"""
@@ -280,22 +367,25 @@ Generate the comprehensive legal guidance:"""
         
         return prompt
     
-    def _call_ollama(self, prompt: str) -> str:
-        """Make API call to Ollama"""
-        payload = {
+    def _generate_payload(self, prompt: str, stream: bool = False) -> Dict[str, Any]:
+        """Request body for /api/generate, shared by the sync and async clients"""
+        return {
             "model": self.model,
             "prompt": prompt,
-            "stream": False,
+            "stream": stream,
             "options": {
                 "temperature": 0.1,  # Low temperature for consistency
                 "top_p": 0.9,
                 "num_predict": 800
             }
         }
-        
+
+    @OLLAMA_REQUEST_SECONDS.timed(operation="generate")
+    def _call_ollama(self, prompt: str) -> str:
+        """Make API call to Ollama"""
         response = self.session.post(
             f"{self.base_url}/api/generate",
-            json=payload,
+            json=self._generate_payload(prompt),
             timeout=20  # Reduced timeout for demo
         )
         
@@ -304,6 +394,62 @@ Generate the comprehensive legal guidance:"""
             return result.get("response", "")
         else:
             raise Exception(f"Ollama API error: {response.status_code}")
+
+    def _get_async_client(self):
+        """Shared httpx client so connections to Ollama are pooled across requests"""
+        if self.async_client is None:
+            self.async_client = httpx.AsyncClient(base_url=self.base_url, timeout=20)
+        return self.async_client
+
+    async def _call_ollama_async(self, prompt: str) -> str:
+        """Make non-blocking API call to Ollama"""
+        if not HTTPX_AVAILABLE:
+            # Without httpx keep the event loop free by running the blocking client in a worker thread
+            return await asyncio.to_thread(self._call_ollama, prompt)
+
+        with OLLAMA_REQUEST_SECONDS.time(operation="generate"):
+            response = await self._get_async_client().post("/api/generate", json=self._generate_payload(prompt))
+
+        if response.status_code == 200:
+            result = response.json()
+            return result.get("response", "")
+        else:
+            raise Exception(f"Ollama API error: {response.status_code}")
+
+    async def _stream_ollama_async(self, prompt: str) -> AsyncIterator[str]:
+        """Stream response tokens from Ollama's newline-delimited JSON generate API"""
+        if not HTTPX_AVAILABLE:
+            yield await self._call_ollama_async(prompt)
+            return
+
+        payload = self._generate_payload(prompt, stream=True)
+        start = time.perf_counter()
+        async with self._get_async_client().stream("POST", "/api/generate", json=payload) as response:
+            if response.status_code != 200:
+                raise Exception(f"Ollama API error: {response.status_code}")
+
+            first_token = True
+            async for line in response.aiter_lines():
+                if not line.strip():
+                    continue
+                chunk = json.loads(line)
+                if chunk.get("error"):
+                    raise Exception(f"Ollama API error: {chunk['error']}")
+                if chunk.get("response"):
+                    if first_token:
+                        OLLAMA_REQUEST_SECONDS.observe(time.perf_counter() - start, operation="stream_first_token")
+                        first_token = False
+                    yield chunk["response"]
+                if chunk.get("done"):
+                    break
+
+        OLLAMA_REQUEST_SECONDS.observe(time.perf_counter() - start, operation="stream")
+
+    async def aclose(self):
+        """Close the async HTTP client"""
+        if self.async_client is not None:
+            await self.async_client.aclose()
+            self.async_client = None
     
     def _parse_entity_response(self, response: str) -> Dict[str, List[str]]:
         """Parse entity extraction response from Phi-3"""
@@ -372,46 +518,30 @@ Generate the comprehensive legal guidance:"""
         """Enhanced fallback entity extraction using keyword matching"""
         entities = self._get_empty_entities()
 
-        response_lower = response.lower()
-
-        # Enhanced keyword matching for common demo scenarios
-        person_keywords = ["victim", "accused", "employee", "employer", "person", "someone", "i", "me", "my"]
-        object_keywords = ["phone", "mobile", "iphone", "smartphone", "laptop", "computer", "wallet", "money", "cash", "property", "bag", "jewelry", "purse", "chain", "necklace", "earrings", "watch", "bracelet", "funds", "account", "assets", "car", "vehicle", "window", "door", "wall", "fence", "furniture", "equipment", "machine", "handbag", "bicycle", "ring", "flowerpot", "stones"]
-        action_keywords = ["took", "stole", "grabbed", "snatched", "entered", "threatened", "broke into", "stolen", "theft", "stealing", "cheated", "deceived", "defrauded", "scammed", "tricked", "misled", "promised", "lied", "fraudulently", "misappropriated", "misused", "betrayed", "embezzled", "used", "blackmailed", "intimidated", "coerced", "forced", "demanded", "extorted", "trespassed", "intruded", "invaded", "climbed over", "jumped over", "snuck into", "damaged", "destroyed", "broke", "vandalized", "defaced", "demolished", "ruined", "smashed", "burnt", "torn", "cut", "scratched", "pulled", "yanked", "jerked", "ripped", "convinced", "borrowed", "took away", "came inside", "walked around", "threw", "made dents", "spent", "kept"]
-        location_keywords = ["house", "home", "apartment", "office", "street", "building", "shop", "room", "residence", "property", "land", "compound", "premises", "yard", "garden", "roof"]
-        circumstance_keywords = ["night", "sleeping", "dark", "alone", "forcibly", "secretly", "suddenly", "quickly", "fast", "running", "speeding", "motorcycle", "bike", "scooter", "online", "phone call", "fake website", "false documents", "impersonation", "lottery", "prize", "investment", "loan", "credit card", "bank account", "OTP", "ATM", "bank", "pretending", "called", "entrusted", "managing", "handling", "responsible", "in charge", "unauthorized", "personal", "dishonest", "under threat", "fear", "pressure", "demanding money", "pay or else", "violence", "harm", "reputation damage", "legal action", "physical harm", "without permission", "illegally", "unlawfully", "climbed", "scaled", "fence", "wall", "gate", "boundary", "intentionally", "deliberately", "maliciously", "willfully", "on purpose", "angry", "revenge", "came fast", "walking", "uninvited", "charity", "never returned", "vacation", "multiple requests"]
-        relationship_keywords = ["agent", "manager", "director", "trustee", "partner", "employee", "employer", "guardian", "executor", "fiduciary"]
-
-        # More sophisticated matching
-        for keyword in person_keywords:
-            if keyword in response_lower:
-                entities["persons"].append("victim" if keyword in ["i", "me", "my"] else keyword)
-
-        for keyword in object_keywords:
-            if keyword in response_lower:
-                entities["objects"].append(keyword)
-
-        for keyword in action_keywords:
-            if keyword in response_lower:
-                entities["actions"].append(keyword)
+        # Single pass over the text; collect the keyword ranks found per category
+        found_ranks: Dict[str, set] = {}
+        for category, rank in ENTITY_KEYWORD_MATCHER.payloads(response):
+            found_ranks.setdefault(category, set()).add(rank)
 
-        for keyword in location_keywords:
-            if keyword in response_lower:
-                entities["locations"].append(keyword)
-
-        for keyword in circumstance_keywords:
-            if keyword in response_lower:
-                entities["circumstances"].append(keyword)
-
-        for keyword in relationship_keywords:
-            if keyword in response_lower:
-                entities["relationships"].append(keyword)
+        # Report keywords in their declared order, as the per-keyword scan did
+        for category, ranks in found_ranks.items():
+            keywords = ENTITY_KEYWORDS[category]
+            for rank in sorted(ranks):
+                keyword = keywords[rank]
+                entities[category].append(ENTITY_LABELS.get((category, keyword), keyword))
 
         # Remove duplicates while preserving order
         for category in entities:
             entities[category] = list(dict.fromkeys(entities[category]))
 
         return entities
+
+    def find_entity_mentions(self, text: str) -> List[KeywordHit]:
+        """Every entity keyword occurrence with its category and position in the text"""
+        return [
+            hit._replace(payload=hit.payload[0])
+            for hit in ENTITY_KEYWORD_MATCHER.iter_matches(text)
+        ]
     
     def _clean_response_text(self, response: str) -> str:
         """Clean and format the response text"""
@@ -550,5 +680,19 @@ Generate the comprehensive legal guidance:"""
             }
 
 
-# Global Ollama service instance
-ollama_service = OllamaService()
\ No newline at end of file
+_ollama_service: Optional[OllamaService] = None
+
+
+def get_ollama_service() -> OllamaService:
+    """Process-wide Ollama service, created on first call"""
+    global _ollama_service
+    if _ollama_service is None:
+        _ollama_service = OllamaService()
+    return _ollama_service
+
+
+def __getattr__(name: str):
+    # Backward compatible global: `from app.services.ollama_service import ollama_service`
+    if name == "ollama_service":
+        return get_ollama_service()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
\ No newline at end of file
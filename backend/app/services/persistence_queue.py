@@ -0,0 +1,355 @@
+"""
+Write-Behind Persistence Queue
+Accepts completed legal query results off the request path and inserts them into
+legal_queries in batches from a background thread
+"""
+import json
+import logging
+import os
+import queue
+import threading
+import time
+from datetime import datetime, timezone
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from app.core.config import settings
+from app.core.metrics import (
+    PERSISTENCE_BATCH_ROWS, PERSISTENCE_FLUSH_SECONDS, PERSISTENCE_LAG_SECONDS, PERSISTENCE_QUEUE_DEPTH,
+    PERSISTENCE_ROWS_TOTAL
+)
+from app.services.stored_query_cache import stored_query_cache
+
+logger = logging.getLogger(__name__)
+
+MAX_RETRY_BACKOFF = 30.0  # seconds between attempts while the database stays down
+
+
+def legal_query_row(
+    query_id: str,
+    query_text: str,
+    language: str,
+    entities: Dict[str, Any],
+    applicable_laws: List[Dict[str, Any]],
+    legal_advice: str,
+    confidence_score: float,
+    processing_time: float,
+    user_id: Optional[str] = None,
+    verified: bool = False,
+    created_at: Optional[datetime] = None
+) -> Dict[str, Any]:
+    """Column values of one legal_queries row, as stored by DatabaseService.save_legal_query"""
+    return {
+        "query_id": query_id,
+        "user_id": user_id,
+        "query_text": query_text,
+        "language": language,
+        "extracted_entities": entities,
+        "applicable_laws": applicable_laws,
+        "legal_advice": legal_advice,
+        "confidence_score": confidence_score,
+        "processing_time": processing_time,
+        "verified": verified,
+        # Stamped when the result completes, not when the batch reaches the database
+        "created_at": created_at or datetime.now(timezone.utc)
+    }
+
+
+def _insert_statement(engine, table):
+    """
+    Batch insert that skips rows already stored and returns the query_ids it inserted
+
+    A batch whose commit outcome is unknown is sent again, so inserts must be idempotent on query_id.
+    """
+    from app.models.database import dialect_insert
+
+    return dialect_insert(engine, table).on_conflict_do_nothing(index_elements=["query_id"]).returning(table.c.query_id)
+
+
+class PersistenceQueue:
+    """
+    Bounded write-behind queue for legal_queries rows
+
+    Producers hand rows to submit() and return immediately; a worker thread groups them
+    into batches of up to batch_size, waiting at most flush_interval for a batch to fill,
+    and writes each batch with one executemany insert. Memory is bounded by max_size queued
+    rows plus the batch in flight. submit() is called from the event loop, so it never
+    waits: when the queue is full the row is dropped at once and counted (load shedding
+    rather than backpressure, so a slow database never slows requests down). Failed batches
+    are retried with backoff; rows still unwritten at shutdown are spilled to a JSON lines
+    file and replayed on the next start, so every accepted row is written at least once.
+    """
+
+    def __init__(
+        self,
+        engine=None,
+        table=None,
+        on_insert: Optional[Callable[[Any, List[Dict[str, Any]]], None]] = None,
+        before_insert: Optional[Callable[[Any, List[Dict[str, Any]]], None]] = None,
+        enabled: Optional[bool] = None,
+        max_size: Optional[int] = None,
+        batch_size: Optional[int] = None,
+        flush_interval: Optional[float] = None,
+        spill_path: Optional[str] = None
+    ):
+        self.engine = engine
+        self.table = table
+        self.on_insert = on_insert  # called with the connection and the rows a batch inserted, before commit
+        self.before_insert = before_insert  # called with the connection and a batch's rows, before the insert
+        self.enabled = settings.PERSISTENCE_ENABLED if enabled is None else enabled
+        self.max_size = settings.PERSISTENCE_QUEUE_SIZE if max_size is None else max_size
+        self.batch_size = settings.PERSISTENCE_BATCH_SIZE if batch_size is None else batch_size
+        self.flush_interval = settings.PERSISTENCE_FLUSH_INTERVAL if flush_interval is None else flush_interval
+        self.spill_path = settings.PERSISTENCE_SPILL_PATH if spill_path is None else spill_path
+
+        self._queue: "queue.Queue[Tuple[float, Dict[str, Any]]]" = queue.Queue(maxsize=self.max_size)
+        self._pending: List[Dict[str, Any]] = []  # batch taken off the queue but not yet written
+        self._stopping = threading.Event()
+        self._deadline: Optional[float] = None
+        self._thread: Optional[threading.Thread] = None
+        self._insert = None
+        self.written = 0
+        self.dropped = 0
+        self.failed_flushes = 0
+
+    @property
+    def running(self) -> bool:
+        return self._thread is not None and self._thread.is_alive() and not self._stopping.is_set()
+
+    def depth(self) -> int:
+        """Rows accepted but not yet written"""
+        return self._queue.qsize() + len(self._pending)
+
+    def start(self) -> bool:
+        """Resolve the database, replay rows spilled by the last shutdown and start the worker"""
+        if not self.enabled or self.running:
+            return self.running
+        try:
+            if self.engine is None:
+                from app.models.database import engine
+                self.engine = engine
+            if self.table is None:
+                from app.models.user_models import LegalQuery
+                from app.services.database_service import database_service
+                self.table = LegalQuery.__table__
+                self.on_insert = self.on_insert or database_service.record_stored_queries
+                self.before_insert = self.before_insert or database_service.ensure_users
+            self._insert = _insert_statement(self.engine, self.table)
+        except Exception as e:
+            logger.error(f"Query persistence disabled, database unavailable: {e}")
+            return False
+
+        self._pending = self._load_spill()
+        self._stopping.clear()
+        self._deadline = None
+        self._thread = threading.Thread(target=self._run, name="persistence-queue", daemon=True)
+        self._thread.start()
+        logger.info(f"Query persistence started ({len(self._pending)} spilled rows replayed)")
+        return True
+
+    def submit(self, row: Dict[str, Any]) -> bool:
+        """
+        Queue a row for writing
+
+        Returns:
+            False when the queue is not running, or was full and the row was dropped
+        """
+        if not self.running:
+            return False
+        try:
+            self._queue.put_nowait((time.monotonic(), row))
+            PERSISTENCE_QUEUE_DEPTH.set(self.depth())
+            return True
+        except queue.Full:
+            self.dropped += 1
+            PERSISTENCE_ROWS_TOTAL.inc(outcome="dropped")
+            logger.warning(f"Persistence queue full ({self.max_size} rows), dropped query {row.get('query_id')}")
+            return False
+
+    def stop(self, timeout: Optional[float] = None) -> int:
+        """
+        Flush everything queued, giving up on the database after timeout seconds
+
+        Returns:
+            Number of rows spilled to disk because they could not be written in time
+        """
+        timeout = settings.PERSISTENCE_SHUTDOWN_TIMEOUT if timeout is None else timeout
+        if self._thread is None:
+            return 0
+
+        self._deadline = time.monotonic() + timeout
+        self._stopping.set()
+        self._thread.join(timeout + self.flush_interval + 1)
+        if self._thread.is_alive():
+            logger.error("Persistence worker did not stop in time, spilling without it")
+        self._thread = None
+
+        remaining = self._pending + [row for _, row in self._drain()]
+        self._pending = []
+        self._write_spill(remaining)
+        logger.info(f"Query persistence stopped: {self.written} rows written, {len(remaining)} spilled")
+        return len(remaining)
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "running": self.running,
+            "depth": self.depth(),
+            "max_size": self.max_size,
+            "written": self.written,
+            "dropped": self.dropped,
+            "failed_flushes": self.failed_flushes
+        }
+
+    def _run(self):
+        backoff = self.flush_interval
+        while True:
+            if not self._pending:
+                self._pending = self._take_batch()
+            if not self._pending:
+                if self._stopping.is_set():
+                    return
+                continue
+
+            if self._flush(self._pending):
+                self._pending = []
+                backoff = self.flush_interval
+                PERSISTENCE_QUEUE_DEPTH.set(self.depth())
+                continue
+
+            if self._stopping.is_set():
+                remaining = self._deadline - time.monotonic()
+                if remaining <= 0:
+                    return  # stop() spills what is left
+                time.sleep(min(self.flush_interval, remaining))
+            else:
+                # Cut short by stop() so shutdown retries at once
+                self._stopping.wait(backoff)
+                backoff = min(backoff * 2, MAX_RETRY_BACKOFF)
+
+    def _take_batch(self) -> List[Dict[str, Any]]:
+        """Up to batch_size rows, waiting at most flush_interval after the first one for more"""
+        try:
+            batch = [self._queue.get(timeout=self.flush_interval)]
+        except queue.Empty:
+            return []
+
+        linger_until = time.monotonic() + self.flush_interval
+        while len(batch) < self.batch_size:
+            try:
+                batch.append(self._queue.get_nowait())
+            except queue.Empty:
+                remaining = linger_until - time.monotonic()
+                if remaining <= 0 or self._stopping.is_set():
+                    break
+                try:
+                    batch.append(self._queue.get(timeout=remaining))
+                except queue.Empty:
+                    break
+        return [self._with_enqueue_time(item) for item in batch]
+
+    @staticmethod
+    def _with_enqueue_time(item: Tuple[float, Dict[str, Any]]) -> Dict[str, Any]:
+        enqueued_at, row = item
+        return dict(row, _enqueued_at=enqueued_at)
+
+    def _flush(self, batch: List[Dict[str, Any]]) -> bool:
+        from sqlalchemy.exc import IntegrityError
+
+        rows = [{key: value for key, value in row.items() if key != "_enqueued_at"} for row in batch]
+        start = time.perf_counter()
+        try:
+            with self.engine.begin() as connection:
+                self._insert_rows(connection, rows)
+        except IntegrityError as e:
+            # One bad row (e.g. a NOT NULL violation) fails the whole batch; isolate it instead of retrying forever
+            logger.warning(f"Batch of {len(rows)} rows rejected ({e.orig}), writing rows one at a time")
+            written = self._flush_rows(rows)
+            self._record(batch, written, start)
+            return True
+        except Exception as e:
+            self.failed_flushes += 1
+            PERSISTENCE_ROWS_TOTAL.inc(len(rows), outcome="retried")
+            logger.error(f"Persisting {len(rows)} queries failed, will retry: {getattr(e, 'orig', None) or e}")
+            return False
+
+        self._record(batch, len(rows), start)
+        return True
+
+    def _insert_rows(self, connection, rows: List[Dict[str, Any]]):
+        if self.before_insert:
+            self.before_insert(connection, rows)
+        inserted = set(connection.execute(self._insert, rows).scalars())
+        if self.on_insert and inserted:
+            # Rows skipped as already stored were counted when they were first written
+            self.on_insert(connection, [row for row in rows if row["query_id"] in inserted])
+
+    def _flush_rows(self, rows: List[Dict[str, Any]]) -> int:
+        from sqlalchemy.exc import IntegrityError
+
+        written = 0
+        for row in rows:
+            try:
+                with self.engine.begin() as connection:
+                    self._insert_rows(connection, [row])
+                written += 1
+            except IntegrityError as e:
+                self.dropped += 1
+                PERSISTENCE_ROWS_TOTAL.inc(outcome="rejected")
+                # The result was cached when it was submitted; it will never be in the database
+                stored_query_cache.invalidate(row["query_id"])
+                logger.error(f"Query {row['query_id']} rejected by the database: {e.orig}")
+        return written
+
+    def _record(self, batch: List[Dict[str, Any]], written: int, start: float):
+        now = time.monotonic()
+        self.written += written
+        PERSISTENCE_FLUSH_SECONDS.observe(time.perf_counter() - start)
+        PERSISTENCE_BATCH_ROWS.observe(len(batch))
+        PERSISTENCE_ROWS_TOTAL.inc(written, outcome="written")
+        for row in batch:
+            if "_enqueued_at" in row:  # replayed rows were queued by an earlier process
+                PERSISTENCE_LAG_SECONDS.observe(now - row["_enqueued_at"])
+
+    def _drain(self) -> List[Tuple[float, Dict[str, Any]]]:
+        items = []
+        while True:
+            try:
+                items.append(self._queue.get_nowait())
+            except queue.Empty:
+                return items
+
+    def _load_spill(self) -> List[Dict[str, Any]]:
+        """Rows left by the last shutdown; the file is kept until a later shutdown finds nothing left"""
+        if not self.spill_path or not os.path.exists(self.spill_path):
+            return []
+        rows = []
+        with open(self.spill_path, encoding="utf-8") as f:
+            for line in f:
+                if line.strip():
+                    row = json.loads(line)
+                    row["created_at"] = datetime.fromisoformat(row["created_at"])
+                    rows.append(row)
+        return rows
+
+    def _write_spill(self, rows: List[Dict[str, Any]]):
+        if not self.spill_path:
+            if rows:
+                logger.error(f"{len(rows)} unwritten queries lost, PERSISTENCE_SPILL_PATH is not set")
+            return
+        if not rows:
+            if os.path.exists(self.spill_path):
+                os.remove(self.spill_path)
+            return
+
+        tmp_path = f"{self.spill_path}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            for row in rows:
+                row = {key: value for key, value in row.items() if key != "_enqueued_at"}
+                row["created_at"] = row["created_at"].isoformat()
+                f.write(json.dumps(row) + "\n")
+        os.replace(tmp_path, self.spill_path)
+        PERSISTENCE_ROWS_TOTAL.inc(len(rows), outcome="spilled")
+        logger.warning(f"{len(rows)} unwritten queries spilled to {self.spill_path}")
+
+
+# Global persistence queue, started and drained by the FastAPI lifespan
+persistence_queue = PersistenceQueue()
@@ -2,75 +2,169 @@
 Property Value Estimation Service for Legal Processing
 Estimates market value of stolen/damaged property when not explicitly mentioned
 """
-from typing import Dict, Tuple, List
+from typing import Dict, FrozenSet, Tuple, List, Optional
 import re
 from enum import Enum
 
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    NUMPY_AVAILABLE = False
+    np = None
+
+from app.services.amount_parser import extract_amounts, money_amounts
+from app.services.keyword_matcher import AhoCorasickMatcher
+
 class ValueConfidence(Enum):
     HIGH = "high"      # Specific model/brand mentioned
     MEDIUM = "medium"  # General item type with some details
     LOW = "low"        # Vague description
 
+
+HIGH, MEDIUM, LOW = ValueConfidence.HIGH, ValueConfidence.MEDIUM, ValueConfidence.LOW
+MENTIONED_AMOUNT = "use_exact_value"  # price row answered by the amount written in the text
+
+# Property value database (in rupees). Categories are tried in order and selected by any of their
+# keywords; within a category the first price row whose terms are all present wins. A term is a
+# keyword or a tuple of alternative keywords, and a row without terms is the category default.
+# Keywords match anywhere in the text, so "14" also matches "14 pro" and "card" also matches "cards".
+VALUE_DATABASE = {
+    # Electronics
+    "mobile_phone": {
+        "keywords": ("iphone", "phone", "mobile"),
+        "prices": [
+            (("iphone", "14"), 79000, HIGH, "iPhone 14 market price"),
+            (("iphone", "13"), 65000, HIGH, "iPhone 13 market price"),
+            (("iphone", "12"), 55000, HIGH, "iPhone 12 market price"),
+            (("iphone",), 60000, MEDIUM, "Generic iPhone price"),
+            (("samsung", ("s24", "s23")), 65000, HIGH, "Samsung flagship price"),
+            (("samsung",), 30000, MEDIUM, "Samsung mid-range price"),
+            ((), 25000, LOW, "Generic smartphone price"),
+        ],
+    },
+    "laptop": {
+        "keywords": ("laptop", "macbook", "computer"),
+        "prices": [
+            (("macbook", "pro"), 150000, HIGH, "MacBook Pro market price"),
+            (("macbook",), 100000, HIGH, "MacBook Air market price"),
+            ((("dell", "hp", "lenovo"),), 60000, MEDIUM, "Branded laptop average price"),
+            ((), 45000, LOW, "Generic laptop price"),
+        ],
+    },
+    "tablet": {
+        "keywords": ("tablet", "ipad"),
+        "prices": [
+            (("ipad", "pro"), 80000, HIGH, "iPad Pro market price"),
+            (("ipad",), 45000, HIGH, "iPad standard market price"),
+            ((), 20000, LOW, "Generic tablet price"),
+        ],
+    },
+
+    # Jewelry & Accessories
+    "jewelry": {
+        "keywords": ("ring", "chain", "earring", "jewelry", "gold", "silver"),
+        "prices": [
+            (("gold", "chain"), 25000, MEDIUM, "Gold chain average price"),
+            (("gold", "ring"), 15000, MEDIUM, "Gold ring average price"),
+            (("gold",), 20000, MEDIUM, "Gold jewelry average"),
+            (("silver",), 5000, MEDIUM, "Silver jewelry average"),
+            ((), 10000, LOW, "Generic jewelry price"),
+        ],
+    },
+    "watch": {
+        "keywords": ("watch",),
+        "prices": [
+            ((("rolex", "omega", "tag", "breitling", "patek"),), 200000, HIGH, "Luxury watch brand"),
+            ((("titan", "fossil", "casio"),), 8000, MEDIUM, "Branded watch price"),
+            ((), 3000, LOW, "Generic watch price"),
+        ],
+    },
+
+    # Vehicles
+    "vehicle": {
+        "keywords": ("car", "bike", "motorcycle", "scooter", "bicycle"),
+        "prices": [
+            (("car",), 800000, MEDIUM, "Average car price"),
+            ((("motorcycle", "bike"),), 80000, MEDIUM, "Motorcycle average price"),
+            (("scooter",), 60000, MEDIUM, "Scooter average price"),
+            (("bicycle",), 15000, MEDIUM, "Bicycle average price"),
+            ((), 100000, LOW, "Generic vehicle price"),
+        ],
+    },
+
+    # Cash & Documents
+    "cash": {
+        "keywords": ("cash", "money", "rupees"),
+        "prices": [
+            ((), MENTIONED_AMOUNT, HIGH, "Explicit cash amount mentioned"),
+            ((("thousand", "1000", "2000", "5000"),), 3000, MEDIUM, "Approximate cash amount"),
+            ((), 2000, LOW, "Generic cash estimation"),
+        ],
+    },
+    "documents": {
+        "keywords": ("passport", "license", "document", "card"),
+        "prices": [
+            (("passport",), 1500, HIGH, "Passport replacement cost"),
+            (("license",), 500, HIGH, "License replacement cost"),
+            (("card",), 1000, MEDIUM, "Card replacement hassle value"),
+            ((), 2000, LOW, "Document replacement average"),
+        ],
+    },
+
+    # Clothing & Personal Items
+    "clothing": {
+        "keywords": ("shirt", "dress", "shoe", "clothes", "jeans"),
+        "prices": [
+            ((("gucci", "prada", "louis", "chanel", "versace"),), 15000, HIGH, "Designer brand clothing"),
+            ((("nike", "adidas", "puma", "levis"),), 4000, MEDIUM, "Branded clothing"),
+            ((), 1500, LOW, "Generic clothing price"),
+        ],
+    },
+}
+
+DEFAULT_ESTIMATE = (10000, LOW, "Generic property estimation")
+
+# Confidence codes used by the vectorised batch path
+CONFIDENCE_CODES = {LOW: 0, MEDIUM: 1, HIGH: 2}
+INT64_LIMIT = 2 ** 63 - 1
+
+# Value categories, split by the community_service, simple_theft and major_theft thresholds
+VALUE_CATEGORIES = ("minor_theft", "moderate_theft", "serious_theft", "major_theft")
+
+
+def _compile_price_table(database: Dict) -> List[Tuple[str, FrozenSet[str], List[Tuple]]]:
+    """(category, category keywords, [(term alternative sets, value, confidence, basis), ...]) in match order"""
+    return [
+        (
+            category,
+            frozenset(entry["keywords"]),
+            [
+                (tuple(frozenset((term,) if isinstance(term, str) else term) for term in terms), value, confidence, basis)
+                for terms, value, confidence, basis in entry["prices"]
+            ]
+        )
+        for category, entry in database.items()
+    ]
+
+
+PRICE_TABLE = _compile_price_table(VALUE_DATABASE)
+
+# Built once per process; substring matching keeps the "keyword in text" semantics of the price rows
+VALUE_KEYWORD_MATCHER = AhoCorasickMatcher(
+    ((keyword, keyword) for keyword in sorted(
+        {keyword for _, keywords, _ in PRICE_TABLE for keyword in keywords}
+        | {keyword for _, _, prices in PRICE_TABLE for terms, *_ in prices for term in terms for keyword in term}
+    )),
+    word_boundaries=False
+)
+
+
 class PropertyValueEstimator:
     """Estimates property values for legal threshold determination"""
 
     def __init__(self):
-        # Property value database (in rupees)
-        self.value_database = {
-            # Electronics
-            "mobile_phone": {
-                "iphone": {"14": 79000, "13": 65000, "12": 55000, "se": 35000},
-                "samsung": {"s24": 75000, "s23": 60000, "a54": 35000, "a34": 25000},
-                "generic": {"smartphone": 25000, "basic_phone": 5000}
-            },
-            "laptop": {
-                "macbook": {"pro": 150000, "air": 100000},
-                "dell": {"xps": 120000, "inspiron": 60000},
-                "hp": {"pavilion": 50000, "elitebook": 90000},
-                "generic": {"laptop": 45000, "gaming_laptop": 80000}
-            },
-            "tablet": {
-                "ipad": {"pro": 80000, "air": 60000, "basic": 35000},
-                "samsung": {"tab_s": 45000, "tab_a": 25000},
-                "generic": {"tablet": 20000}
-            },
-
-            # Jewelry & Accessories
-            "jewelry": {
-                "gold": {"ring": 15000, "chain": 25000, "earrings": 12000},
-                "silver": {"ring": 3000, "chain": 5000, "earrings": 2500},
-                "watch": {"luxury": 50000, "branded": 15000, "basic": 3000}
-            },
-
-            # Vehicles
-            "vehicle": {
-                "car": {"luxury": 1500000, "sedan": 800000, "hatchback": 600000},
-                "motorcycle": {"high_end": 200000, "standard": 80000, "scooter": 60000},
-                "bicycle": {"mountain": 25000, "road": 40000, "basic": 8000}
-            },
-
-            # Cash & Documents
-            "cash": {"mentioned_amount": "use_exact_value"},
-            "documents": {
-                "passport": 1500,  # replacement cost
-                "driving_license": 500,
-                "credit_card": 1000,  # replacement hassle value
-                "important_documents": 2000
-            },
-
-            # Clothing & Personal Items
-            "clothing": {
-                "branded": {"shirt": 3000, "jeans": 4000, "shoes": 5000},
-                "designer": {"dress": 15000, "suit": 25000, "shoes": 12000},
-                "generic": {"shirt": 800, "jeans": 1500, "shoes": 2000}
-            },
-
-            # Household Items
-            "household": {
-                "appliances": {"tv": 35000, "refrigerator": 25000, "microwave": 8000},
-                "furniture": {"sofa": 20000, "bed": 15000, "table": 8000}
-            }
-        }
+        self.value_database = VALUE_DATABASE
 
         # Legal thresholds (in rupees)
         self.legal_thresholds = {
@@ -79,13 +173,14 @@ class PropertyValueEstimator:
             "major_theft": 100000        # Might involve additional charges
         }
 
-    def estimate_value(self, property_items: List[str], descriptions: List[str] = None) -> Dict:
+    def estimate_value(self, property_items: List[str], descriptions: List[str] = None, query: Optional[str] = None) -> Dict:
         """
         Estimate total value of stolen/damaged property
 
         Args:
             property_items: List of property items mentioned
             descriptions: Optional detailed descriptions
+            query: Incident description the items came from; amounts in it are credited to the nearest item
 
         Returns:
             Dict with estimated value, confidence, and legal implications
@@ -95,10 +190,11 @@ class PropertyValueEstimator:
         breakdown = []
 
         descriptions = descriptions or []
+        property_items, mentioned = self._query_amounts(query, property_items) if query else (property_items, {})
 
         for i, item in enumerate(property_items):
             item_desc = descriptions[i] if i < len(descriptions) else ""
-            value, confidence, details = self._estimate_single_item(item, item_desc)
+            value, confidence, details = self._estimate_single_item(item, item_desc, mentioned.get(i))
 
             total_value += value
             confidence_scores.append(confidence)
@@ -124,169 +220,199 @@ class PropertyValueEstimator:
             "value_category": self._categorize_value(total_value)
         }
 
-    def _estimate_single_item(self, item: str, description: str) -> Tuple[int, ValueConfidence, str]:
-        """Estimate value of a single item"""
-        item_lower = item.lower()
-        desc_lower = description.lower()
-        combined_text = f"{item_lower} {desc_lower}"
+    def estimate_values_batch(self, item_lists: List[List[str]], description_lists: Optional[List[List[str]]] = None,
+                              breakdown: bool = False, queries: Optional[List[str]] = None) -> List[Dict]:
+        """
+        Estimate the value of many property lists at once, e.g. when re-scoring stored queries
+
+        Each distinct (item, description, query amount) is estimated once; totals, overall confidence
+        and the threshold analysis are then computed over NumPy arrays for all lists together.
+
+        Args:
+            item_lists: One list of property items per query
+            description_lists: Optional descriptions, aligned with item_lists
+            breakdown: Include the per-item breakdown (costs one dict per item)
+            queries: Optional query texts, aligned with item_lists (see estimate_value)
+
+        Returns:
+            One estimate_value result per list, without "breakdown" unless requested
+        """
+        description_lists = description_lists or []
+        queries = queries or []
+        pair_index: Dict[Tuple[str, str, Optional[int]], int] = {}
+        pair_codes = []
+        lengths = []
+        expanded_lists = []
+        for list_number, items in enumerate(item_lists):
+            descriptions = description_lists[list_number] if list_number < len(description_lists) else None
+            descriptions = descriptions or []
+            query = queries[list_number] if list_number < len(queries) else None
+            items, mentioned = self._query_amounts(query, items) if query else (items, {})
+            expanded_lists.append(items)
+            lengths.append(len(items))
+            for i, item in enumerate(items):
+                pair = (item, descriptions[i] if i < len(descriptions) else "", mentioned.get(i))
+                pair_codes.append(pair_index.setdefault(pair, len(pair_index)))
+
+        estimates = [self._estimate_single_item(*pair) for pair in pair_index]
+        largest = max((value for value, _, _ in estimates), default=0)
+
+        # Explicit values are unbounded Python ints; keep exact totals when int64 could overflow
+        if not NUMPY_AVAILABLE or largest * len(pair_codes) > INT64_LIMIT:
+            results = [
+                self.estimate_value(
+                    items,
+                    description_lists[n] if n < len(description_lists) else None,
+                    queries[n] if n < len(queries) else None
+                )
+                for n, items in enumerate(item_lists)
+            ]
+            if not breakdown:
+                for result in results:
+                    del result["breakdown"]
+            return results
+
+        codes = np.asarray(pair_codes, dtype=np.int64)
+        values = np.asarray([value for value, _, _ in estimates], dtype=np.int64)[codes]
+        confidences = np.asarray([CONFIDENCE_CODES[confidence] for _, confidence, _ in estimates], dtype=np.int8)[codes]
+
+        # Segment sums over each list's slice of the flat item arrays
+        counts = np.asarray(lengths, dtype=np.int64)
+        ends = np.cumsum(counts)
+        starts = ends - counts
+
+        def segment_sum(flat):
+            running = np.concatenate(([0], np.cumsum(flat, dtype=np.int64)))
+            return running[ends] - running[starts]
+
+        totals = segment_sum(values)
+        high = segment_sum(confidences == CONFIDENCE_CODES[HIGH])
+        medium = segment_sum(confidences == CONFIDENCE_CODES[MEDIUM])
+
+        # Vectorised _calculate_overall_confidence
+        overall = np.where(
+            high >= counts * 0.7, HIGH.value,
+            np.where(high + medium >= counts * 0.5, MEDIUM.value, LOW.value)
+        )
+        overall[counts == 0] = LOW.value
+
+        # Vectorised _categorize_value and _analyze_legal_thresholds
+        threshold = self.legal_thresholds["community_service"]
+        bounds = [threshold, self.legal_thresholds["simple_theft"], self.legal_thresholds["major_theft"]]
+        categories = np.asarray(VALUE_CATEGORIES)[np.searchsorted(bounds, totals, side="right")]
+        above = totals >= threshold
+        severities = np.where(above, "major", "minor")
+        implications = np.where(above, "imprisonment_or_fine", "community_service")
+        differences = totals - threshold
+
+        results = []
+        for n, items in enumerate(expanded_lists):
+            result = {"total_estimated_value": int(totals[n]), "confidence": str(overall[n])}
+            if breakdown:
+                descriptions = (description_lists[n] if n < len(description_lists) else None) or []
+                result["breakdown"] = []
+                for i, item in enumerate(items):
+                    value, confidence, basis = estimates[pair_codes[starts[n] + i]]
+                    result["breakdown"].append({
+                        "item": item,
+                        "description": descriptions[i] if i < len(descriptions) else "",
+                        "estimated_value": value,
+                        "confidence": confidence.value,
+                        "basis": basis
+                    })
+            result["legal_thresholds"] = {
+                "above_community_service_threshold": bool(above[n]),
+                "theft_severity": str(severities[n]),
+                "bns_303_implication": str(implications[n]),
+                "threshold_details": {"value": int(totals[n]), "threshold": threshold, "difference": int(differences[n])}
+            }
+            result["value_category"] = str(categories[n])
+            results.append(result)
+        return results
+
+    def _estimate_single_item(self, item: str, description: str,
+                              mentioned_value: Optional[int] = None) -> Tuple[int, ValueConfidence, str]:
+        """
+        Estimate value of a single item from its price row in the value database
+
+        Args:
+            item: Property item
+            description: Detailed description, may be empty
+            mentioned_value: Amount the query credits to this item (see _query_amounts)
+        """
+        combined_text = f"{item.lower()} {description.lower()}"
+        amounts = extract_amounts(combined_text)
 
         # Check for explicit value mentions
-        value_match = re.search(r'(?:worth|value|cost|price).*?(\d+(?:,\d+)*)', combined_text)
-        if value_match:
-            try:
-                explicit_value = int(value_match.group(1).replace(',', ''))
-                return explicit_value, ValueConfidence.HIGH, "User mentioned explicit value"
-            except ValueError:
-                pass
-
-        # Electronics detection with brand/model
-        if any(phone in combined_text for phone in ["iphone", "phone", "mobile"]):
-            return self._estimate_phone(combined_text)
-        elif any(laptop in combined_text for laptop in ["laptop", "macbook", "computer"]):
-            return self._estimate_laptop(combined_text)
-        elif "tablet" in combined_text or "ipad" in combined_text:
-            return self._estimate_tablet(combined_text)
-
-        # Jewelry and accessories
-        elif any(jewelry in combined_text for jewelry in ["ring", "chain", "earring", "jewelry", "gold", "silver"]):
-            return self._estimate_jewelry(combined_text)
-        elif "watch" in combined_text:
-            return self._estimate_watch(combined_text)
-
-        # Vehicles
-        elif any(vehicle in combined_text for vehicle in ["car", "bike", "motorcycle", "scooter", "bicycle"]):
-            return self._estimate_vehicle(combined_text)
-
-        # Cash
-        elif "cash" in combined_text or "money" in combined_text or "rupees" in combined_text:
-            return self._estimate_cash(combined_text)
-
-        # Documents
-        elif any(doc in combined_text for doc in ["passport", "license", "document", "card"]):
-            return self._estimate_documents(combined_text)
-
-        # Clothing
-        elif any(cloth in combined_text for cloth in ["shirt", "dress", "shoe", "clothes", "jeans"]):
-            return self._estimate_clothing(combined_text)
-
-        # Default fallback
-        return 10000, ValueConfidence.LOW, "Generic property estimation"
-
-    def _estimate_phone(self, text: str) -> Tuple[int, ValueConfidence, str]:
-        """Estimate phone value based on description"""
-        if "iphone" in text:
-            if "14" in text or "14 pro" in text:
-                return 79000, ValueConfidence.HIGH, "iPhone 14 market price"
-            elif "13" in text:
-                return 65000, ValueConfidence.HIGH, "iPhone 13 market price"
-            elif "12" in text:
-                return 55000, ValueConfidence.HIGH, "iPhone 12 market price"
-            else:
-                return 60000, ValueConfidence.MEDIUM, "Generic iPhone price"
-        elif "samsung" in text:
-            if "s24" in text or "s23" in text:
-                return 65000, ValueConfidence.HIGH, "Samsung flagship price"
-            else:
-                return 30000, ValueConfidence.MEDIUM, "Samsung mid-range price"
-        else:
-            return 25000, ValueConfidence.LOW, "Generic smartphone price"
+        for amount in amounts:
+            if amount.cued:
+                return amount.value, HIGH, "User mentioned explicit value"
+        if mentioned_value is not None:
+            return mentioned_value, HIGH, "Amount mentioned in the query"
+
+        found = set(VALUE_KEYWORD_MATCHER.payloads(combined_text))
+        for _, keywords, prices in PRICE_TABLE:
+            if keywords.isdisjoint(found):
+                continue
+            for terms, value, confidence, basis in prices:
+                if not all(found & term for term in terms):
+                    continue
+                if value == MENTIONED_AMOUNT:
+                    cash = next((amount for amount in amounts if amount.currency or amount.multiplier), None)
+                    if cash is None:
+                        continue
+                    value = cash.value
+                return value, confidence, basis
+
+        return DEFAULT_ESTIMATE
+
+    def _category(self, item: str) -> Optional[str]:
+        """Value database category an item falls under"""
+        found = set(VALUE_KEYWORD_MATCHER.payloads(item.lower()))
+        return next((category for category, keywords, _ in PRICE_TABLE if not keywords.isdisjoint(found)), None)
+
+    def _query_amounts(self, query: str, property_items: List[str]) -> Tuple[List[str], Dict[int, int]]:
+        """
+        Credit the money amounts in the query to the items they describe
 
-    def _estimate_laptop(self, text: str) -> Tuple[int, ValueConfidence, str]:
-        """Estimate laptop value"""
-        if "macbook" in text:
-            if "pro" in text:
-                return 150000, ValueConfidence.HIGH, "MacBook Pro market price"
-            else:
-                return 100000, ValueConfidence.HIGH, "MacBook Air market price"
-        elif any(brand in text for brand in ["dell", "hp", "lenovo"]):
-            return 60000, ValueConfidence.MEDIUM, "Branded laptop average price"
-        else:
-            return 45000, ValueConfidence.LOW, "Generic laptop price"
+        Each amount goes to the nearest mention of an item, the preceding one on a tie, so
+        "phone worth 80k and 5,000 rupees cash" values the phone at 80,000 and the cash at 5,000.
+        Amounts without a worth/value/price cue only go to cash items; when there is none, or no
+        item at all, the amount is stolen cash of its own, so "my phone and 500 rupees" is the
+        phone's price plus 500. An item keeps the first amount credited to it.
 
-    def _estimate_tablet(self, text: str) -> Tuple[int, ValueConfidence, str]:
-        """Estimate tablet value"""
-        if "ipad" in text:
-            if "pro" in text:
-                return 80000, ValueConfidence.HIGH, "iPad Pro market price"
-            else:
-                return 45000, ValueConfidence.HIGH, "iPad standard market price"
-        else:
-            return 20000, ValueConfidence.LOW, "Generic tablet price"
-
-    def _estimate_jewelry(self, text: str) -> Tuple[int, ValueConfidence, str]:
-        """Estimate jewelry value"""
-        if "gold" in text:
-            if "chain" in text:
-                return 25000, ValueConfidence.MEDIUM, "Gold chain average price"
-            elif "ring" in text:
-                return 15000, ValueConfidence.MEDIUM, "Gold ring average price"
+        Returns:
+            property_items plus one "cash" entry per amount no item took, and item index -> amount in rupees
+        """
+        amounts = money_amounts(query)
+        if not amounts:
+            return property_items, {}
+
+        text = query.lower()
+        spans = {}
+        for i, item in enumerate(property_items):
+            item_spans = [match.span() for match in re.finditer(rf"(?<!\w){re.escape(item.lower())}(?!\w)", text)]
+            if item_spans:
+                spans[i] = item_spans
+        cash_items = [i for i in spans if self._category(property_items[i]) == "cash"]
+
+        def distance(amount, i):
+            # (characters between the amount and the item, 0 when the item comes first)
+            return min(
+                (amount.start - end, 0) if end <= amount.start else (max(start - amount.end, 0), 1)
+                for start, end in spans[i]
+            )
+
+        items = list(property_items)
+        credited: Dict[int, int] = {}
+        for amount in amounts:
+            candidates = list(spans) if amount.cued else cash_items
+            if candidates:
+                credited.setdefault(min(candidates, key=lambda i: distance(amount, i)), amount.value)
             else:
-                return 20000, ValueConfidence.MEDIUM, "Gold jewelry average"
-        elif "silver" in text:
-            return 5000, ValueConfidence.MEDIUM, "Silver jewelry average"
-        else:
-            return 10000, ValueConfidence.LOW, "Generic jewelry price"
-
-    def _estimate_watch(self, text: str) -> Tuple[int, ValueConfidence, str]:
-        """Estimate watch value"""
-        luxury_brands = ["rolex", "omega", "tag", "breitling", "patek"]
-        if any(brand in text for brand in luxury_brands):
-            return 200000, ValueConfidence.HIGH, "Luxury watch brand"
-        elif any(brand in text for brand in ["titan", "fossil", "casio"]):
-            return 8000, ValueConfidence.MEDIUM, "Branded watch price"
-        else:
-            return 3000, ValueConfidence.LOW, "Generic watch price"
-
-    def _estimate_vehicle(self, text: str) -> Tuple[int, ValueConfidence, str]:
-        """Estimate vehicle value"""
-        if "car" in text:
-            return 800000, ValueConfidence.MEDIUM, "Average car price"
-        elif "motorcycle" in text or "bike" in text:
-            return 80000, ValueConfidence.MEDIUM, "Motorcycle average price"
-        elif "scooter" in text:
-            return 60000, ValueConfidence.MEDIUM, "Scooter average price"
-        elif "bicycle" in text:
-            return 15000, ValueConfidence.MEDIUM, "Bicycle average price"
-        else:
-            return 100000, ValueConfidence.LOW, "Generic vehicle price"
-
-    def _estimate_cash(self, text: str) -> Tuple[int, ValueConfidence, str]:
-        """Estimate cash value"""
-        # Try to extract amount from text
-        amount_match = re.search(r'(\d+(?:,\d+)*)\s*(?:rupees?|rs\.?|₹)', text)
-        if amount_match:
-            try:
-                amount = int(amount_match.group(1).replace(',', ''))
-                return amount, ValueConfidence.HIGH, "Explicit cash amount mentioned"
-            except ValueError:
-                pass
-
-        # Look for descriptive amounts
-        if any(word in text for word in ["thousand", "1000", "2000", "5000"]):
-            return 3000, ValueConfidence.MEDIUM, "Approximate cash amount"
-        else:
-            return 2000, ValueConfidence.LOW, "Generic cash estimation"
-
-    def _estimate_documents(self, text: str) -> Tuple[int, ValueConfidence, str]:
-        """Estimate document replacement value"""
-        if "passport" in text:
-            return 1500, ValueConfidence.HIGH, "Passport replacement cost"
-        elif "license" in text:
-            return 500, ValueConfidence.HIGH, "License replacement cost"
-        elif "card" in text:
-            return 1000, ValueConfidence.MEDIUM, "Card replacement hassle value"
-        else:
-            return 2000, ValueConfidence.LOW, "Document replacement average"
-
-    def _estimate_clothing(self, text: str) -> Tuple[int, ValueConfidence, str]:
-        """Estimate clothing value"""
-        designer_brands = ["gucci", "prada", "louis", "chanel", "versace"]
-        if any(brand in text for brand in designer_brands):
-            return 15000, ValueConfidence.HIGH, "Designer brand clothing"
-        elif any(brand in text for brand in ["nike", "adidas", "puma", "levis"]):
-            return 4000, ValueConfidence.MEDIUM, "Branded clothing"
-        else:
-            return 1500, ValueConfidence.LOW, "Generic clothing price"
+                credited[len(items)] = amount.value
+                items.append("cash")
+        return items, credited
 
     def _calculate_overall_confidence(self, confidence_scores: List[ValueConfidence]) -> ValueConfidence:
         """Calculate overall confidence from individual scores"""
@@ -305,14 +431,15 @@ class PropertyValueEstimator:
 
     def _analyze_legal_thresholds(self, total_value: int) -> Dict:
         """Analyze legal implications based on property value"""
+        threshold = self.legal_thresholds["community_service"]
         analysis = {
-            "above_community_service_threshold": total_value >= self.legal_thresholds["community_service"],
-            "theft_severity": "minor" if total_value < self.legal_thresholds["community_service"] else "major",
-            "bns_303_implication": "community_service" if total_value < 5000 else "imprisonment_or_fine",
+            "above_community_service_threshold": total_value >= threshold,
+            "theft_severity": "minor" if total_value < threshold else "major",
+            "bns_303_implication": "community_service" if total_value < threshold else "imprisonment_or_fine",
             "threshold_details": {
                 "value": total_value,
-                "threshold": self.legal_thresholds["community_service"],
-                "difference": total_value - self.legal_thresholds["community_service"]
+                "threshold": threshold,
+                "difference": total_value - threshold
             }
         }
 
@@ -320,11 +447,11 @@ class PropertyValueEstimator:
 
     def _categorize_value(self, value: int) -> str:
         """Categorize value for legal processing"""
-        if value < 5000:
+        if value < self.legal_thresholds["community_service"]:
             return "minor_theft"  # Community service eligible
-        elif value < 50000:
+        elif value < self.legal_thresholds["simple_theft"]:
             return "moderate_theft"  # Standard theft punishment
-        elif value < 100000:
+        elif value < self.legal_thresholds["major_theft"]:
             return "serious_theft"  # Higher penalties
         else:
             return "major_theft"  # Maximum penalties
\ No newline at end of file
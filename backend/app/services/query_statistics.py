@@ -0,0 +1,212 @@
+"""
+Query Statistics Service
+Dashboard figures for stored legal queries: totals and per-day, per-language and
+per-section breakdowns, all read from the query_daily_stats rollup
+"""
+import json
+import logging
+from collections import defaultdict
+from datetime import date, datetime, timezone
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from sqlalchemy import delete, func, select, text
+from sqlalchemy.orm import Session
+
+from app.models.database import dialect_insert
+from app.models.user_models import LegalQuery, QueryDailyStats
+
+logger = logging.getLogger(__name__)
+
+ALL_SECTIONS = ""  # section_number of the rollup rows that count every query
+ROLLUP_COUNTERS = ("query_count", "verified_count", "confidence_sum", "confidence_count", "processing_time_sum")
+REBUILD_CHUNK_SIZE = 1000  # legal_queries rows read per round trip when rebuilding the rollup
+
+RollupKey = Tuple[date, str, str]  # (day, language, section_number)
+
+
+def _utc_day(created_at: Optional[datetime]) -> date:
+    if created_at is None:
+        return datetime.now(timezone.utc).date()
+    if created_at.tzinfo is not None:
+        created_at = created_at.astimezone(timezone.utc)
+    return created_at.date()
+
+
+def cited_sections(applicable_laws: Any) -> List[str]:
+    """Distinct section numbers cited by a stored query, e.g. ["BNS-303", "BNS-305"]"""
+    if isinstance(applicable_laws, str):  # JSON text, e.g. rows spilled before the columns became JSONB
+        try:
+            applicable_laws = json.loads(applicable_laws)
+        except ValueError:
+            return []
+    sections = []
+    for law in applicable_laws or []:
+        section = law.get("section") if isinstance(law, dict) else None
+        if section and section not in sections:
+            sections.append(str(section))
+    return sections
+
+
+def _average(total: float, count: int) -> float:
+    return total / count if count else 0.0
+
+
+class QueryStatisticsService:
+    """
+    Aggregates over legal_queries
+
+    The rollup is maintained incrementally in the transaction that stores the queries
+    (record_queries, record_verification), so dashboard reads cost one row per day,
+    language and section however many queries are stored. rebuild() recomputes it
+    from legal_queries, e.g. after importing rows.
+    """
+
+    def rollup_deltas(self, rows: Iterable[Dict[str, Any]]) -> Dict[RollupKey, Dict[str, float]]:
+        """Counter increments for legal_queries rows (column dicts as built by legal_query_row)"""
+        deltas: Dict[RollupKey, Dict[str, float]] = defaultdict(lambda: dict.fromkeys(ROLLUP_COUNTERS, 0))
+        for row in rows:
+            day = _utc_day(row.get("created_at"))
+            language = row.get("language") or "en"
+            confidence = row.get("confidence_score")
+            for section in [ALL_SECTIONS] + cited_sections(row.get("applicable_laws")):
+                counters = deltas[(day, language, section)]
+                counters["query_count"] += 1
+                counters["verified_count"] += 1 if row.get("verified") else 0
+                if confidence is not None:
+                    counters["confidence_sum"] += confidence
+                    counters["confidence_count"] += 1
+                counters["processing_time_sum"] += row.get("processing_time") or 0.0
+        return deltas
+
+    def apply_deltas(self, connection, deltas: Dict[RollupKey, Dict[str, float]]):
+        """Add counter increments to the rollup with one upsert (connection or session)"""
+        if not deltas:
+            return
+        table = QueryDailyStats.__table__
+        insert = dialect_insert(connection, table)
+        statement = insert.on_conflict_do_update(
+            index_elements=["day", "language", "section_number"],
+            set_={name: table.c[name] + insert.excluded[name] for name in ROLLUP_COUNTERS}
+        )
+        connection.execute(statement, [
+            {"day": day, "language": language, "section_number": section, **counters}
+            for (day, language, section), counters in deltas.items()
+        ])
+
+    def record_queries(self, connection, rows: List[Dict[str, Any]]):
+        """Count newly inserted legal_queries rows; call in the transaction that inserted them"""
+        self.apply_deltas(connection, self.rollup_deltas(rows))
+
+    def record_verification(self, db: Session, query: LegalQuery, verified: bool):
+        """Move a query between the verified and unverified counts when its flag changes"""
+        if bool(query.verified) == verified:
+            return
+        keys = [(_utc_day(query.created_at), query.language or "en", section)
+                for section in [ALL_SECTIONS] + cited_sections(query.applicable_laws)]
+        change = 1 if verified else -1
+        self.apply_deltas(db, {key: dict(dict.fromkeys(ROLLUP_COUNTERS, 0), verified_count=change) for key in keys})
+
+    def overview(self, db: Session, start: Optional[date] = None, end: Optional[date] = None) -> Dict[str, Any]:
+        """Totals over the stored queries of [start, end], summed from the all-sections rollup rows"""
+        totals = self._breakdown(db, [], QueryDailyStats.section_number == ALL_SECTIONS, start, end)[0]
+        total, verified = totals["queries"] or 0, totals["verified_queries"] or 0
+        return {
+            "total_queries": total,
+            "verified_queries": verified,
+            "verification_rate": verified / total if total > 0 else 0,
+            "average_confidence": float(totals["average_confidence"])
+        }
+
+    def _breakdown(self, db: Session, group_by, section_filter, start: Optional[date], end: Optional[date],
+                   language: Optional[str] = None, most_first: bool = False,
+                   limit: Optional[int] = None) -> List[Dict[str, Any]]:
+        stats = QueryDailyStats
+        queries = func.sum(stats.query_count).label("queries")
+        statement = (
+            select(
+                *group_by, queries, func.sum(stats.verified_count),
+                func.sum(stats.confidence_sum), func.sum(stats.confidence_count), func.sum(stats.processing_time_sum)
+            )
+            .where(section_filter)
+            .group_by(*group_by)
+        )
+        if start:
+            statement = statement.where(stats.day >= start)
+        if end:
+            statement = statement.where(stats.day <= end)
+        if language:
+            statement = statement.where(stats.language == language)
+        statement = statement.order_by(queries.desc(), *group_by) if most_first else statement.order_by(*group_by)
+        if limit:
+            statement = statement.limit(limit)
+
+        breakdown = []
+        for *keys, count, verified, confidence_sum, confidence_count, time_sum in db.execute(statement):
+            entry = {column.key: value for column, value in zip(group_by, keys)}
+            entry.update({
+                "queries": count,
+                "verified_queries": verified,
+                "average_confidence": _average(confidence_sum, confidence_count),
+                "average_processing_time": _average(time_sum, count)
+            })
+            breakdown.append(entry)
+        return breakdown
+
+    def daily(self, db: Session, start: Optional[date] = None, end: Optional[date] = None,
+              language: Optional[str] = None) -> List[Dict[str, Any]]:
+        """Queries per UTC day, oldest first"""
+        return self._breakdown(db, [QueryDailyStats.day], QueryDailyStats.section_number == ALL_SECTIONS,
+                               start, end, language)
+
+    def by_language(self, db: Session, start: Optional[date] = None, end: Optional[date] = None) -> List[Dict[str, Any]]:
+        """Queries per language"""
+        return self._breakdown(db, [QueryDailyStats.language], QueryDailyStats.section_number == ALL_SECTIONS,
+                               start, end)
+
+    def by_section(self, db: Session, start: Optional[date] = None, end: Optional[date] = None,
+                   language: Optional[str] = None, limit: Optional[int] = None) -> List[Dict[str, Any]]:
+        """Queries citing each section, most cited first"""
+        return self._breakdown(db, [QueryDailyStats.section_number], QueryDailyStats.section_number != ALL_SECTIONS,
+                               start, end, language, most_first=True, limit=limit)
+
+    def summary(self, db: Session, start: Optional[date] = None, end: Optional[date] = None,
+                top_sections: int = 20) -> Dict[str, Any]:
+        """Everything a dashboard shows, in four queries over the same date range"""
+        return {
+            **self.overview(db, start, end),
+            "daily": self.daily(db, start, end),
+            "languages": self.by_language(db, start, end),
+            "sections": self.by_section(db, start, end, limit=top_sections)
+        }
+
+    def rebuild(self, db: Session) -> int:
+        """
+        Recompute the rollup from legal_queries in one transaction
+
+        Returns:
+            Number of rollup rows written
+        """
+        if db.get_bind().dialect.name == "postgresql":
+            # Writers wait for the rebuild, so a query is counted either here or by its own upsert, never twice
+            db.execute(text("LOCK TABLE query_daily_stats IN EXCLUSIVE MODE"))
+        columns = [LegalQuery.created_at, LegalQuery.language, LegalQuery.applicable_laws, LegalQuery.verified,
+                   LegalQuery.confidence_score, LegalQuery.processing_time]
+        deltas: Dict[RollupKey, Dict[str, float]] = {}
+        result = db.execute(select(*columns).execution_options(yield_per=REBUILD_CHUNK_SIZE))
+        for chunk in result.mappings().partitions():
+            for key, counters in self.rollup_deltas(chunk).items():
+                if key in deltas:
+                    for name, value in counters.items():
+                        deltas[key][name] += value
+                else:
+                    deltas[key] = counters
+
+        db.execute(delete(QueryDailyStats))
+        self.apply_deltas(db, deltas)
+        db.commit()
+        logger.info(f"Query statistics rollup rebuilt: {len(deltas)} rows")
+        return len(deltas)
+
+
+# Global query statistics service instance
+query_statistics = QueryStatisticsService()
@@ -0,0 +1,119 @@
+"""
+Response Cache for Legal Query Results
+Bounded LRU with TTL keyed on normalised query text, language and the money amounts in the query
+"""
+import copy
+import logging
+import re
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Optional, Tuple
+
+from app.core.config import settings
+from app.core.metrics import CACHE_LOOKUP_SECONDS
+from app.services.amount_parser import money_amounts
+
+logger = logging.getLogger(__name__)
+
+CacheKey = Tuple[str, str, Tuple[int, ...]]  # (normalised query, language, money amounts)
+
+# Punctuation is dropped unless it sits between two digits ("Rs. 5,000", "2.5 lakh")
+_PUNCTUATION = re.compile(r"(?<!\d)[^\w\s]+|[^\w\s]+(?!\d)")
+_WHITESPACE = re.compile(r"\s+")
+
+
+def normalise_query(query: str) -> str:
+    """Canonical form of a query: lowercase, no punctuation, single spaces"""
+    text = _PUNCTUATION.sub(" ", query.lower())
+    return _WHITESPACE.sub(" ", text).strip()
+
+
+class ResponseCache:
+    """
+    Thread-safe LRU of pipeline results.
+    Valid because the pipeline is deterministic for a given query and language
+    while responses are templated rather than generated by Phi-3.
+    """
+
+    def __init__(self, max_size: Optional[int] = None, ttl_seconds: Optional[int] = None):
+        self.max_size = settings.RESPONSE_CACHE_SIZE if max_size is None else max_size
+        self.ttl_seconds = settings.RESPONSE_CACHE_TTL if ttl_seconds is None else ttl_seconds
+        self._entries: "OrderedDict[CacheKey, Tuple[float, Dict[str, Any]]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    @property
+    def enabled(self) -> bool:
+        return self.max_size > 0
+
+    @staticmethod
+    def make_key(query: str, language: str) -> CacheKey:
+        """
+        Normalisation drops currency markers ("₹", "Rs.", "/-"), which decide whether a number is
+        a sum of money, so the parsed amounts are part of the key: "stole ₹9000 cash" and
+        "stole 9000 cash" value the property differently and must not share an answer
+        """
+        return normalise_query(query), language, tuple(mention.value for mention in money_amounts(query))
+
+    def get(self, query: str, language: str) -> Optional[Dict[str, Any]]:
+        """Private copy of the cached result, or None on a miss or expired entry"""
+        if not self.enabled:
+            return None
+
+        start = time.perf_counter()
+        key = self.make_key(query, language)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and time.monotonic() - entry[0] > self.ttl_seconds:
+                del self._entries[key]
+                entry = None
+
+            if entry is None:
+                self.misses += 1
+                CACHE_LOOKUP_SECONDS.observe(time.perf_counter() - start, result="miss")
+                return None
+
+            self._entries.move_to_end(key)
+            self.hits += 1
+            result = entry[1]
+
+        result = copy.deepcopy(result)
+        CACHE_LOOKUP_SECONDS.observe(time.perf_counter() - start, result="hit")
+        return result
+
+    def put(self, query: str, language: str, result: Dict[str, Any]):
+        """Store a successful result; failed results are never cached"""
+        if not self.enabled or "error" in result:
+            return
+
+        key = self.make_key(query, language)
+        entry = (time.monotonic(), copy.deepcopy(result))
+        with self._lock:
+            self._entries[key] = entry
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    def clear(self):
+        """Drop every entry, e.g. after the knowledge graph was re-imported"""
+        with self._lock:
+            self._entries.clear()
+        logger.info("Response cache cleared")
+
+    def stats(self) -> Dict[str, Any]:
+        """Cache counters for admin and monitoring endpoints"""
+        lookups = self.hits + self.misses
+        return {
+            "enabled": self.enabled,
+            "size": len(self._entries),
+            "max_size": self.max_size,
+            "ttl_seconds": self.ttl_seconds,
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "hit_rate": round(self.hits / lookups, 3) if lookups else 0.0
+        }
@@ -0,0 +1,325 @@
+"""
+Compiled Rule Engine for BNS Applicability Decisions
+Declarative rule table (one rule per BNS section) compiled once at import
+"""
+import re
+from typing import Any, Callable, Dict, FrozenSet, List, Tuple
+
+
+# ------------------------------------------------------------------
+# Keyword vocabularies
+# ------------------------------------------------------------------
+THEFT_ACTIONS = ["took", "stolen", "stole", "theft", "stealing", "grabbed", "snatched", "broke into", "borrowed", "taken", "kept", "appropriated"]
+PROPERTY_OBJECTS = ["phone", "mobile", "iphone", "smartphone", "wallet", "money", "cash", "bag", "purse", "jewelry", "laptop", "computer"]
+DWELLING_LOCATIONS = ["house", "home", "apartment", "residence", "building", "room"]
+
+EMPLOYEE_TERMS = ["employee", "worker", "staff", "clerk", "servant"]
+EMPLOYER_TERMS = ["employer", "boss", "company", "master"]
+
+ROBBERY_THEFT_ACTIONS = ["took", "stolen", "theft", "stealing", "robbed", "snatched", "grabbed"]
+VIOLENCE_TERMS = ["violence", "force", "hurt", "threatened", "attacked", "beaten", "knife", "gun", "weapon"]
+
+SNATCHING_ACTIONS = ["snatched", "grabbed", "yanked", "pulled", "jerked", "ripped", "tore", "forcefully took"]
+SNATCHING_CIRCUMSTANCES = ["suddenly", "quickly", "fast", "running", "speeding", "motorcycle", "bike", "scooter"]
+SNATCHING_OBJECTS = ["chain", "necklace", "bag", "purse", "phone", "mobile", "wallet", "earrings", "watch"]
+PUBLIC_LOCATIONS = ["street", "road", "footpath", "market", "bus stop", "station", "park", "outside"]
+
+CHEATING_ACTIONS = ["cheated", "deceived", "defrauded", "scammed", "tricked", "misled", "promised", "lied", "convinced", "persuaded", "fooled"]
+STRONG_CHEATING_ACTIONS = ["scammed", "defrauded", "cheated", "fraudulently"]
+FRAUD_INTENTIONS = ["dishonest", "fraudulent", "fake", "false", "misleading", "deceptive"]
+FRAUD_CIRCUMSTANCES = ["online", "phone call", "fake website", "false documents", "impersonation", "lottery", "prize"]
+# Matched against lowercased text, so the upper-case entries never fire; kept
+# verbatim so existing decisions do not change
+FRAUD_PATTERNS = ["investment", "loan", "credit card", "bank account", "OTP", "ATM", "digital payment", "cryptocurrency"]
+
+TRUST_ACTIONS = ["misappropriated", "misused", "betrayed", "violated trust", "dishonestly used", "converted", "embezzled"]
+TRUST_RELATIONSHIPS = ["entrusted", "trustee", "fiduciary", "agent", "guardian", "manager", "executor", "director"]
+TRUST_CIRCUMSTANCES = ["entrusted with", "given responsibility", "in charge of", "managing", "handling", "responsible for"]
+TRUST_DISHONEST_INTENTIONS = ["dishonest", "wrongful", "unauthorized", "personal use", "own benefit"]
+
+THREAT_ACTIONS = ["threatened", "blackmailed", "intimidated", "coerced", "forced", "demanded", "extorted", "pressured", "warned", "told"]
+THREAT_METHODS = ["violence", "harm", "exposure", "reputation damage", "legal action", "physical harm"]
+THREAT_CIRCUMSTANCES = ["under threat", "fear", "pressure", "demanding money", "pay or else"]
+
+TRESPASS_ACTIONS = ["entered", "broke into", "trespassed", "intruded", "invaded", "climbed over", "jumped over", "snuck into", "came inside", "went into", "accessed"]
+TRESPASS_LOCATIONS = ["house", "home", "property", "land", "building", "apartment", "office", "compound", "premises", "yard", "garden", "roof"]
+UNLAWFUL_CIRCUMSTANCES = ["without permission", "unauthorized", "illegally", "unlawfully", "forcibly", "broke in", "climbed", "scaled", "fence", "wall", "gate", "boundary"]
+
+DAMAGE_ACTIONS = ["damaged", "destroyed", "broke", "vandalized", "defaced", "demolished", "ruined", "smashed", "burnt", "torn", "cut", "scratched"]
+STRONG_DAMAGE_ACTIONS = ["vandalized", "defaced", "demolished", "smashed", "burnt"]
+DAMAGEABLE_OBJECTS = ["car", "vehicle", "window", "door", "wall", "fence", "property", "building", "house", "furniture", "equipment", "machine", "computer", "phone"]
+DAMAGE_CIRCUMSTANCES = ["intentionally", "deliberately", "maliciously", "willfully", "on purpose", "angry", "revenge"]
+MALICIOUS_INTENTIONS = ["to harm", "to damage", "revenge", "anger", "spite", "malice"]
+ACCIDENTAL_INDICATORS = ["accidentally", "accidental", "by mistake", "unintentionally", "fell", "dropped", "slipped"]
+
+
+# ------------------------------------------------------------------
+# Rule table
+# ------------------------------------------------------------------
+# Check kinds:
+#   "contains" - a keyword occurs inside any value of the listed categories
+#   "equals"   - a value of the listed categories is exactly one of the keywords
+#   "text"     - a keyword occurs in the categories' values joined with spaces
+# Conditions are a check name or nested {"all": [...]}, {"any": [...]}, {"not": ...}
+RULE_TABLE = [
+    {
+        "name": "theft",
+        "section_number": 303,
+        "checks": {
+            "theft_action": ("contains", ["actions"], THEFT_ACTIONS),
+            "property": ("contains", ["objects"], PROPERTY_OBJECTS),
+        },
+        # Intention is implied for basic theft
+        "condition": {"all": ["theft_action", "property"]},
+    },
+    {
+        "name": "dwelling_theft",
+        "section_number": 305,
+        "checks": {
+            "dwelling": ("contains", ["locations"], DWELLING_LOCATIONS),
+            "theft_action": ("contains", ["actions"], THEFT_ACTIONS),
+        },
+        "condition": {"all": ["dwelling", "theft_action"]},
+    },
+    {
+        "name": "employee_theft",
+        "section_number": 306,
+        "checks": {
+            "employee": ("equals", ["persons"], EMPLOYEE_TERMS),
+            "employer": ("equals", ["relationships"], EMPLOYER_TERMS),
+            "theft_action": ("equals", ["actions"], THEFT_ACTIONS),
+        },
+        "condition": {"all": ["employee", "employer", "theft_action"]},
+    },
+    {
+        "name": "robbery",
+        "section_number": 309,
+        "checks": {
+            "theft_action": ("equals", ["actions"], ROBBERY_THEFT_ACTIONS),
+            "violence": ("equals", ["violence", "actions"], VIOLENCE_TERMS),
+            "property": ("equals", ["objects"], PROPERTY_OBJECTS),
+        },
+        "condition": {"all": ["theft_action", "violence", "property"]},
+    },
+    {
+        "name": "snatching",
+        "section_number": 304,
+        "checks": {
+            "snatching_action": ("contains", ["actions"], SNATCHING_ACTIONS),
+            "sudden": ("equals", ["circumstances"], SNATCHING_CIRCUMSTANCES),
+            "snatching_object": ("equals", ["objects"], SNATCHING_OBJECTS),
+            "public_location": ("equals", ["locations"], PUBLIC_LOCATIONS),
+        },
+        # Forceful action + property + (sudden element OR public location)
+        "condition": {"all": ["snatching_action", "snatching_object", {"any": ["sudden", "public_location"]}]},
+    },
+    {
+        "name": "cheating",
+        "section_number": 318,
+        "checks": {
+            "strong_cheating": ("contains", ["actions"], STRONG_CHEATING_ACTIONS),
+            "cheating_action": ("contains", ["actions"], CHEATING_ACTIONS),
+            "fraud_intention": ("contains", ["intentions"], FRAUD_INTENTIONS),
+            "fraud_circumstance": ("contains", ["circumstances"], FRAUD_CIRCUMSTANCES),
+            "fraud_pattern": ("text", ["actions", "intentions", "circumstances"], FRAUD_PATTERNS),
+        },
+        # Strong cheating action alone, or (action OR intention) + (circumstance OR pattern)
+        "condition": {"any": [
+            "strong_cheating",
+            {"all": [
+                {"any": ["cheating_action", "fraud_intention"]},
+                {"any": ["fraud_circumstance", "fraud_pattern"]},
+            ]},
+        ]},
+    },
+    {
+        "name": "breach_of_trust",
+        "section_number": 316,
+        "checks": {
+            "trust_relationship": ("contains", ["relationships"], TRUST_RELATIONSHIPS),
+            "trust_circumstance": ("contains", ["circumstances"], TRUST_CIRCUMSTANCES),
+            "trust_pattern": ("text", ["actions", "relationships", "circumstances", "intentions"], TRUST_RELATIONSHIPS + TRUST_CIRCUMSTANCES),
+            "trust_action": ("contains", ["actions"], TRUST_ACTIONS),
+            "dishonest_intention": ("contains", ["intentions"], TRUST_DISHONEST_INTENTIONS),
+            "dishonest_circumstance": ("contains", ["circumstances"], TRUST_DISHONEST_INTENTIONS),
+        },
+        # Trust relationship/circumstance + (dishonest action OR intention OR circumstance)
+        "condition": {"all": [
+            {"any": ["trust_relationship", "trust_circumstance", "trust_pattern"]},
+            {"any": ["trust_action", "dishonest_intention", "dishonest_circumstance"]},
+        ]},
+    },
+    {
+        "name": "extortion",
+        "section_number": 308,
+        "checks": {
+            "threat_action": ("contains", ["actions"], THREAT_ACTIONS),
+            "threat_method": ("contains", ["methods"], THREAT_METHODS),
+            "threat_circumstance": ("contains", ["circumstances"], THREAT_CIRCUMSTANCES),
+            "threat_pattern": ("text", ["actions", "circumstances", "intentions", "methods"], THREAT_ACTIONS + THREAT_METHODS + THREAT_CIRCUMSTANCES),
+        },
+        "condition": {"any": ["threat_action", "threat_method", "threat_circumstance", "threat_pattern"]},
+    },
+    {
+        "name": "trespass",
+        "section_number": 329,
+        "checks": {
+            "trespass_action": ("contains", ["actions"], TRESPASS_ACTIONS),
+            "property_location": ("contains", ["locations"], TRESPASS_LOCATIONS),
+            "unlawful_circumstance": ("contains", ["circumstances"], UNLAWFUL_CIRCUMSTANCES),
+            "trespass_pattern": ("text", ["actions", "locations", "circumstances", "intentions"], TRESPASS_ACTIONS + UNLAWFUL_CIRCUMSTANCES),
+        },
+        # Entry action + property location, OR unlawful circumstances
+        "condition": {"any": [
+            {"all": ["trespass_action", "property_location"]},
+            "unlawful_circumstance",
+            "trespass_pattern",
+        ]},
+    },
+    {
+        "name": "mischief",
+        "section_number": 324,
+        "checks": {
+            "damage_action": ("contains", ["actions"], DAMAGE_ACTIONS),
+            "strong_damage_action": ("contains", ["actions"], STRONG_DAMAGE_ACTIONS),
+            "property_object": ("contains", ["objects"], DAMAGEABLE_OBJECTS),
+            "damage_circumstance": ("contains", ["circumstances"], DAMAGE_CIRCUMSTANCES),
+            "malicious_intention": ("contains", ["intentions"], MALICIOUS_INTENTIONS),
+            "accidental": ("text", ["actions", "objects", "circumstances", "intentions"], ACCIDENTAL_INDICATORS),
+        },
+        # Intentional damage (or strong damage actions that imply intent), never accidental
+        "condition": {"all": [
+            {"any": [
+                {"all": ["damage_action", "property_object", {"any": ["damage_circumstance", "malicious_intention"]}]},
+                {"all": ["strong_damage_action", "property_object"]},
+                "damage_circumstance",
+                "malicious_intention",
+            ]},
+            {"not": "accidental"},
+        ]},
+    },
+]
+
+
+class CompiledRuleEngine:
+    """Evaluates every rule of a rule table in a single pass over normalised entities"""
+
+    def __init__(self, rule_table: List[Dict[str, Any]]):
+        # Identical checks shared by several rules are compiled and evaluated once
+        set_checks: Dict[Tuple[Any, ...], int] = {}
+        text_checks: Dict[Tuple[Any, ...], int] = {}
+        contains_keywords: Dict[str, set] = {}
+        rule_checks = []
+
+        for rule in rule_table:
+            check_refs = {}
+            for name, (kind, categories, keywords) in rule["checks"].items():
+                categories = tuple(categories)
+                if kind == "contains":
+                    keyword_set = frozenset(keyword.lower() for keyword in keywords)
+                    for category in categories:
+                        contains_keywords.setdefault(category, set()).update(keyword_set)
+                    key = (("found",) + categories, keyword_set)
+                    check_refs[name] = ("set", set_checks.setdefault(key, len(set_checks)))
+                elif kind == "equals":
+                    key = (("values",) + categories, frozenset(keywords))
+                    check_refs[name] = ("set", set_checks.setdefault(key, len(set_checks)))
+                elif kind == "text":
+                    # Matched verbatim against the lowercased joined text
+                    key = (categories, tuple(sorted(set(keywords), key=len, reverse=True)))
+                    check_refs[name] = ("text", text_checks.setdefault(key, len(text_checks)))
+                else:
+                    raise ValueError(f"Unknown rule check kind: {kind}")
+            rule_checks.append((rule, check_refs))
+
+        # Set checks come first in the result vector, text checks after them
+        self._set_checks = list(set_checks)
+        self._text_checks = [
+            (categories, re.compile("|".join(re.escape(keyword) for keyword in keywords)))
+            for categories, keywords in text_checks
+        ]
+        offsets = {"set": 0, "text": len(self._set_checks)}
+
+        self.rules: List[Tuple[str, int, Callable[[List[bool]], bool]]] = []
+        for rule, check_refs in rule_checks:
+            indexes = {name: offsets[kind] + index for name, (kind, index) in check_refs.items()}
+            condition = self._compile_condition(rule["condition"], indexes)
+            self.rules.append((rule["name"], rule["section_number"], condition))
+
+        # One scanner per category finds every "contains" keyword in a single regex pass.
+        # The lookahead reports the longest keyword starting at each position; keywords
+        # that are substrings of a hit are added through the precomputed closure.
+        self._scanners: Dict[str, Tuple["re.Pattern", Dict[str, FrozenSet[str]]]] = {}
+        for category, keywords in contains_keywords.items():
+            ordered = sorted(keywords, key=len, reverse=True)
+            pattern = re.compile("(?=(" + "|".join(re.escape(keyword) for keyword in ordered) + "))")
+            closure = {
+                keyword: frozenset(other for other in keywords if other in keyword)
+                for keyword in keywords
+            }
+            self._scanners[category] = (pattern, closure)
+
+        self._multi_category_sets = {
+            source for source, _ in self._set_checks if len(source) > 2
+        }
+
+    def _compile_condition(self, condition: Any, indexes: Dict[str, int]) -> Callable[[List[bool]], bool]:
+        """Compose a declarative condition into a predicate over the check results"""
+        if isinstance(condition, str):
+            index = indexes[condition]
+            return lambda results: results[index]
+        if "not" in condition:
+            inner = self._compile_condition(condition["not"], indexes)
+            return lambda results: not inner(results)
+
+        combine = all if "all" in condition else any
+        parts = tuple(self._compile_condition(part, indexes) for part in condition.get("all") or condition.get("any"))
+        return lambda results: combine(part(results) for part in parts)
+
+    def _evaluate_checks(self, entities: Dict[str, List[str]]) -> List[bool]:
+        """Normalise the entities once and evaluate every compiled check"""
+        values = {
+            category: [value.lower() for value in items]
+            for category, items in entities.items()
+            if isinstance(items, list)
+        }
+
+        sets: Dict[Tuple[str, ...], FrozenSet[str]] = {}
+        for category, (pattern, closure) in self._scanners.items():
+            hits = set()
+            items = values.get(category)
+            if items:
+                # Keywords never contain NUL, so no hit can span two values
+                for keyword in pattern.findall("\0".join(items)):
+                    hits |= closure[keyword]
+            sets[("found", category)] = hits
+        for category, items in values.items():
+            sets[("values", category)] = set(items)
+        for source in self._multi_category_sets:
+            sets[source] = set().union(*(sets.get((source[0], category), ()) for category in source[1:]))
+
+        empty = frozenset()
+        results = [not keywords.isdisjoint(sets.get(source, empty)) for source, keywords in self._set_checks]
+
+        texts: Dict[Tuple[str, ...], str] = {}
+        for categories, pattern in self._text_checks:
+            text = texts.get(categories)
+            if text is None:
+                text = " ".join(value for category in categories for value in values.get(category, ()))
+                texts[categories] = text
+            results.append(pattern.search(text) is not None)
+        return results
+
+    def evaluate(self, entities: Dict[str, List[str]]) -> List[int]:
+        """Section numbers of every rule that fires, in rule table order"""
+        results = self._evaluate_checks(entities)
+        return [section_number for _, section_number, condition in self.rules if condition(results)]
+
+    def explain(self, entities: Dict[str, List[str]]) -> Dict[str, bool]:
+        """Decision of every rule by name, for debugging entity matching"""
+        results = self._evaluate_checks(entities)
+        return {name: condition(results) for name, _, condition in self.rules}
+
+
+# Compiled once per process
+rule_engine = CompiledRuleEngine(RULE_TABLE)
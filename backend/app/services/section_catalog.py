@@ -0,0 +1,130 @@
+"""
+In-process catalogue of BNS Section/Offence/Punishment records
+Loaded once from Neo4j and served from memory until the TTL expires or it is invalidated
+"""
+import logging
+import threading
+import time
+from types import MappingProxyType
+from typing import Any, Dict, Iterable, List, Mapping, Optional, Tuple
+
+from app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+
+# Every section with its offence and punishment - the graph is small enough to load whole
+CATALOG_QUERY = """
+    MATCH (s:Section)-[:DEFINES]->(o:Offence)
+    MATCH (s)-[:PUNISHED_BY]->(p:Punishment)
+    RETURN s.section_number as section_number, s.section_id as section, s.title as title,
+           s.text as description, p.description as punishment,
+           p.punishment_type as severity, o.type as offence_type
+    ORDER BY s.section_number
+"""
+
+
+def _read_catalog(tx) -> List[Dict[str, Any]]:
+    return [record.data() for record in tx.run(CATALOG_QUERY)]
+
+
+async def _read_catalog_async(tx) -> List[Dict[str, Any]]:
+    result = await tx.run(CATALOG_QUERY)
+    return await result.data()
+
+
+class SectionCatalog:
+    """Immutable snapshot of section records keyed by section_id"""
+
+    def __init__(self, ttl_seconds: Optional[int] = None, retry_interval: Optional[float] = None):
+        self.ttl_seconds = settings.SECTION_CATALOG_TTL if ttl_seconds is None else ttl_seconds
+        self.retry_interval = settings.SECTION_CATALOG_RETRY_INTERVAL if retry_interval is None else retry_interval
+        self._sections: Mapping[str, Tuple[Mapping[str, Any], ...]] = MappingProxyType({})
+        self._section_ids: Mapping[int, str] = MappingProxyType({})
+        self._loaded_at: Optional[float] = None
+        self._failed_at: Optional[float] = None
+        self._refresh_lock = threading.Lock()
+
+    @property
+    def is_loaded(self) -> bool:
+        return self._loaded_at is not None
+
+    def is_stale(self) -> bool:
+        """True when the catalogue was never loaded, was invalidated or outlived its TTL"""
+        if self._failed_at is not None and time.monotonic() - self._failed_at < self.retry_interval:
+            # The last refresh failed; hold off instead of reloading on every lookup while the graph is down
+            return False
+        if self._loaded_at is None:
+            return True
+        return time.monotonic() - self._loaded_at > self.ttl_seconds
+
+    def load(self, session) -> int:
+        """Replace the catalogue with a fresh read of the graph, returns the section count"""
+        if self._refresh_lock.locked():
+            # Another caller is already refreshing; keep serving the current snapshot
+            return len(self._sections)
+        return self.replace(session.execute_read(_read_catalog))
+
+    async def load_async(self, session) -> int:
+        """Same as load() for an async Neo4j session"""
+        if self._refresh_lock.locked():
+            return len(self._sections)
+        return self.replace(await session.execute_read(_read_catalog_async))
+
+    def replace(self, rows: Iterable[Dict[str, Any]]) -> int:
+        """Build a new snapshot from CATALOG_QUERY rows and swap it in, returns the section count"""
+        if not self._refresh_lock.acquire(blocking=False):
+            return len(self._sections)
+
+        try:
+            sections: Dict[str, List[Mapping[str, Any]]] = {}
+            section_ids: Dict[int, str] = {}
+            for data in rows:
+                sections.setdefault(data["section"], []).append(MappingProxyType(data))
+                section_ids[data["section_number"]] = data["section"]
+
+            # Swap both mappings in one go so readers never see a half-built catalogue
+            self._sections = MappingProxyType(
+                {section_id: tuple(records) for section_id, records in sections.items()}
+            )
+            self._section_ids = MappingProxyType(section_ids)
+            self._loaded_at = time.monotonic()
+            self._failed_at = None
+
+            logger.info(f"Section catalogue loaded with {len(self._sections)} sections")
+            return len(self._sections)
+        finally:
+            self._refresh_lock.release()
+
+    def mark_failed(self):
+        """Record a failed refresh so the catalogue is not retried for retry_interval seconds"""
+        self._failed_at = time.monotonic()
+
+    def invalidate(self):
+        """Mark the catalogue stale so the next lookup reloads it"""
+        self._loaded_at = None
+        self._failed_at = None
+
+    def get_section(self, section_id: str) -> Tuple[Mapping[str, Any], ...]:
+        """Records for a section_id such as 'BNS-303'"""
+        return self._sections.get(section_id, ())
+
+    def get_records(self, section_numbers: List[int]) -> Dict[int, List[Mapping[str, Any]]]:
+        """Records grouped by section number, same shape as a direct Neo4j lookup"""
+        records = {}
+        for section_number in section_numbers:
+            section_id = self._section_ids.get(section_number)
+            if section_id:
+                records[section_number] = list(self._sections[section_id])
+        return records
+
+    def stats(self) -> Dict[str, Any]:
+        """Catalogue status for admin and health endpoints"""
+        age = time.monotonic() - self._loaded_at if self._loaded_at is not None else None
+        return {
+            "loaded": self.is_loaded,
+            "sections": len(self._sections),
+            "age_seconds": round(age, 1) if age is not None else None,
+            "ttl_seconds": self.ttl_seconds,
+            "stale": self.is_stale()
+        }
@@ -0,0 +1,141 @@
+"""
+Stored Query Cache
+Read-through LRU of stored legal query records by query_id, for GET /legal/query/{query_id}
+"""
+import threading
+import time
+from collections import OrderedDict
+from datetime import timezone
+from typing import Any, Awaitable, Callable, Dict, Optional, Tuple
+
+from app.core.config import settings
+from app.core.metrics import STORED_QUERY_LOOKUPS_TOTAL
+
+RECORD_COLUMNS = (
+    "query_id", "query_text", "language", "extracted_entities", "applicable_laws", "legal_advice",
+    "confidence_score", "processing_time", "verified", "created_at"
+)
+
+
+def stored_query_record(query) -> Dict[str, Any]:
+    """
+    API view of a stored query
+
+    Args:
+        query: LegalQuery instance, or a column dict as built by legal_query_row
+    """
+    values = query if isinstance(query, dict) else {column: getattr(query, column) for column in RECORD_COLUMNS}
+    created_at = values.get("created_at")
+    if created_at is not None and created_at.tzinfo is None:
+        created_at = created_at.replace(tzinfo=timezone.utc)  # SQLite drops the offset; values are UTC
+    return {
+        "query_id": values["query_id"],
+        "query": values["query_text"],
+        "language": values["language"],
+        "entities": values["extracted_entities"] or {},
+        "applicable_laws": values["applicable_laws"] or [],
+        "legal_advice": values["legal_advice"],
+        "confidence_score": values["confidence_score"],
+        "processing_time": values["processing_time"],
+        "verified": bool(values["verified"]),
+        "created_at": created_at.isoformat() if created_at else None
+    }
+
+
+class StoredQueryCache:
+    """
+    Thread-safe LRU with TTL of stored query records.
+
+    Records are filled on a database read and, by the pipeline, as soon as a result is handed
+    to the write-behind queue, so a query can be fetched before its batch is written.
+    Misses are not cached for the same reason. Cached records are shared: treat them as read-only.
+    """
+
+    def __init__(self, max_size: Optional[int] = None, ttl_seconds: Optional[int] = None):
+        self.max_size = settings.STORED_QUERY_CACHE_SIZE if max_size is None else max_size
+        self.ttl_seconds = settings.STORED_QUERY_CACHE_TTL if ttl_seconds is None else ttl_seconds
+        self._entries: "OrderedDict[str, Tuple[float, Dict[str, Any]]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    @property
+    def enabled(self) -> bool:
+        return self.max_size > 0
+
+    def get(self, query_id: str) -> Optional[Dict[str, Any]]:
+        if not self.enabled:
+            return None
+        with self._lock:
+            entry = self._entries.get(query_id)
+            if entry is not None and time.monotonic() - entry[0] > self.ttl_seconds:
+                del self._entries[query_id]
+                entry = None
+            if entry is None:
+                return None
+            self._entries.move_to_end(query_id)
+            return entry[1]
+
+    def put(self, record: Dict[str, Any]):
+        if not self.enabled:
+            return
+        with self._lock:
+            self._entries[record["query_id"]] = (time.monotonic(), record)
+            self._entries.move_to_end(record["query_id"])
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+
+    def get_or_load(self, query_id: str, load: Callable[[str], Optional[Dict[str, Any]]]) -> Optional[Dict[str, Any]]:
+        """Cached record, or load(query_id) stored for next time; None when the query does not exist"""
+        record = self._lookup(query_id)
+        if record is not None:
+            return record
+        return self._loaded(load(query_id))
+
+    async def get_or_load_async(self, query_id: str,
+                                load: Callable[[str], Awaitable[Optional[Dict[str, Any]]]]) -> Optional[Dict[str, Any]]:
+        """get_or_load with an async loader"""
+        record = self._lookup(query_id)
+        if record is not None:
+            return record
+        return self._loaded(await load(query_id))
+
+    def _lookup(self, query_id: str) -> Optional[Dict[str, Any]]:
+        record = self.get(query_id)
+        if record is not None:
+            self.hits += 1
+            STORED_QUERY_LOOKUPS_TOTAL.inc(result="hit")
+        else:
+            self.misses += 1
+        return record
+
+    def _loaded(self, record: Optional[Dict[str, Any]]) -> Optional[Dict[str, Any]]:
+        STORED_QUERY_LOOKUPS_TOTAL.inc(result="miss" if record is not None else "not_found")
+        if record is not None:
+            self.put(record)
+        return record
+
+    def invalidate(self, query_id: str):
+        """Forget a record whose stored row changed, e.g. its verified flag"""
+        with self._lock:
+            self._entries.pop(query_id, None)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self) -> Dict[str, Any]:
+        lookups = self.hits + self.misses
+        return {
+            "enabled": self.enabled,
+            "size": len(self._entries),
+            "max_size": self.max_size,
+            "ttl_seconds": self.ttl_seconds,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": round(self.hits / lookups, 3) if lookups else 0.0
+        }
+
+
+# Global stored query cache, filled by the pipeline and by database reads
+stored_query_cache = StoredQueryCache()
@@ -0,0 +1,51 @@
+#!/usr/bin/env python3
+"""
+LEGALS Rule Engine Micro-benchmark
+Times per-request rule evaluation over the entity extraction training set
+"""
+import sys
+import os
+import json
+import time
+import statistics
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app.services.rule_engine import rule_engine
+
+TRAINING_DATA = os.path.join(
+    os.path.dirname(os.path.abspath(__file__)), "..", "..",
+    "data", "training_data", "entity_extraction_training.json"
+)
+
+
+def load_entity_sets():
+    """Entity sets from the training data"""
+    with open(TRAINING_DATA, encoding="utf-8") as f:
+        return [example["extracted_entities"] for example in json.load(f)]
+
+
+def bench_rule_evaluation(entity_sets, repeat: int = 20):
+    """Per-request evaluation time of all rules, in microseconds"""
+    timings = []
+    for _ in range(repeat):
+        for entities in entity_sets:
+            start = time.perf_counter()
+            rule_engine.evaluate(entities)
+            timings.append((time.perf_counter() - start) * 1_000_000)
+
+    timings.sort()
+    return {
+        "requests": len(timings),
+        "mean_us": statistics.mean(timings),
+        "p50_us": timings[len(timings) // 2],
+        "p95_us": timings[int(len(timings) * 0.95)],
+        "max_us": timings[-1]
+    }
+
+
+if __name__ == "__main__":
+    entity_sets = load_entity_sets()
+    print(f"Rule engine benchmark ({len(rule_engine.rules)} rules, {len(entity_sets)} entity sets)")
+    print("=" * 50)
+    for name, value in bench_rule_evaluation(entity_sets).items():
+        print(f"{name:>10}: {value:,.1f}" if isinstance(value, float) else f"{name:>10}: {value}")
@@ -49,19 +49,20 @@ def test_entity_matching():
     print(f"Has property: {has_property} (looking for: {property_objects})")
     print(f"Has dishonest intent: {has_dishonest_intent} (looking for: {dishonest_intentions})")
 
-    has_theft = neo4j_service._has_theft_elements(test_entities)
+    decisions = neo4j_service.rule_engine.explain(test_entities)
+    has_theft = decisions["theft"]
     print(f"Overall has theft elements: {has_theft}")
 
     print(f"\n=== DWELLING THEFT DETECTION ===")
-    has_dwelling = neo4j_service._has_dwelling_theft_elements(test_entities)
+    has_dwelling = decisions["dwelling_theft"]
     print(f"Has dwelling theft elements: {has_dwelling}")
 
     print(f"\n=== EMPLOYEE THEFT DETECTION ===")
-    has_employee = neo4j_service._has_employee_theft_elements(test_entities)
+    has_employee = decisions["employee_theft"]
     print(f"Has employee theft elements: {has_employee}")
 
     print(f"\n=== ROBBERY DETECTION ===")
-    has_robbery = neo4j_service._has_robbery_elements(test_entities)
+    has_robbery = decisions["robbery"]
     print(f"Has robbery elements: {has_robbery}")
 
     # Test the actual query
@@ -119,9 +120,8 @@ def test_entity_matching():
                 # Test the new fixed query structure
                 print("\nTesting fixed query structure...")
                 result = session.run("""
-                    MATCH (s:Section)-[:DEFINES]->(o:Offence)
-                    MATCH (p:Punishment)
-                    WHERE s.section_number = 303 AND p.section_id = s.section_id
+                    MATCH (s:Section {section_number: 303})-[:DEFINES]->(o:Offence)
+                    MATCH (s)-[:PUNISHED_BY]->(p:Punishment)
                     RETURN s.section_id as section, s.title as title,
                            s.text as description, p.description as punishment,
                            p.punishment_type as severity, o.type as offence_type
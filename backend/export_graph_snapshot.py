@@ -0,0 +1,72 @@
+#!/usr/bin/env python3
+"""
+LEGALS Knowledge Graph Snapshot Export
+Writes the legalknowledge graph to a gzipped snapshot the backend can serve without Neo4j
+
+Usage:
+    python export_graph_snapshot.py                          # export from Neo4j
+    python export_graph_snapshot.py --from-source ../data/csv_friend/bns_ch17_final_cleaned.csv
+    GRAPH_SNAPSHOT_PATH=... GRAPH_SNAPSHOT_ONLY=true uvicorn main:app   # serve it
+"""
+import argparse
+import sys
+import os
+import time
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from app.core.config import settings
+from app.services.graph_loader import read_source
+from app.services.graph_snapshot import GraphSnapshot
+from app.services.neo4j_service import NEO4J_AVAILABLE, open_driver
+
+DEFAULT_OUTPUT = os.path.join(
+    os.path.dirname(os.path.abspath(__file__)), "..",
+    "data", "graph_snapshot", "legalknowledge.json.gz"
+)
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="Export the knowledge graph to a snapshot file")
+    parser.add_argument("-o", "--output", default=settings.GRAPH_SNAPSHOT_PATH or DEFAULT_OUTPUT,
+                        help="snapshot file to write")
+    parser.add_argument("--from-source", nargs="+", metavar="FILE",
+                        help="build from .json/.csv section files instead of Neo4j")
+    return parser.parse_args()
+
+
+def export_from_neo4j():
+    if not NEO4J_AVAILABLE:
+        raise RuntimeError("neo4j driver not installed")
+
+    driver = open_driver()
+    try:
+        with driver.session(database=settings.NEO4J_DATABASE) as session:
+            return GraphSnapshot.export(session, database=settings.NEO4J_DATABASE)
+    finally:
+        driver.close()
+
+
+def main():
+    args = parse_args()
+    start = time.perf_counter()
+
+    try:
+        if args.from_source:
+            rows = [row for source in args.from_source for row in read_source(source)]
+            snapshot = GraphSnapshot.from_rows(rows, source=", ".join(args.from_source))
+        else:
+            snapshot = export_from_neo4j()
+    except Exception as e:
+        print(f"Error: {e}")
+        return 1
+
+    size = snapshot.save(args.output)
+    stats = snapshot.stats()
+    print(f"Nodes: {stats['nodes']}")
+    print(f"Relationships: {stats['relationships']}")
+    print(f"Wrote {args.output} ({size / 1024:.1f} KiB) in {time.perf_counter() - start:.2f}s")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,88 @@
+#!/usr/bin/env python3
+"""
+LEGALS Knowledge Graph Loader
+Loads BNS sections from JSON or CSV files straight into Neo4j, no import folder needed
+
+Usage:
+    python load_graph.py                                   # data/csv_friend/bns_ch17_final_cleaned.csv
+    python load_graph.py ../data/bns_data/bns_ch17_clean.json --batch-size 5000
+    python load_graph.py --dry-run                         # parse and report only
+"""
+import argparse
+import sys
+import os
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from app.core.config import settings
+from app.services.graph_loader import GraphLoader, read_source
+from app.services.graph_schema import bootstrap_schema
+from app.services.neo4j_service import NEO4J_AVAILABLE, open_driver
+
+DEFAULT_SOURCE = os.path.join(
+    os.path.dirname(os.path.abspath(__file__)), "..",
+    "data", "csv_friend", "bns_ch17_final_cleaned.csv"
+)
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="Load BNS sections into the Neo4j knowledge graph")
+    parser.add_argument("sources", nargs="*", default=[DEFAULT_SOURCE], help=".json or .csv section files")
+    parser.add_argument("--batch-size", type=int, default=settings.GRAPH_LOAD_BATCH_SIZE,
+                        help="rows per UNWIND transaction")
+    parser.add_argument("--skip-schema", action="store_true", help="do not create constraints and indexes first")
+    parser.add_argument("--dry-run", action="store_true", help="read the sources without touching Neo4j")
+    return parser.parse_args()
+
+
+def print_batch(stats):
+    print(f"  {stats['step']:<12} batch {stats['batch']:>4}: {stats['rows']:>6} rows "
+          f"in {stats['seconds'] * 1000:8.1f}ms ({stats['rows_per_second']} rows/s)")
+
+
+def main():
+    args = parse_args()
+
+    rows = []
+    for source in args.sources:
+        source_rows = read_source(source)
+        print(f"Read {len(source_rows)} sections from {source}")
+        rows.extend(source_rows)
+
+    if args.dry_run:
+        print(f"Dry run: {len(rows)} sections ready to load in batches of {args.batch_size}")
+        return 0
+
+    if not NEO4J_AVAILABLE:
+        print("Error: neo4j driver not installed")
+        return 1
+
+    driver = open_driver()
+    try:
+        try:
+            driver.verify_connectivity()
+        except Exception as e:
+            print(f"Error: cannot reach Neo4j at {settings.NEO4J_URI}: {e}")
+            return 1
+
+        def session():
+            return driver.session(database=settings.NEO4J_DATABASE)
+
+        if not args.skip_schema:
+            # MERGE on constrained keys is an index lookup; without them every batch scans
+            with session() as schema_session:
+                schema = bootstrap_schema(schema_session)
+            print(f"Schema: {schema['statements']} statements applied, {len(schema['errors'])} errors")
+
+        print(f"Loading into {settings.NEO4J_URI} ({settings.NEO4J_DATABASE})...")
+        report = GraphLoader(session, batch_size=args.batch_size, progress=print_batch).load(rows)
+    finally:
+        driver.close()
+
+    print("=" * 60)
+    print(f"Loaded {report['rows']} sections in {report['seconds']}s ({report['rows_per_second']} sections/s)")
+    print("Refresh a running backend with POST /api/v1/admin/catalog/refresh")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
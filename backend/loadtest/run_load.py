@@ -0,0 +1,292 @@
+#!/usr/bin/env python3
+"""
+LEGALS Load Test Driver
+Replays the API test scenarios at a fixed concurrency and reports latency percentiles and throughput
+
+By default the app runs in-process against a stub Ollama server and the in-memory Neo4j
+stand-in, so results are repeatable and need no services. Pass --url to load a running backend.
+
+Usage:
+    python loadtest/run_load.py                                  # 500 requests, 50 concurrent
+    python loadtest/run_load.py --endpoint stream --formatting --ollama-latency 0.3
+    python loadtest/run_load.py --no-catalog --neo4j-latency 0.005 --pool-size 20 --concurrency 200
+    python loadtest/run_load.py --url http://localhost:8000 --duration 30
+"""
+import argparse
+import asyncio
+import json
+import math
+import os
+import sys
+import time
+from typing import Any, Dict, List, Optional
+
+LOADTEST_DIR = os.path.dirname(os.path.abspath(__file__))
+sys.path.append(os.path.dirname(LOADTEST_DIR))
+sys.path.append(LOADTEST_DIR)
+
+import httpx
+
+from scenarios import load_scenarios
+
+API_PREFIX = "/api/v1/legal"
+GRAPH_SOURCE = os.path.join(LOADTEST_DIR, "..", "..", "data", "csv_friend", "bns_ch17_final_cleaned.csv")
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Load test the LEGALS legal query API")
+    parser.add_argument("--url", help="base URL of a running backend; omit to run the app in-process")
+    parser.add_argument("--endpoint", choices=["query", "stream", "batch"], default="query")
+    parser.add_argument("--concurrency", type=int, default=50)
+    parser.add_argument("--requests", type=int, default=500, help="total requests (ignored with --duration)")
+    parser.add_argument("--duration", type=float, help="run for this many seconds instead of a request count")
+    parser.add_argument("--batch-size", type=int, default=20, help="queries per request with --endpoint batch")
+    parser.add_argument("--language", default="en")
+    parser.add_argument("--warmup", type=int, default=20, help="unmeasured requests sent first")
+    parser.add_argument("--json", dest="json_path", help="write the report to this file")
+
+    stubs = parser.add_argument_group("in-process stand-ins")
+    stubs.add_argument("--formatting", action="store_true", help="format responses with (stub) Ollama")
+    stubs.add_argument("--ollama-latency", type=float, default=0.2, help="seconds to first token")
+    stubs.add_argument("--token-rate", type=float, default=50.0, help="stub tokens per second")
+    stubs.add_argument("--tokens", type=int, default=60, help="stub tokens per response")
+    stubs.add_argument("--neo4j-latency", type=float, default=0.002, help="seconds per stand-in query")
+    stubs.add_argument("--pool-size", type=int, default=100, help="stand-in Neo4j connection pool size")
+    stubs.add_argument("--no-catalog", action="store_true", help="send every lookup to the Neo4j stand-in")
+    stubs.add_argument("--cache", action="store_true", help="keep the response cache enabled")
+    return parser.parse_args(argv)
+
+
+def percentile(sorted_values: List[float], percent: float) -> Optional[float]:
+    """Nearest-rank percentile of an ascending list"""
+    if not sorted_values:
+        return None
+    rank = max(math.ceil(percent / 100 * len(sorted_values)) - 1, 0)
+    return sorted_values[min(rank, len(sorted_values) - 1)]
+
+
+def summarise(samples: List[Dict[str, Any]], elapsed: float, queries_per_request: int = 1) -> Dict[str, Any]:
+    """Latency percentiles, throughput and errors of the measured samples"""
+    latencies = sorted(sample["latency"] * 1000 for sample in samples)
+    first_bytes = sorted(sample["first_byte"] * 1000 for sample in samples if sample.get("first_byte") is not None)
+    errors = [sample for sample in samples if sample["error"]]
+    statuses: Dict[str, int] = {}
+    for sample in samples:
+        statuses[str(sample["status"])] = statuses.get(str(sample["status"]), 0) + 1
+
+    checked = [sample for sample in samples if sample.get("expected")]
+    matched = [sample for sample in checked if set(sample["expected"]) <= set(sample.get("sections", []))]
+
+    def rounded(value):
+        return round(value, 2) if value is not None else None
+
+    return {
+        "requests": len(samples),
+        "errors": len(errors),
+        "statuses": statuses,
+        "seconds": round(elapsed, 3),
+        "rps": round(len(samples) / elapsed, 1) if elapsed else None,
+        "queries_per_second": round(len(samples) * queries_per_request / elapsed, 1) if elapsed else None,
+        "latency_ms": {
+            "p50": rounded(percentile(latencies, 50)),
+            "p95": rounded(percentile(latencies, 95)),
+            "p99": rounded(percentile(latencies, 99)),
+            "max": rounded(latencies[-1] if latencies else None),
+            "mean": rounded(sum(latencies) / len(latencies) if latencies else None)
+        },
+        "first_event_ms": {
+            "p50": rounded(percentile(first_bytes, 50)),
+            "p95": rounded(percentile(first_bytes, 95)),
+            "p99": rounded(percentile(first_bytes, 99))
+        } if first_bytes else None,
+        "expected_sections_matched": f"{len(matched)}/{len(checked)}" if checked else None,
+        "sample_errors": sorted({sample["error"] for sample in errors})[:5]
+    }
+
+
+async def send(client: httpx.AsyncClient, endpoint: str, scenarios: List[Dict[str, Any]],
+               language: str) -> Dict[str, Any]:
+    """One API call for the given scenarios (a single one except for batch requests)"""
+    sample: Dict[str, Any] = {"status": None, "error": None, "first_byte": None}
+    start = time.perf_counter()
+    try:
+        if endpoint == "batch":
+            payload = {"queries": [{"query": scenario["query"], "language": language} for scenario in scenarios]}
+            response = await client.post(f"{API_PREFIX}/query/batch", json=payload)
+            sample["status"] = response.status_code
+            if response.status_code == 200:
+                sample["failed_items"] = response.json().get("failed", 0)
+
+        elif endpoint == "stream":
+            payload = {"query": scenarios[0]["query"], "language": language}
+            async with client.stream("POST", f"{API_PREFIX}/query/stream", json=payload) as response:
+                sample["status"] = response.status_code
+                async for line in response.aiter_lines():
+                    if sample["first_byte"] is None and line.startswith("event:"):
+                        sample["first_byte"] = time.perf_counter() - start
+                    if line.startswith("data:") and '"applicable_laws"' in line:
+                        laws = json.loads(line[5:]).get("applicable_laws", [])
+                        sample["sections"] = [law["section"] for law in laws]
+            sample["expected"] = scenarios[0]["expected_sections"]
+
+        else:
+            payload = {"query": scenarios[0]["query"], "language": language}
+            response = await client.post(f"{API_PREFIX}/query", json=payload)
+            sample["status"] = response.status_code
+            if response.status_code == 200:
+                sample["sections"] = [law["section"] for law in response.json().get("applicable_laws", [])]
+            sample["expected"] = scenarios[0]["expected_sections"]
+
+        if sample["status"] != 200:
+            sample["error"] = f"HTTP {sample['status']}"
+    except Exception as e:
+        sample["error"] = f"{type(e).__name__}: {e}"
+
+    sample["latency"] = time.perf_counter() - start
+    return sample
+
+
+async def generate_load(client: httpx.AsyncClient, scenarios: List[Dict[str, Any]], endpoint: str = "query",
+                        concurrency: int = 50, requests: int = 500, duration: Optional[float] = None,
+                        batch_size: int = 20, language: str = "en", warmup: int = 0) -> Dict[str, Any]:
+    """
+    Replay scenarios round-robin from `concurrency` workers
+
+    Returns:
+        Report from summarise() plus the load parameters
+    """
+    per_request = batch_size if endpoint == "batch" else 1
+    counter = {"next": 0}
+
+    def next_scenarios():
+        index = counter["next"]
+        counter["next"] += 1
+        return [scenarios[(index * per_request + offset) % len(scenarios)] for offset in range(per_request)]
+
+    for _ in range(warmup):
+        await send(client, endpoint, next_scenarios(), language)
+
+    samples: List[Dict[str, Any]] = []
+    deadline = time.perf_counter() + duration if duration else None
+    issued = {"count": 0}
+
+    async def worker():
+        while True:
+            if deadline is not None:
+                if time.perf_counter() >= deadline:
+                    return
+            elif issued["count"] >= requests:
+                return
+            issued["count"] += 1
+            samples.append(await send(client, endpoint, next_scenarios(), language))
+
+    start = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    elapsed = time.perf_counter() - start
+
+    report = summarise(samples, elapsed, per_request)
+    report.update(endpoint=endpoint, concurrency=concurrency, batch_size=per_request if endpoint == "batch" else None)
+    return report
+
+
+def configure_in_process(args, ollama_url: str):
+    """Point the settings and the lazily created services at the stand-ins, then return the app"""
+    from app.core.config import settings
+    from app.services.graph_loader import read_source
+    from app.services.graph_snapshot import GraphSnapshot
+    from app.services.neo4j_service import get_neo4j_service
+    from stub_neo4j import install
+
+    settings.OLLAMA_BASE_URL = ollama_url
+    settings.OLLAMA_RESPONSE_FORMATTING = args.formatting
+    settings.HEALTH_CHECK_INTERVAL = 3600  # keep background pings out of the measurement
+    settings.PERSISTENCE_ENABLED = False  # there is no PostgreSQL stand-in
+    if not args.cache:
+        settings.RESPONSE_CACHE_SIZE = 0
+
+    from main import app
+
+    neo4j = install(
+        get_neo4j_service(), GraphSnapshot.from_rows(read_source(GRAPH_SOURCE), source=GRAPH_SOURCE),
+        latency=args.neo4j_latency, pool_size=args.pool_size
+    )
+    if args.no_catalog:
+        neo4j.catalog.invalidate()
+        neo4j.catalog.is_stale = lambda: False  # every lookup goes to the stand-in
+    return app
+
+
+async def run(args) -> Dict[str, Any]:
+    scenarios = load_scenarios()
+    load = dict(
+        endpoint=args.endpoint, concurrency=args.concurrency, requests=args.requests, duration=args.duration,
+        batch_size=args.batch_size, language=args.language, warmup=args.warmup
+    )
+    limits = httpx.Limits(max_connections=args.concurrency, max_keepalive_connections=args.concurrency)
+
+    if args.url:
+        async with httpx.AsyncClient(base_url=args.url, timeout=120, limits=limits) as client:
+            report = await generate_load(client, scenarios, **load)
+        report["target"] = args.url
+        return report
+
+    from stub_ollama import StubOllamaServer
+
+    ollama = StubOllamaServer(latency=args.ollama_latency, token_rate=args.token_rate, tokens=args.tokens).start()
+    try:
+        app = configure_in_process(args, ollama.url)
+        async with app.router.lifespan_context(app):
+            transport = httpx.ASGITransport(app=app)
+            async with httpx.AsyncClient(transport=transport, base_url="http://loadtest", timeout=120) as client:
+                report = await generate_load(client, scenarios, **load)
+    finally:
+        ollama.stop()
+
+    from app.core.metrics import NEO4J_POOL_SATURATED_TOTAL
+
+    report["target"] = "in-process"
+    # ASGITransport hands over the body only once the app finishes, so there is no real first event
+    report["first_event_ms"] = None
+    report["stand_ins"] = {
+        "ollama_requests": ollama.requests,
+        "ollama_latency": args.ollama_latency if args.formatting else None,
+        "neo4j_latency": args.neo4j_latency,
+        "pool_size": args.pool_size,
+        "pool_saturated_sessions": NEO4J_POOL_SATURATED_TOTAL.value(driver="async"),
+        "catalog": not args.no_catalog
+    }
+    return report
+
+
+def print_report(report: Dict[str, Any]):
+    latency = report["latency_ms"]
+    print("=" * 60)
+    print(f"{report['endpoint']} x{report['requests']} @ concurrency {report['concurrency']} ({report['target']})")
+    print(f"  throughput : {report['rps']} req/s ({report['queries_per_second']} queries/s)")
+    print(f"  latency ms : p50 {latency['p50']}  p95 {latency['p95']}  p99 {latency['p99']}  max {latency['max']}")
+    if report["first_event_ms"]:
+        first = report["first_event_ms"]
+        print(f"  first event: p50 {first['p50']}  p95 {first['p95']}  p99 {first['p99']}")
+    print(f"  errors     : {report['errors']} {report['statuses']}")
+    if report.get("stand_ins"):
+        print(f"  stand-ins  : {report['stand_ins']}")
+    if report["expected_sections_matched"]:
+        print(f"  expected sections matched: {report['expected_sections_matched']}")
+    for error in report["sample_errors"]:
+        print(f"    {error}")
+
+
+def main(argv=None):
+    args = parse_args(argv)
+    report = asyncio.run(run(args))
+    print_report(report)
+
+    if args.json_path:
+        with open(args.json_path, "w", encoding="utf-8") as f:
+            json.dump(report, f, indent=2)
+        print(f"Report written to {args.json_path}")
+    return 1 if report["errors"] else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,52 @@
+"""
+LEGALS Load Test - Scenarios
+Reads the query scenarios out of the repository's API test scripts so the load test replays the same traffic
+"""
+import ast
+import os
+from typing import Any, Dict, List, Optional
+
+REPO_ROOT = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "..")
+
+SCENARIO_SCRIPTS = [
+    "test_complex_scenarios.py",
+    "test_snatching_bns304.py",
+    "test_extortion_bns308.py",
+    "test_breach_of_trust_bns316.py",
+    "test_cheating_bns318.py",
+    "test_mischief_bns324.py",
+    "test_trespass_bns329.py",
+    "test_improved_guidance.py",
+]
+
+
+def read_test_cases(path: str) -> List[Dict[str, Any]]:
+    """Literal `test_cases = [...]` lists from a script, without importing or running it"""
+    with open(path, encoding="utf-8") as f:
+        tree = ast.parse(f.read(), filename=path)
+
+    cases = []
+    for node in ast.walk(tree):
+        if (isinstance(node, ast.Assign)
+                and any(isinstance(target, ast.Name) and target.id == "test_cases" for target in node.targets)):
+            cases.extend(ast.literal_eval(node.value))
+    return cases
+
+
+def load_scenarios(scripts: Optional[List[str]] = None) -> List[Dict[str, Any]]:
+    """
+    Scenarios with name, query, expected sections and source script
+
+    Args:
+        scripts: Script names relative to the repository root, SCENARIO_SCRIPTS by default
+    """
+    scenarios = []
+    for script in scripts or SCENARIO_SCRIPTS:
+        for case in read_test_cases(os.path.join(REPO_ROOT, script)):
+            scenarios.append({
+                "name": case.get("name", case["query"][:40]),
+                "query": case["query"],
+                "expected_sections": case.get("expected_sections", case.get("expected", [])),
+                "source": script
+            })
+    return scenarios
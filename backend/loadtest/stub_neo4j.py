@@ -0,0 +1,150 @@
+"""
+LEGALS Load Test - In-memory Neo4j Stand-in
+Driver look-alikes answering the service's Cypher from a GraphSnapshot with simulated latency
+"""
+import asyncio
+import threading
+import time
+from typing import Any, Dict, List
+
+from app.services.graph_snapshot import GraphSnapshot
+from app.services.neo4j_service import SECTION_LOOKUP_QUERY
+from app.services.section_catalog import CATALOG_QUERY
+
+
+class StubRecord:
+    def __init__(self, data: Dict[str, Any]):
+        self._data = data
+
+    def __getitem__(self, key):
+        return self._data[key]
+
+    def data(self) -> Dict[str, Any]:
+        return dict(self._data)
+
+
+class StubResult:
+    def __init__(self, rows: List[Dict[str, Any]]):
+        self.records = [StubRecord(row) for row in rows]
+
+    def __iter__(self):
+        return iter(self.records)
+
+    def single(self):
+        return self.records[0] if self.records else None
+
+    def consume(self):
+        return None
+
+
+class StubAsyncResult(StubResult):
+    async def data(self) -> List[Dict[str, Any]]:
+        return [record.data() for record in self.records]
+
+    async def consume(self):
+        return None
+
+
+def answer(snapshot: GraphSnapshot, query: str, params: Dict[str, Any]) -> List[Dict[str, Any]]:
+    """Rows Neo4j would return for the statements the backend sends"""
+    if query == SECTION_LOOKUP_QUERY:
+        records = snapshot.section_records(params["sections"])
+        return [row for section_number in params["sections"] for row in records.get(section_number, [])]
+    if query == CATALOG_QUERY:
+        return snapshot.catalog_rows()
+    if "PUNISHED_BY" in query and "MERGE" in query:
+        return [{"linked": len(snapshot.edges.get("PUNISHED_BY", []))}]
+    if "RETURN 1" in query:
+        return [{"test": 1}]
+    return []  # schema statements
+
+
+class StubSession:
+    """One connection from the pool for the length of each query, like a read session"""
+
+    def __init__(self, driver: "StubDriver"):
+        self.driver = driver
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        return False
+
+    def run(self, query, **params):
+        with self.driver.connections:
+            time.sleep(self.driver.latency)
+            return StubResult(answer(self.driver.snapshot, query, params))
+
+    def execute_read(self, work, *args, **kwargs):
+        # The session doubles as the managed transaction
+        return work(self, *args, **kwargs)
+
+    execute_write = execute_read
+
+
+class StubDriver:
+    """Sync driver stand-in with a bounded connection pool"""
+
+    def __init__(self, snapshot: GraphSnapshot, latency: float = 0.002, pool_size: int = 100):
+        self.snapshot = snapshot
+        self.latency = latency
+        self.connections = threading.BoundedSemaphore(pool_size)
+        self.sessions = 0
+
+    def session(self, database=None, **kwargs):
+        self.sessions += 1
+        return StubSession(self)
+
+    def close(self):
+        pass
+
+
+class StubAsyncSession(StubSession):
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *args):
+        return False
+
+    async def run(self, query, **params):
+        async with self.driver.get_connections():
+            await asyncio.sleep(self.driver.latency)
+            return StubAsyncResult(answer(self.driver.snapshot, query, params))
+
+    async def execute_read(self, work, *args, **kwargs):
+        return await work(self, *args, **kwargs)
+
+    execute_write = execute_read
+
+
+class StubAsyncDriver(StubDriver):
+    """Async driver stand-in; the pool semaphore binds to the loop that first uses it"""
+
+    def __init__(self, snapshot: GraphSnapshot, latency: float = 0.002, pool_size: int = 100):
+        super().__init__(snapshot, latency, pool_size)
+        self.pool_size = pool_size
+        self._async_connections = None
+
+    def get_connections(self) -> asyncio.Semaphore:
+        if self._async_connections is None:
+            self._async_connections = asyncio.Semaphore(self.pool_size)
+        return self._async_connections
+
+    def session(self, database=None, **kwargs):
+        self.sessions += 1
+        return StubAsyncSession(self)
+
+    async def close(self):
+        pass
+
+
+def install(service, snapshot: GraphSnapshot, latency: float = 0.002, pool_size: int = 100):
+    """Point a Neo4jService at the stand-in drivers instead of a real database"""
+    service.available = True
+    service.driver = StubDriver(snapshot, latency, pool_size)
+    service.async_driver = StubAsyncDriver(snapshot, latency, pool_size)
+    service._connect_attempted = True
+    service.pool.max_size = pool_size
+    service.refresh_catalog()
+    return service
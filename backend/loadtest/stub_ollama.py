@@ -0,0 +1,148 @@
+#!/usr/bin/env python3
+"""
+LEGALS Load Test - Stub Ollama Server
+Speaks the /api/version and /api/generate subset of the Ollama API with configurable latency
+
+Usage:
+    python loadtest/stub_ollama.py --port 11435 --latency 0.3 --token-rate 40
+    OLLAMA_BASE_URL=http://127.0.0.1:11435 OLLAMA_RESPONSE_FORMATTING=true uvicorn main:app
+"""
+import argparse
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+RESPONSE_TEXT = (
+    "Based on the facts you described, the following provisions of the Bharatiya Nyaya Sanhita apply. "
+    "You should file a complaint at the nearest police station and keep copies of any evidence. "
+)
+
+
+class _Server(ThreadingHTTPServer):
+    daemon_threads = True
+    request_queue_size = 1024  # the default backlog of 5 resets connections under concurrent load
+
+
+class StubOllamaServer:
+    """Threaded HTTP server standing in for Ollama during load tests"""
+
+    def __init__(self, host: str = "127.0.0.1", port: int = 0, latency: float = 0.2,
+                 token_rate: float = 50.0, tokens: int = 60):
+        """
+        Args:
+            host: Interface to bind
+            port: Port to bind, 0 picks a free one
+            latency: Seconds before the first token (prompt evaluation)
+            token_rate: Generated tokens per second after the first
+            tokens: Tokens per response
+        """
+        self.latency = latency
+        self.token_rate = token_rate
+        self.tokens = tokens
+        self.requests = 0
+        self._lock = threading.Lock()
+        self._thread = None
+        self.httpd = _Server((host, port), self._handler())
+
+    @property
+    def url(self) -> str:
+        host, port = self.httpd.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def start(self) -> "StubOllamaServer":
+        self._thread = threading.Thread(target=self.httpd.serve_forever, name="stub-ollama", daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self.httpd.shutdown()
+        self.httpd.server_close()
+
+    def token_stream(self):
+        """Tokens of the canned response, paced like a model generating them"""
+        words = (RESPONSE_TEXT.split(" ") * (self.tokens // 30 + 1))[:self.tokens]
+        time.sleep(self.latency)
+        for index, word in enumerate(words):
+            if index and self.token_rate > 0:
+                time.sleep(1 / self.token_rate)
+            yield word + " "
+
+    def _handler(self):
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+
+            def log_message(self, format, *args):
+                pass  # one line per request would dominate a load test's output
+
+            def do_GET(self):
+                if self.path == "/api/version":
+                    self._send_json({"version": "0.0.0-stub"})
+                elif self.path == "/api/tags":
+                    self._send_json({"models": [{"name": "phi3:mini"}]})
+                else:
+                    self._send_json({"error": "not found"}, status=404)
+
+            def do_POST(self):
+                if self.path != "/api/generate":
+                    self._send_json({"error": "not found"}, status=404)
+                    return
+
+                length = int(self.headers.get("Content-Length", 0))
+                payload = json.loads(self.rfile.read(length) or b"{}")
+                with server._lock:
+                    server.requests += 1
+
+                if payload.get("stream", True):
+                    self._stream(payload)
+                else:
+                    text = "".join(server.token_stream())
+                    self._send_json({"model": payload.get("model"), "response": text, "done": True})
+
+            def _stream(self, payload):
+                self.send_response(200)
+                self.send_header("Content-Type", "application/x-ndjson")
+                self.send_header("Transfer-Encoding", "chunked")
+                self.end_headers()
+                for token in server.token_stream():
+                    self._chunk({"model": payload.get("model"), "response": token, "done": False})
+                self._chunk({"model": payload.get("model"), "response": "", "done": True})
+                self.wfile.write(b"0\r\n\r\n")
+
+            def _chunk(self, data):
+                line = json.dumps(data).encode() + b"\n"
+                self.wfile.write(f"{len(line):x}\r\n".encode() + line + b"\r\n")
+                self.wfile.flush()
+
+            def _send_json(self, data, status=200):
+                body = json.dumps(data).encode()
+                self.send_response(status)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+        return Handler
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Stub Ollama server for load tests")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=11435)
+    parser.add_argument("--latency", type=float, default=0.2, help="seconds before the first token")
+    parser.add_argument("--token-rate", type=float, default=50.0, help="tokens per second")
+    parser.add_argument("--tokens", type=int, default=60, help="tokens per response")
+    args = parser.parse_args()
+
+    server = StubOllamaServer(args.host, args.port, args.latency, args.token_rate, args.tokens)
+    print(f"Stub Ollama listening on {server.url} (latency {args.latency}s, {args.token_rate} tokens/s)")
+    try:
+        server.httpd.serve_forever()
+    except KeyboardInterrupt:
+        server.stop()
+
+
+if __name__ == "__main__":
+    main()
@@ -1,15 +1,31 @@
 """
 LEGALS FastAPI Backend Entry Point
 """
+from contextlib import asynccontextmanager
+from datetime import datetime
+
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import PlainTextResponse
 from fastapi.websockets import WebSocket
 import uvicorn
 
 from app.core.config import settings
+from app.core.metrics import registry
 from app.routers import api_router
-from app.services.ollama_service import ollama_service
-from app.services.neo4j_service import neo4j_service
+from app.services.health_monitor import health_monitor
+from app.services.lifecycle import shutdown_services, warm_up_services
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Application startup/shutdown"""
+    # Services are created and connected here, not at import time
+    app.state.startup = await warm_up_services()
+    health_monitor.start()
+    yield
+    await shutdown_services()
+
 
 # Initialize FastAPI application
 app = FastAPI(
@@ -18,6 +34,7 @@ app = FastAPI(
     version="2.0.0",
     docs_url="/api/docs",
     redoc_url="/api/redoc",
+    lifespan=lifespan,
 )
 
 # Configure CORS
@@ -51,22 +68,24 @@ async def root():
 
 @app.get("/health")
 async def health_check():
-    """Health check endpoint with SLM status"""
-    # Check Ollama service
-    ollama_status = ollama_service.test_connection()
-    
+    """Health check endpoint served from the background dependency snapshot"""
+    snapshot = health_monitor.snapshot()
+
     return {
-        "status": "healthy",
-        "services": {
-            "ollama": ollama_status.get("status", "unknown"),
-            "neo4j": "checking...",
-            "postgres": "checking..."
-        },
+        "status": snapshot["status"],
+        "services": {name: service["status"] for name, service in snapshot["services"].items()},
         "model": settings.OLLAMA_MODEL,
-        "timestamp": "2024-01-01T00:00:00Z"
+        "checked_at": snapshot["checked_at"],
+        "timestamp": datetime.utcnow().isoformat()
     }
 
 
+@app.get("/metrics", response_class=PlainTextResponse)
+async def metrics():
+    """Pipeline, Neo4j, Ollama and cache metrics in Prometheus text format"""
+    return PlainTextResponse(registry.render(), media_type="text/plain; version=0.0.4")
+
+
 @app.websocket("/ws")
 async def websocket_endpoint(websocket: WebSocket):
     """WebSocket endpoint for real-time communication"""
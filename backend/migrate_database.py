@@ -0,0 +1,49 @@
+#!/usr/bin/env python3
+"""
+LEGALS Database Migration
+Creates the PostgreSQL tables and indexes the backend uses and upgrades existing databases:
+JSONB entity and law columns with GIN indexes, query_sections and the statistics rollup
+
+Usage:
+    python migrate_database.py                  # upgrade and backfill
+    python migrate_database.py --skip-backfill  # schema only
+"""
+import argparse
+import sys
+import os
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from app.core.config import settings
+from app.models.database import get_engine
+from app.services.database_schema import upgrade_schema
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="Create or upgrade the LEGALS PostgreSQL schema")
+    parser.add_argument("--skip-backfill", action="store_true",
+                        help="do not fill query_sections or rebuild the statistics rollup")
+    return parser.parse_args()
+
+
+def main():
+    args = parse_args()
+    print(f"Upgrading {settings.POSTGRES_SERVER}/{settings.POSTGRES_DB}...")
+    try:
+        report = upgrade_schema(get_engine(), backfill=not args.skip_backfill)
+    except Exception as e:
+        print(f"Error: migration failed: {e}")
+        return 1
+
+    print("=" * 60)
+    print(f"Tables created:    {', '.join(report['tables']) or 'none'}")
+    print(f"Columns to JSONB:  {', '.join(report['jsonb_columns']) or 'none'}")
+    print(f"Indexes created:   {', '.join(report['indexes']) or 'none'}")
+    if not args.skip_backfill:
+        print(f"query_sections:    {report['query_sections']} section citations")
+        print(f"Statistics rollup: {report['rollup_rows']} rows")
+    print(f"Done in {report['seconds']}s")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
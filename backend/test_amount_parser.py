@@ -0,0 +1,55 @@
+#!/usr/bin/env python3
+"""
+LEGALS Amount Parser Test (No Services Required)
+Checks Indian amount extraction: digit groupings, lakh/crore/k multipliers, number words and rupee markers
+"""
+import sys
+import os
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from app.services.amount_parser import extract_amounts, money_amounts
+
+# (text, [(mention text, value, currency, multiplier, cued), ...])
+EXPECTED_AMOUNTS = [
+    ("Someone stole Rs. 5 lakh from my house", [("Rs. 5 lakh", 500000, True, "lakh", False)]),
+    ("2 crore fraud", [("2 crore", 20000000, False, "crore", False)]),
+    ("my phone worth 80k was snatched", [("80k", 80000, False, "thousand", True)]),
+    ("he took 1,00,000 rupees", [("1,00,000 rupees", 100000, True, None, False)]),
+    ("rs.5000 and INR 2,500", [("rs.5000", 5000, True, None, False), ("INR 2,500", 2500, True, None, False)]),
+    ("2.5 lakhs and 50,000/-", [("2.5 lakhs", 250000, False, "lakh", False), ("50,000/-", 50000, True, None, False)]),
+    ("five lakh rupees", [("five lakh rupees", 500000, True, "lakh", False)]),
+    ("twenty five thousand", [("twenty five thousand", 25000, False, "thousand", False)]),
+    ("पांच हज़ार रुपये", [("पांच हज़ार रुपये", 5000, True, "thousand", False)]),
+    ("चोर ने ५ लाख रुपये चुरा लिए", [("५ लाख रुपये", 500000, True, "lakh", False)]),
+    ("the price of my laptop is 45,000", [("45,000", 45000, False, None, True)]),
+    ("iphone 14 and samsung s23, 5kg of rice", [("14", 14, False, None, False)]),
+    ("a person took a phone", []),
+]
+
+
+def test_extract_amounts():
+    """Values, spans and flags for each supported form"""
+    print("Testing amount extraction...")
+    for text, expected in EXPECTED_AMOUNTS:
+        mentions = extract_amounts(text)
+        found = [(m.text, m.value, m.currency, m.multiplier, m.cued) for m in mentions]
+        assert found == expected, (text, found)
+        for mention in mentions:
+            assert text.lower()[mention.start:mention.end] == mention.text.lower()
+    print(f"PASS: {len(EXPECTED_AMOUNTS)} texts parsed")
+
+
+def test_money_amounts_and_memo():
+    """Bare counts are not money; repeated texts come from the memo"""
+    print("Testing money filter and memoisation...")
+    assert [m.value for m in money_amounts("at 10 pm he took 500 rupees")] == [500]
+    assert extract_amounts("worth 99999999999999999999")[0].value == 99999999999999999999
+
+    text = "stolen laptop worth Rs. 75,000"
+    assert extract_amounts(text) is extract_amounts(text)
+    print("PASS: money filter and memo")
+
+
+if __name__ == "__main__":
+    test_extract_amounts()
+    test_money_amounts_and_memo()
@@ -0,0 +1,187 @@
+#!/usr/bin/env python3
+"""
+LEGALS Async Database Test (No Services Required)
+Async engine settings, and the async routes and DatabaseService methods against SQLite with the real models.
+The SQLite part needs aiosqlite (pip install aiosqlite) and is skipped without it.
+"""
+import asyncio
+import os
+import sys
+import tempfile
+import time
+from datetime import datetime, timedelta, timezone
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from fastapi import HTTPException
+from sqlalchemy import create_engine, event, insert
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+
+try:
+    import aiosqlite  # noqa: F401
+    AIOSQLITE_AVAILABLE = True
+except ImportError:
+    AIOSQLITE_AVAILABLE = False
+
+from app.core.config import settings
+from app.models.database import Base, pool_options
+from app.models.user_models import LegalQuery
+from app.routers.admin import _check_admin_key, get_query_statistics, rebuild_query_statistics
+from app.routers.legal_query import get_query_history, get_query_result
+from app.services.database_service import database_service
+from app.services.persistence_queue import legal_query_row
+from app.services.stored_query_cache import stored_query_cache
+
+START = datetime(2026, 3, 1, tzinfo=timezone.utc)
+ADMIN_KEY = "test-admin-key"
+THEFT = [{"section": "BNS-303", "title": "Theft"}]
+
+
+def test_engine_settings():
+    """Pool sizing and the asyncpg statement cache come from Settings"""
+    print("Testing async engine settings...")
+    options = pool_options()
+    assert options["pool_size"] == settings.POSTGRES_POOL_SIZE
+    assert options["max_overflow"] == settings.POSTGRES_MAX_OVERFLOW
+    assert options["pool_timeout"] == settings.POSTGRES_POOL_TIMEOUT
+    assert options["pool_recycle"] == settings.POSTGRES_POOL_RECYCLE and options["pool_pre_ping"]
+
+    uri = settings.SQLALCHEMY_ASYNC_DATABASE_URI
+    assert uri.startswith("postgresql+asyncpg://") and settings.POSTGRES_DB in uri
+    assert uri.endswith(f"?prepared_statement_cache_size={settings.POSTGRES_STATEMENT_CACHE_SIZE}")
+    print("PASS: async engine settings")
+
+
+def test_admin_key_required():
+    """Admin endpoints reject every call until ADMIN_API_KEY is set, then require it"""
+    print("Testing admin key check...")
+    configured = settings.ADMIN_API_KEY
+    try:
+        for key, supplied in [("", None), ("", "anything"), (ADMIN_KEY, None), (ADMIN_KEY, "wrong")]:
+            settings.ADMIN_API_KEY = key
+            try:
+                _check_admin_key(supplied)
+                assert False, f"admin call allowed with key {key!r} and header {supplied!r}"
+            except HTTPException as e:
+                assert e.status_code == 403
+        settings.ADMIN_API_KEY = ADMIN_KEY
+        _check_admin_key(ADMIN_KEY)
+    finally:
+        settings.ADMIN_API_KEY = configured
+    print("PASS: admin endpoints fail closed")
+
+
+def enforce_foreign_keys(engine):
+    """SQLite ignores REFERENCES unless asked, unlike PostgreSQL"""
+    def on_connect(dbapi_connection, _):
+        cursor = dbapi_connection.cursor()
+        cursor.execute("PRAGMA foreign_keys=ON")
+        cursor.close()
+    event.listen(engine, "connect", on_connect)
+
+
+def make_database(tmp):
+    path = os.path.join(tmp, "legals.db")
+    engine = create_engine(f"sqlite:///{path}")
+    enforce_foreign_keys(engine)
+    Base.metadata.create_all(engine)
+    rows = [legal_query_row(f"q-{n}", f"query {n}", "en", {}, THEFT if n % 2 else [], "advice", 0.8, 0.1,
+                            user_id="u1", created_at=START + timedelta(minutes=n)) for n in range(30)]
+    with engine.begin() as connection:
+        database_service.ensure_users(connection, rows)
+        connection.execute(insert(LegalQuery.__table__), rows)
+        database_service.record_stored_queries(connection, rows)
+    engine.dispose()
+    async_engine = create_async_engine(f"sqlite+aiosqlite:///{path}")
+    enforce_foreign_keys(async_engine.sync_engine)
+    return async_engine
+
+
+async def check_routes(engine):
+    stored_query_cache.clear()
+    async with AsyncSession(engine, expire_on_commit=False) as db:
+        record = await get_query_result("q-3", db=db)
+        assert record["query"] == "query 3" and record["verified"] is False
+        assert await get_query_result("q-3", db=db) is record  # second read is a cache hit
+        try:
+            await get_query_result("missing", db=db)
+            assert False, "unknown query must 404"
+        except HTTPException as e:
+            assert e.status_code == 404
+
+        first = await get_query_history("u1", limit=20, cursor=None, db=db)
+        second = await get_query_history("u1", limit=20, cursor=first["next_cursor"], db=db)
+        seen = [item["query_id"] for item in first["items"] + second["items"]]
+        assert seen == [f"q-{n}" for n in reversed(range(30))] and second["next_cursor"] is None
+        try:
+            await get_query_history("u1", limit=20, cursor="not-a-cursor", db=db)
+            assert False, "malformed cursor must be rejected"
+        except HTTPException as e:
+            assert e.status_code == 400
+
+        assert await database_service.update_query_verification_async(db, "q-3", True)
+        assert (await get_query_result("q-3", db=db))["verified"] is True
+
+        query = await database_service.save_legal_query_async(
+            db, "new query", "hi", {}, THEFT, "advice", 0.6, 0.2, user_id="u2", query_id="new-1"
+        )
+        assert query.query_id == "new-1" and query.language == "hi"
+        cited = await database_service.get_queries_by_section_async(db, "BNS-303")
+        assert len(cited) == 16 and cited[0].query_id == "new-1"
+        assert (await database_service.count_queries_by_section_async(db)) == {"BNS-303": 16}
+
+        summary = await get_query_statistics(start=None, end=None, top_sections=20, x_admin_key=ADMIN_KEY, db=db)
+        assert summary["total_queries"] == 31 and summary["verified_queries"] == 1
+        assert {entry["language"] for entry in summary["languages"]} == {"en", "hi"}
+        assert await rebuild_query_statistics(x_admin_key=ADMIN_KEY, db=db) == {"rollup_rows": 4}
+        assert await get_query_statistics(start=None, end=None, top_sections=20, x_admin_key=ADMIN_KEY, db=db) == summary
+
+
+async def check_overlap(engine):
+    """Lookups on separate sessions run together while the event loop keeps serving other awaits"""
+    async def lookup(n):
+        async with AsyncSession(engine) as db:
+            return await database_service.get_user_query_page_async(db, "u1", limit=5)
+
+    ticks = 0
+
+    async def ticker():
+        nonlocal ticks
+        for _ in range(5):
+            await asyncio.sleep(0.001)
+            ticks += 1
+
+    pages, _ = await asyncio.gather(asyncio.gather(*(lookup(n) for n in range(8))), ticker())
+    assert all(page["items"][0]["query_id"] == "q-29" for page in pages)
+    assert ticks == 5
+
+
+def test_async_routes():
+    """Legal and admin routes on an AsyncSession"""
+    if not AIOSQLITE_AVAILABLE:
+        print("SKIP: aiosqlite is not installed")
+        return
+    print("Testing async routes...")
+    with tempfile.TemporaryDirectory() as tmp:
+        engine = make_database(tmp)
+        configured = settings.ADMIN_API_KEY
+
+        async def run():
+            settings.ADMIN_API_KEY = ADMIN_KEY
+            try:
+                await check_routes(engine)
+                start = time.perf_counter()
+                await check_overlap(engine)
+                return time.perf_counter() - start
+            finally:
+                settings.ADMIN_API_KEY = configured
+                await engine.dispose()
+
+        elapsed = asyncio.run(run())
+        stored_query_cache.clear()
+    print(f"PASS: async routes (8 concurrent history pages in {elapsed * 1000:.1f} ms)")
+
+
+if __name__ == "__main__":
+    test_engine_settings()
+    test_admin_key_required()
+    test_async_routes()
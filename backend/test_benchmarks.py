@@ -0,0 +1,73 @@
+#!/usr/bin/env python3
+"""
+LEGALS Benchmark Suite Test (No Services Required)
+Checks the inputs, baseline storage and regression check used by benchmarks/run_benchmarks.py
+"""
+import os
+import sys
+import tempfile
+BACKEND_DIR = os.path.dirname(os.path.abspath(__file__))
+sys.path.append(BACKEND_DIR)
+sys.path.append(os.path.join(BACKEND_DIR, "benchmarks"))
+
+from run_benchmarks import (
+    MAX_QUERY_LENGTH, compare, load_baseline, load_training_cases, run_benchmarks, save_baseline,
+    synthesise_long_queries
+)
+
+
+def test_inputs():
+    """Training cases load in full; synthetic queries are deterministic and within the router's limit"""
+    print("Testing benchmark inputs...")
+    cases = load_training_cases()
+    assert len(cases) >= 190
+    assert all(case["query"] and isinstance(case["entities"], dict) for case in cases)
+
+    queries = [case["query"] for case in cases]
+    long_queries = synthesise_long_queries(queries, count=10)
+    assert long_queries == synthesise_long_queries(queries, count=10)
+    assert all(MAX_QUERY_LENGTH - 150 < len(query) <= MAX_QUERY_LENGTH for query in long_queries)
+    print(f"PASS: {len(cases)} training cases, long inputs up to {max(map(len, long_queries))} chars")
+
+
+def test_baseline_round_trip_and_regressions():
+    """Baselines merge on update and slowdowns over the threshold are flagged"""
+    print("Testing baselines...")
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "baselines.json")
+        assert load_baseline(path) == {}
+        save_baseline({"a/training": {"per_call_us": 10.0}, "b/training": {"per_call_us": 4.0}}, path)
+        save_baseline({"a/training": {"per_call_us": 8.0}}, path)
+        baseline = load_baseline(path)
+
+    assert baseline["benchmarks"] == {"a/training": {"per_call_us": 8.0}, "b/training": {"per_call_us": 4.0}}
+
+    rows = {row["benchmark"]: row for row in compare({
+        "a/training": {"per_call_us": 9.0},   # +12.5%
+        "b/training": {"per_call_us": 6.0},   # +50%
+        "c/training": {"per_call_us": 1.0},   # not in the baseline
+    }, baseline, threshold=0.25)}
+    assert not rows["a/training"]["regression"]
+    assert rows["b/training"]["regression"] and abs(rows["b/training"]["change"] - 0.5) < 1e-9
+    assert rows["c/training"]["change"] is None and not rows["c/training"]["regression"]
+    print("PASS: baselines merge and regressions are flagged")
+
+
+def test_suite_runs():
+    """Every benchmark runs over both input sets"""
+    print("Testing a single pass of the suite...")
+    results = run_benchmarks(repeat=1)
+    names = {key.split("/")[0] for key in results}
+    assert names == {"entity_extraction", "amount_extraction", "rule_evaluation", "estimate_value",
+                     "property_analysis", "fallback_response", "estimate_values_batch"}
+    assert {key.split("/")[1] for key in results} == {"training", "long"}
+    assert all(result["per_call_us"] > 0 for result in results.values())
+
+    assert set(run_benchmarks(repeat=1, only=["estimate_value"])) == {"estimate_value/training", "estimate_value/long"}
+    print(f"PASS: {len(results)} benchmarks ran")
+
+
+if __name__ == "__main__":
+    test_inputs()
+    test_baseline_round_trip_and_regressions()
+    test_suite_runs()
@@ -0,0 +1,117 @@
+#!/usr/bin/env python3
+"""
+LEGALS Graph Snapshot Test (No Neo4j Required)
+Checks snapshot round-trips and that the service serves full graph answers from a snapshot
+"""
+import os
+import sys
+import tempfile
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from app.core.config import settings
+from app.core.metrics import FALLBACK_REASONING_TOTAL
+from app.services.graph_loader import read_source
+from app.services.graph_snapshot import NODE_KEYS, GraphSnapshot
+from app.services.neo4j_service import Neo4jService
+
+CSV_SOURCE = os.path.join(
+    os.path.dirname(os.path.abspath(__file__)), "..", "data", "csv_friend", "bns_ch17_final_cleaned.csv"
+)
+ENTITIES = {"actions": ["stole"], "objects": ["phone"], "locations": ["house"]}
+
+
+class SnapshotSession:
+    """Answers the export queries from an existing snapshot, standing in for Neo4j"""
+
+    def __init__(self, snapshot):
+        self.snapshot = snapshot
+
+    def execute_read(self, work, *args, **kwargs):
+        return work(self, *args, **kwargs)
+
+    def run(self, query):
+        for label in NODE_KEYS:
+            if query.startswith(f"MATCH (n:{label})"):
+                return [{"props": dict(props)} for props in self.snapshot.nodes[label].values()]
+        rel_type = query.split("[:")[1].split("]")[0]
+        return [{"source": source, "target": target} for source, target in self.snapshot.edges[rel_type]]
+
+
+def build_snapshot():
+    return GraphSnapshot.from_rows(read_source(CSV_SOURCE), source="test")
+
+
+def test_snapshot_round_trip():
+    """save/load and export reproduce the same lookups"""
+    print("Testing snapshot round-trip...")
+    snapshot = build_snapshot()
+
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "graph.json.gz")
+        size = snapshot.save(path)
+        loaded = GraphSnapshot.load(path)
+
+    exported = GraphSnapshot.export(SnapshotSession(snapshot))
+
+    assert len(snapshot.catalog_rows()) == 32
+    for other in (loaded, exported):
+        assert other.catalog_rows() == snapshot.catalog_rows()
+        assert other.section_records([303, 305, 999]) == snapshot.section_records([303, 305, 999])
+    records = snapshot.section_records([305, 303])
+    assert list(records) == [305, 303] and records[303][0]["section"] == "BNS-303"
+    print(f"PASS: 32 sections round-tripped through a {size / 1024:.1f} KiB snapshot")
+
+
+def test_service_serves_from_snapshot():
+    """Snapshot-only mode answers from the graph data without Neo4j or the hardcoded fallback"""
+    print("Testing snapshot-only service...")
+    original = (settings.GRAPH_SNAPSHOT_PATH, settings.GRAPH_SNAPSHOT_ONLY)
+    with tempfile.TemporaryDirectory() as directory:
+        settings.GRAPH_SNAPSHOT_PATH = os.path.join(directory, "graph.json.gz")
+        settings.GRAPH_SNAPSHOT_ONLY = True
+        try:
+            build_snapshot().save(settings.GRAPH_SNAPSHOT_PATH)
+            fallbacks_before = sum(FALLBACK_REASONING_TOTAL.value(reason=reason)
+                                   for reason in ("query_failed", "neo4j_unavailable"))
+            service = Neo4jService()
+            laws = service.find_applicable_laws(ENTITIES)
+        finally:
+            settings.GRAPH_SNAPSHOT_PATH, settings.GRAPH_SNAPSHOT_ONLY = original
+
+    fallbacks_after = sum(FALLBACK_REASONING_TOTAL.value(reason=reason)
+                          for reason in ("query_failed", "neo4j_unavailable"))
+    assert service.mode == "snapshot" and service.driver is None
+    assert [law["section"] for law in laws] == ["BNS-303", "BNS-305"]
+    assert laws[0]["title"] == "Theft" and "fallback" not in laws[0]["reasoning"]
+    assert fallbacks_after == fallbacks_before
+    assert service.verify_legal_facts({})["verified"] is True
+    print(f"PASS: served {len(laws)} laws from the snapshot")
+
+
+def test_default_snapshot_from_bundled_source():
+    """Without a snapshot file the bundled section source is served; without either, no laws are made up"""
+    print("Testing snapshot built from the bundled source...")
+    original = (settings.GRAPH_SNAPSHOT_PATH, settings.GRAPH_SNAPSHOT_ONLY, settings.GRAPH_SOURCE_PATH)
+    settings.GRAPH_SNAPSHOT_PATH, settings.GRAPH_SNAPSHOT_ONLY = "", True
+    try:
+        service = Neo4jService()
+        laws = service.find_applicable_laws(ENTITIES)
+        expected = build_snapshot().section_records([303])[303][0]
+
+        settings.GRAPH_SOURCE_PATH = ""
+        bare = Neo4jService()
+        bare_laws = bare.find_applicable_laws(ENTITIES)
+    finally:
+        settings.GRAPH_SNAPSHOT_PATH, settings.GRAPH_SNAPSHOT_ONLY, settings.GRAPH_SOURCE_PATH = original
+
+    assert service.mode == "snapshot" and len(service.snapshot.catalog_rows()) == 32
+    assert [law["section"] for law in laws] == ["BNS-303", "BNS-305"]
+    assert (laws[0]["title"], laws[0]["punishment"]) == (expected["title"], expected["punishment"])
+    assert bare.mode == "fallback" and bare_laws == []
+    print("PASS: bundled source served, nothing cited without graph data")
+
+
+if __name__ == "__main__":
+    test_snapshot_round_trip()
+    test_service_serves_from_snapshot()
+    test_default_snapshot_from_bundled_source()
@@ -0,0 +1,58 @@
+#!/usr/bin/env python3
+"""
+LEGALS Lazy Startup Test
+Importing the app must not touch the network; services are built by the warm-up
+"""
+import asyncio
+import subprocess
+import sys
+import os
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+BACKEND_DIR = os.path.dirname(os.path.abspath(__file__))
+
+# Fails the import if anything opens a socket connection
+IMPORT_PROBE = """
+import socket, time
+def refuse(self, address):
+    raise AssertionError(f"network I/O during import: {address}")
+socket.socket.connect = refuse
+socket.create_connection = lambda *args, **kwargs: refuse(None, args[0] if args else None)
+start = time.perf_counter()
+import main
+import app.services.neo4j_service as neo4j_module
+import app.services.legal_processing_service as processing_module
+assert neo4j_module._neo4j_service is None
+assert processing_module._legal_processor is None
+print(f"{time.perf_counter() - start:.3f}")
+"""
+
+
+def test_import_does_no_network_io():
+    """`import main` creates no services and opens no connections"""
+    print("Testing import-time side effects...")
+    result = subprocess.run(
+        [sys.executable, "-c", IMPORT_PROBE], cwd=BACKEND_DIR, capture_output=True, text=True, timeout=60
+    )
+    assert result.returncode == 0, result.stderr
+    print(f"PASS: main imported in {result.stdout.strip()}s without network I/O")
+
+
+def test_warm_up_report():
+    """Warm-up builds the services and reports every phase against the budget"""
+    print("Testing warm-up...")
+    from app.services.lifecycle import warm_up_services
+    from app.services.health_monitor import health_monitor
+
+    report = asyncio.run(warm_up_services(budget=30))
+
+    assert {"services", "neo4j", "health"} <= set(report["phases"])
+    assert report["within_budget"]
+    assert report["neo4j_mode"] in ("graph", "snapshot")
+    assert health_monitor.snapshot()["checked_at"] is not None
+    print(f"PASS: warm-up took {report['total_seconds']}s ({report['phases']})")
+
+
+if __name__ == "__main__":
+    test_import_does_no_network_io()
+    test_warm_up_report()
@@ -0,0 +1,84 @@
+#!/usr/bin/env python3
+"""
+LEGALS Load Test Harness Test (No Services Required)
+Checks the scenario reader, stand-ins and report maths used by loadtest/run_load.py
+"""
+import asyncio
+import json
+import os
+import sys
+BACKEND_DIR = os.path.dirname(os.path.abspath(__file__))
+sys.path.append(BACKEND_DIR)
+sys.path.append(os.path.join(BACKEND_DIR, "loadtest"))
+
+import httpx
+
+from app.services.graph_loader import read_source
+from app.services.graph_snapshot import GraphSnapshot
+from app.services.neo4j_service import Neo4jService
+from run_load import GRAPH_SOURCE, generate_load, percentile
+from scenarios import load_scenarios
+from stub_neo4j import install
+from stub_ollama import StubOllamaServer
+
+
+def test_scenarios_and_percentiles():
+    """Scenarios come from the API test scripts; percentiles use nearest rank"""
+    print("Testing scenarios and percentiles...")
+    scenarios = load_scenarios()
+    assert len(scenarios) >= 50
+    assert all(scenario["query"] for scenario in scenarios)
+    assert any("BNS-308" in scenario["expected_sections"] for scenario in scenarios)
+
+    values = list(range(1, 101))
+    assert (percentile(values, 50), percentile(values, 95), percentile(values, 99)) == (50, 95, 99)
+    assert percentile([], 50) is None
+    print(f"PASS: {len(scenarios)} scenarios loaded")
+
+
+def test_load_driver_counts_requests():
+    """The driver issues exactly the requested number of calls and reports them"""
+    print("Testing load driver...")
+    seen = []
+
+    def handler(request):
+        seen.append(json.loads(request.content)["query"])
+        return httpx.Response(200, json={"applicable_laws": [{"section": "BNS-303"}]})
+
+    async def run():
+        async with httpx.AsyncClient(transport=httpx.MockTransport(handler), base_url="http://t") as client:
+            return await generate_load(client, load_scenarios(), concurrency=8, requests=40, warmup=2)
+
+    report = asyncio.run(run())
+    assert report["requests"] == 40 and report["errors"] == 0 and len(seen) == 42
+    assert report["latency_ms"]["p50"] is not None and report["rps"] > 0
+    print(f"PASS: {report['requests']} requests at {report['rps']} req/s")
+
+
+def test_stand_ins():
+    """Stub Ollama streams NDJSON tokens; the Neo4j stand-in answers the service's lookups"""
+    print("Testing stand-ins...")
+    server = StubOllamaServer(latency=0, token_rate=0, tokens=5).start()
+    try:
+        with httpx.Client(base_url=server.url) as client:
+            assert client.get("/api/version").json()["version"]
+            lines = client.post("/api/generate", json={"prompt": "x", "stream": True}).text.splitlines()
+    finally:
+        server.stop()
+    assert len(lines) == 6 and json.loads(lines[-1])["done"] is True
+
+    service = install(Neo4jService(), GraphSnapshot.from_rows(read_source(GRAPH_SOURCE)), latency=0)
+    service.catalog.invalidate()
+    service.catalog.is_stale = lambda: False  # go through the stand-in driver
+
+    entities = {"actions": ["stole"], "objects": ["phone"], "locations": ["house"]}
+    laws = asyncio.run(service.find_applicable_laws_async(entities))
+    assert [law["section"] for law in laws] == ["BNS-303", "BNS-305"]
+    assert service.async_driver.sessions == 1
+    print("PASS: stand-ins answer like the real services")
+
+
+if __name__ == "__main__":
+    test_scenarios_and_percentiles()
+    test_load_driver_counts_requests()
+    test_stand_ins()
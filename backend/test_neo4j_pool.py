@@ -0,0 +1,160 @@
+#!/usr/bin/env python3
+"""
+LEGALS Neo4j Connection Pool Test (No Neo4j Required)
+Checks driver pool settings and the saturation metrics under concurrent lookups
+"""
+import asyncio
+import sys
+import os
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+import app.services.neo4j_service as neo4j_module
+from app.core.config import settings
+from app.core.metrics import (
+    NEO4J_ACQUISITION_TIMEOUTS_TOTAL,
+    NEO4J_CONNECTION_WAIT_SECONDS,
+    NEO4J_POOL_SATURATED_TOTAL,
+    NEO4J_SESSIONS_IN_USE,
+)
+from app.services.neo4j_service import PoolMonitor, driver_config, open_driver
+
+from test_section_catalog import FakeAsyncSession, FakeDriver, make_service
+
+ENTITIES = {"actions": ["stole"], "objects": ["phone"], "locations": ["house"]}
+
+
+class PooledAsyncSession(FakeAsyncSession):
+    """Holds one of a fixed number of connections for the length of a transaction"""
+
+    def __init__(self, counter, connections):
+        super().__init__(counter)
+        self.connections = connections
+
+    async def execute_read(self, work, *args, **kwargs):
+        async with self.connections:
+            await asyncio.sleep(0.005)
+            return await work(self, *args, **kwargs)
+
+
+class PooledAsyncDriver(FakeDriver):
+    def __init__(self, pool_size):
+        super().__init__()
+        self.connections = asyncio.Semaphore(pool_size)
+
+    def session(self, database=None):
+        return PooledAsyncSession(self.counter, self.connections)
+
+
+class RecordingDriverFactory:
+    def __init__(self, known_options=None):
+        self.kwargs = None
+        self.known_options = known_options
+
+    def driver(self, uri, **kwargs):
+        unknown = set(kwargs) - {"auth"} - set(self.known_options or kwargs)
+        if unknown:
+            raise neo4j_module.ConfigurationError(f"Unexpected config keys: {', '.join(sorted(unknown))}")
+        self.kwargs = kwargs
+        return object()
+
+
+def test_drivers_use_pool_settings():
+    """Both drivers are built with the pool settings from Settings"""
+    print("Testing driver pool configuration...")
+    config = driver_config()
+    assert config["max_connection_pool_size"] == settings.NEO4J_MAX_CONNECTION_POOL_SIZE
+    assert config["connection_acquisition_timeout"] == settings.NEO4J_CONNECTION_ACQUISITION_TIMEOUT
+    if neo4j_module.LIVENESS_CHECK_SUPPORTED:
+        assert config["liveness_check_timeout"] == settings.NEO4J_LIVENESS_CHECK_TIMEOUT
+    assert config["keep_alive"] == settings.NEO4J_KEEP_ALIVE
+
+    factory = RecordingDriverFactory()
+    original = neo4j_module.AsyncGraphDatabase
+    neo4j_module.AsyncGraphDatabase = factory
+    try:
+        make_service()._get_async_driver()
+    finally:
+        neo4j_module.AsyncGraphDatabase = original
+
+    assert {key: factory.kwargs[key] for key in config} == config
+    print(f"PASS: drivers configured with {config}")
+
+
+def test_liveness_check_feature_detected():
+    """A driver that rejects liveness_check_timeout is built without it, and it is not offered again"""
+    if not neo4j_module.NEO4J_AVAILABLE:
+        print("SKIP: neo4j driver is not installed")
+        return
+    print("Testing liveness check detection...")
+    older = [key for key in driver_config() if key != "liveness_check_timeout"]
+    factory = RecordingDriverFactory(known_options=older)
+    try:
+        neo4j_module.LIVENESS_CHECK_SUPPORTED = True
+        open_driver(factory)
+        assert sorted(factory.kwargs) == sorted(older + ["auth"])
+        assert not neo4j_module.LIVENESS_CHECK_SUPPORTED
+        assert "liveness_check_timeout" not in driver_config()
+    finally:
+        neo4j_module.LIVENESS_CHECK_SUPPORTED = True
+    print("PASS: liveness checks dropped for older drivers")
+
+
+def test_saturation_is_measured():
+    """200 concurrent lookups on a 50 connection pool queue visibly instead of silently"""
+    print("Testing pool saturation metrics...")
+    service = make_service()
+    service.pool = PoolMonitor(max_size=50)
+    service.catalog.is_stale = lambda: False  # force the direct lookup path
+
+    saturated_before = NEO4J_POOL_SATURATED_TOTAL.value(driver="async")
+    waits_before = NEO4J_CONNECTION_WAIT_SECONDS.count(driver="async")
+
+    async def run():
+        service.async_driver = PooledAsyncDriver(pool_size=50)
+        return await asyncio.gather(*(service.find_applicable_laws_async(ENTITIES) for _ in range(200)))
+
+    results = asyncio.run(run())
+
+    assert all([law["section"] for law in laws] == ["BNS-303", "BNS-305"] for laws in results)
+    assert service.async_driver.counter["queries"] == 200
+    assert NEO4J_POOL_SATURATED_TOTAL.value(driver="async") - saturated_before == 150
+    assert NEO4J_CONNECTION_WAIT_SECONDS.count(driver="async") - waits_before == 200
+    assert NEO4J_SESSIONS_IN_USE.value(driver="async") == 0
+    print(f"PASS: {service.pool.stats()['saturated']['async']:.0f} saturated sessions recorded")
+
+
+def test_acquisition_timeout_is_counted():
+    """A pool acquisition timeout is counted and the lookup falls back to the graph snapshot"""
+    if not neo4j_module.NEO4J_AVAILABLE:
+        print("SKIP: neo4j driver is not installed")
+        return
+    print("Testing acquisition timeout...")
+    service = make_service()
+    service.catalog.is_stale = lambda: False
+
+    def exhausted(work, *args, **kwargs):
+        raise neo4j_module.ClientError("failed to obtain a connection from the pool within 5.0s (timeout)")
+
+    original_session = service.driver.session
+
+    def session(database=None):
+        fake = original_session(database)
+        fake.execute_read = exhausted
+        return fake
+
+    service.driver.session = session
+    before = NEO4J_ACQUISITION_TIMEOUTS_TOTAL.value(driver="sync")
+
+    laws = service.find_applicable_laws(ENTITIES)
+
+    assert NEO4J_ACQUISITION_TIMEOUTS_TOTAL.value(driver="sync") - before == 1
+    assert NEO4J_SESSIONS_IN_USE.value(driver="sync") == 0
+    assert [law["section"] for law in laws] == ["BNS-303", "BNS-305"] and laws[0]["title"] == "Theft"
+    print("PASS: acquisition timeout counted, snapshot fallback served")
+
+
+if __name__ == "__main__":
+    test_drivers_use_pool_settings()
+    test_liveness_check_feature_detected()
+    test_saturation_is_measured()
+    test_acquisition_timeout_is_counted()
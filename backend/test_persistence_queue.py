@@ -0,0 +1,161 @@
+#!/usr/bin/env python3
+"""
+LEGALS Persistence Queue Test (No Services Required)
+Runs the write-behind queue against the legal_queries table in a SQLite file:
+batching, backpressure, rejected rows and spill/replay across a database outage
+"""
+import os
+import sys
+import tempfile
+import time
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from sqlalchemy import create_engine, event, func, select
+
+from app.core.metrics import PERSISTENCE_BATCH_ROWS
+from app.models.database import Base
+from app.models.user_models import LegalQuery, User
+from app.services.persistence_queue import PersistenceQueue, legal_query_row
+from app.services.stored_query_cache import stored_query_cache
+
+legal_queries = LegalQuery.__table__
+
+
+def make_row(n: int, **overrides):
+    row = legal_query_row(
+        f"q-{n}", f"someone stole my phone {n}", "en", {"objects": ["phone"]},
+        [{"section": "BNS-303"}], "advice", 0.9, 0.01
+    )
+    row.update(overrides)
+    return row
+
+
+def stored_ids(engine):
+    with engine.connect() as connection:
+        return sorted(connection.execute(select(legal_queries.c.query_id)).scalars())
+
+
+def test_batches_are_written():
+    """Rows are grouped into batches and everything queued is written by stop()"""
+    print("Testing batched writes...")
+    with tempfile.TemporaryDirectory() as tmp:
+        engine = create_engine(f"sqlite:///{os.path.join(tmp, 'legals.db')}")
+        Base.metadata.create_all(engine)
+        spill_path = os.path.join(tmp, "spill.jsonl")
+        batches_before = PERSISTENCE_BATCH_ROWS.count()
+
+        persistence = PersistenceQueue(engine, legal_queries, enabled=True, max_size=100, batch_size=10,
+                                       flush_interval=0.05, spill_path=spill_path)
+        assert persistence.start()
+        assert all(persistence.submit(make_row(n)) for n in range(25))
+        assert persistence.stop(timeout=5) == 0
+
+        assert stored_ids(engine) == sorted(f"q-{n}" for n in range(25))
+        assert persistence.written == 25 and not os.path.exists(spill_path)
+        assert 3 <= PERSISTENCE_BATCH_ROWS.count() - batches_before < 25
+        assert not persistence.submit(make_row(99))  # stopped
+        engine.dispose()
+    print("PASS: 25 rows written in batches")
+
+
+def test_rejected_rows_and_duplicates():
+    """A row the database rejects does not hold back its batch; replayed rows are not stored twice"""
+    print("Testing rejected and duplicate rows...")
+    with tempfile.TemporaryDirectory() as tmp:
+        engine = create_engine(f"sqlite:///{os.path.join(tmp, 'legals.db')}")
+        Base.metadata.create_all(engine)
+        persistence = PersistenceQueue(engine, legal_queries, enabled=True, batch_size=10,
+                                       flush_interval=0.05, spill_path="")
+        persistence.start()
+        stored_query_cache.clear()
+        for n in (1, 2):
+            stored_query_cache.put({"query_id": f"q-{n}", "query": f"query {n}"})
+        persistence.submit(make_row(1))
+        persistence.submit(make_row(2, query_text=None))  # violates NOT NULL
+        persistence.submit(make_row(3))
+        persistence.submit(make_row(1))  # sent again after an unknown commit outcome
+        persistence.stop(timeout=5)
+
+        assert stored_ids(engine) == ["q-1", "q-3"]
+        assert persistence.dropped == 1
+        assert stored_query_cache.get("q-1") is not None
+        assert stored_query_cache.get("q-2") is None  # never stored, so no longer served
+        stored_query_cache.clear()
+        engine.dispose()
+    print("PASS: bad row isolated, duplicate skipped, rejected row uncached")
+
+
+def test_user_ids_with_foreign_keys():
+    """Queries sent with a user_id are stored with foreign keys enforced, registering their user"""
+    print("Testing rows owned by users...")
+    with tempfile.TemporaryDirectory() as tmp:
+        engine = create_engine(f"sqlite:///{os.path.join(tmp, 'legals.db')}")
+        event.listen(engine, "connect", lambda connection, _: connection.execute("PRAGMA foreign_keys=ON"))
+        Base.metadata.create_all(engine)
+        persistence = PersistenceQueue(engine, enabled=True, batch_size=10, flush_interval=0.05, spill_path="")
+        persistence.start()  # default wiring: legal_queries with its users and rollup hooks
+        owners = [None, "alice", None, "alice", "bob"]
+        for n, user_id in enumerate(owners):
+            persistence.submit(make_row(n, user_id=user_id))
+        persistence.stop(timeout=5)
+
+        assert stored_ids(engine) == [f"q-{n}" for n in range(len(owners))]
+        assert persistence.dropped == 0 and persistence.written == len(owners)
+        with engine.connect() as connection:
+            assert sorted(connection.execute(select(User.user_id)).scalars()) == ["alice", "bob"]
+            assert connection.execute(select(func.count()).where(legal_queries.c.user_id == "alice")).scalar() == 2
+        engine.dispose()
+    print("PASS: 5 rows stored, 2 users registered")
+
+
+def test_backpressure_spill_and_replay():
+    """While the database is down the queue stays bounded; unwritten rows survive a restart"""
+    print("Testing backpressure and spill/replay...")
+    with tempfile.TemporaryDirectory() as tmp:
+        engine = create_engine(f"sqlite:///{os.path.join(tmp, 'legals.db')}")  # table missing: every flush fails
+        spill_path = os.path.join(tmp, "spill.jsonl")
+
+        persistence = PersistenceQueue(engine, legal_queries, enabled=True, max_size=5, batch_size=5,
+                                       flush_interval=0.02, spill_path=spill_path)
+        persistence.start()
+        start = time.perf_counter()
+        accepted = [n for n in range(30) if persistence.submit(make_row(n))]
+        assert time.perf_counter() - start < 0.05  # a full queue never blocks the caller
+        assert persistence.depth() <= 10  # max_size queued plus one batch in flight
+        assert persistence.dropped == 30 - len(accepted) > 0
+
+        spilled = persistence.stop(timeout=0.2)
+        assert spilled == len(accepted) and persistence.failed_flushes > 0
+        assert os.path.exists(spill_path)
+
+        Base.metadata.create_all(engine)  # database is back
+        restarted = PersistenceQueue(engine, legal_queries, enabled=True, batch_size=5,
+                                     flush_interval=0.02, spill_path=spill_path)
+        restarted.start()
+        assert restarted.stop(timeout=5) == 0
+
+        assert stored_ids(engine) == sorted(f"q-{n}" for n in accepted)
+        assert not os.path.exists(spill_path)
+        with engine.connect() as connection:
+            assert connection.execute(select(func.count()).where(legal_queries.c.created_at.isnot(None))).scalar() \
+                == len(accepted)
+        engine.dispose()
+    print(f"PASS: {len(accepted)} accepted rows replayed after the outage, {persistence.dropped} dropped")
+
+
+def test_disabled_queue_accepts_nothing():
+    """Without a database the pipeline keeps running and nothing is queued"""
+    print("Testing disabled queue...")
+    persistence = PersistenceQueue(enabled=False)
+    assert not persistence.start()
+    assert not persistence.submit(make_row(1))
+    assert persistence.stop() == 0 and persistence.depth() == 0
+    print("PASS: disabled queue")
+
+
+if __name__ == "__main__":
+    test_batches_are_written()
+    test_rejected_rows_and_duplicates()
+    test_user_ids_with_foreign_keys()
+    test_backpressure_spill_and_replay()
+    test_disabled_queue_accepts_nothing()
@@ -0,0 +1,152 @@
+#!/usr/bin/env python3
+"""
+LEGALS Property Value Estimator Test (No Services Required)
+Pins the estimate for each price row of the value database
+"""
+import sys
+import os
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from app.services.property_value_estimator import PropertyValueEstimator, VALUE_CATEGORIES, VALUE_DATABASE
+
+# (item, description, value, confidence, basis)
+EXPECTED_ESTIMATES = [
+    ("iPhone 14 Pro", "", 79000, "high", "iPhone 14 market price"),
+    ("iphone", "", 60000, "medium", "Generic iPhone price"),
+    ("Samsung S23 phone", "", 65000, "high", "Samsung flagship price"),
+    ("samsung mobile", "", 30000, "medium", "Samsung mid-range price"),
+    ("phone", "", 25000, "low", "Generic smartphone price"),
+    ("MacBook Pro", "", 150000, "high", "MacBook Pro market price"),
+    ("laptop", "HP", 60000, "medium", "Branded laptop average price"),
+    ("iPad", "", 45000, "high", "iPad standard market price"),
+    ("gold chain", "", 25000, "medium", "Gold chain average price"),
+    ("earrings", "", 10000, "low", "Generic jewelry price"),
+    ("Rolex watch", "", 200000, "high", "Luxury watch brand"),
+    ("bike", "", 80000, "medium", "Motorcycle average price"),
+    ("cash", "4,500 rupees in the drawer", 4500, "high", "Explicit cash amount mentioned"),
+    ("money", "about a thousand", 1000, "high", "Explicit cash amount mentioned"),
+    ("money", "a few thousands", 3000, "medium", "Approximate cash amount"),
+    ("gold chain", "worth Rs. 2 lakh", 200000, "high", "User mentioned explicit value"),
+    ("driving license", "", 500, "high", "License replacement cost"),
+    ("credit cards", "", 800000, "medium", "Average car price"),  # substring match, as before
+    ("Nike shoes", "", 4000, "medium", "Branded clothing"),
+    ("wallet", "", 10000, "low", "Generic property estimation"),
+    ("laptop", "worth 32,000", 32000, "high", "User mentioned explicit value"),
+]
+
+
+def test_estimates_per_price_row():
+    """Items resolve to the same price row as the keyword chain they replaced"""
+    print("Testing property value estimates...")
+    estimator = PropertyValueEstimator()
+    for item, description, value, confidence, basis in EXPECTED_ESTIMATES:
+        estimated, estimated_confidence, estimated_basis = estimator._estimate_single_item(item, description)
+        assert (estimated, estimated_confidence.value, estimated_basis) == (value, confidence, basis), item
+    print(f"PASS: {len(EXPECTED_ESTIMATES)} estimates across {len(VALUE_DATABASE)} categories")
+
+
+def test_estimate_value_totals():
+    """Totals and thresholds are computed from the per-item estimates"""
+    print("Testing estimate_value totals...")
+    analysis = PropertyValueEstimator().estimate_value(["iPhone 13", "wallet"], ["", ""])
+    assert analysis["total_estimated_value"] == 75000
+    assert [item["estimated_value"] for item in analysis["breakdown"]] == [65000, 10000]
+    assert analysis["value_category"] == "serious_theft"
+    assert analysis["legal_thresholds"]["above_community_service_threshold"] is True
+    print("PASS: totals and thresholds")
+
+
+def test_batch_matches_single_estimates():
+    """estimate_values_batch returns what estimate_value returns for each list"""
+    print("Testing batch estimation...")
+    estimator = PropertyValueEstimator()
+    item_lists = [[item for item, *_ in EXPECTED_ESTIMATES[i:i + 4]] for i in range(0, len(EXPECTED_ESTIMATES), 3)]
+    item_lists += [[], ["wallet"], ["cash"] * 3, ["watch", "Rolex watch"]]
+    description_lists = [[description for _, description, *_ in EXPECTED_ESTIMATES[i:i + 4]]
+                         for i in range(0, len(EXPECTED_ESTIMATES), 3)]
+
+    expected = [
+        estimator.estimate_value(items, description_lists[n] if n < len(description_lists) else None)
+        for n, items in enumerate(item_lists)
+    ]
+    assert estimator.estimate_values_batch(item_lists, description_lists, breakdown=True) == expected
+
+    without_breakdown = estimator.estimate_values_batch(item_lists, description_lists)
+    for result, single in zip(without_breakdown, expected):
+        single.pop("breakdown")
+        assert result == single
+
+    # Explicit values beyond int64 keep exact totals
+    huge = estimator.estimate_values_batch([["laptop worth 99999999999999999999"] * 2])
+    assert huge[0]["total_estimated_value"] == 2 * 99999999999999999999
+    print(f"PASS: {len(item_lists)} lists match estimate_value")
+
+
+def test_batch_uses_configured_thresholds():
+    """The vectorised path categorises with legal_thresholds, like estimate_value"""
+    print("Testing configured thresholds...")
+    estimator = PropertyValueEstimator()
+    estimator.legal_thresholds = {"community_service": 30000, "simple_theft": 60000, "major_theft": 70000}
+    item_lists = [["phone"], ["laptop"], ["iphone 13"], ["macbook pro"]]  # 25,000 / 45,000 / 65,000 / 1,50,000
+    expected = [estimator.estimate_value(items) for items in item_lists]
+    for result in expected:
+        del result["breakdown"]
+    assert [result["value_category"] for result in expected] == list(VALUE_CATEGORIES)
+    assert expected[0]["legal_thresholds"]["bns_303_implication"] == "community_service"
+    assert estimator.estimate_values_batch(item_lists) == expected
+    print("PASS: batch thresholds follow legal_thresholds")
+
+
+def test_query_amounts_are_credited():
+    """Amounts in the query go to the nearest item, uncued rupee amounts to cash items"""
+    print("Testing query amounts...")
+    estimator = PropertyValueEstimator()
+    analysis = estimator.estimate_value(
+        ["phone", "cash"], query="Someone stole my phone worth 80k and 5,000 rupees cash from my house"
+    )
+    assert [item["estimated_value"] for item in analysis["breakdown"]] == [80000, 5000]
+    assert analysis["confidence"] == "high"
+
+    # "Rs. 2 lakh" used to be read as Rs. 2 and flip the Rs. 5,000 threshold
+    chain = estimator.estimate_value(["chain"], query="A thief snatched my gold chain worth Rs. 2 lakh")
+    assert chain["total_estimated_value"] == 200000
+
+    # Model numbers and times are not money
+    phone = estimator.estimate_value(["iphone"], query="He stole my iphone 14 at 10 pm")
+    assert phone["breakdown"][0]["basis"] == "Generic iPhone price"
+
+    batch = estimator.estimate_values_batch([["phone", "cash"], ["chain"]], queries=[
+        "Someone stole my phone worth 80k and 5,000 rupees cash from my house",
+        "A thief snatched my gold chain worth Rs. 2 lakh"
+    ])
+    assert [result["total_estimated_value"] for result in batch] == [85000, 200000]
+    print("PASS: query amounts credited")
+
+
+def test_uncued_amounts_are_cash():
+    """An amount without a cue never prices another item; with no cash item it is stolen cash of its own"""
+    print("Testing uncued amounts...")
+    estimator = PropertyValueEstimator()
+    query = "Someone stole my phone and 500 rupees from my house"
+    analysis = estimator.estimate_value(["phone"], query=query)
+    assert [(item["item"], item["estimated_value"]) for item in analysis["breakdown"]] == [("phone", 25000), ("cash", 500)]
+    assert analysis["total_estimated_value"] == 25500
+    assert analysis["legal_thresholds"]["bns_303_implication"] == "imprisonment_or_fine"
+
+    cash_only = estimator.estimate_value([], query="He stole 1.5 lakh rupees from the shop")
+    assert cash_only["total_estimated_value"] == 150000
+    assert cash_only["breakdown"][0]["basis"] == "Amount mentioned in the query"
+
+    batch = estimator.estimate_values_batch([["phone"], []], breakdown=True,
+                                            queries=[query, "He stole 1.5 lakh rupees from the shop"])
+    assert batch == [analysis, cash_only]
+    print("PASS: phone keeps its price, amounts counted as cash")
+
+
+if __name__ == "__main__":
+    test_estimates_per_price_row()
+    test_estimate_value_totals()
+    test_batch_matches_single_estimates()
+    test_batch_uses_configured_thresholds()
+    test_query_amounts_are_credited()
+    test_uncued_amounts_are_cash()
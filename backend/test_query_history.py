@@ -0,0 +1,114 @@
+#!/usr/bin/env python3
+"""
+LEGALS Query History Test (No Services Required)
+Keyset pagination of user history and read-through lookups by query_id, against SQLite with the real models
+"""
+import os
+import sys
+import tempfile
+from datetime import datetime, timedelta, timezone
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from sqlalchemy import create_engine, event, insert, text
+from sqlalchemy.orm import Session
+
+from app.models.database import Base
+from app.models.user_models import LegalQuery
+from app.services.database_service import database_service, decode_history_cursor
+from app.services.persistence_queue import legal_query_row
+from app.services.stored_query_cache import stored_query_cache, stored_query_record
+
+START = datetime(2026, 3, 1, tzinfo=timezone.utc)
+HISTORY = 45
+
+
+def make_database(tmp):
+    engine = create_engine(f"sqlite:///{os.path.join(tmp, 'legals.db')}")
+    event.listen(engine, "connect", lambda connection, _: connection.execute("PRAGMA foreign_keys=ON"))
+    Base.metadata.create_all(engine)
+    rows = [
+        # Pairs of queries share a timestamp, so pages must break ties on id
+        legal_query_row(f"u1-{n}", f"query {n}", "en", {}, [], "advice", 0.8, 0.1, user_id="u1",
+                        created_at=START + timedelta(minutes=n // 2))
+        for n in range(HISTORY)
+    ]
+    rows += [legal_query_row(f"u2-{n}", "other user", "en", {}, [], "advice", 0.8, 0.1, user_id="u2",
+                             created_at=START + timedelta(minutes=n)) for n in range(5)]
+    with engine.begin() as connection:
+        database_service.ensure_users(connection, rows)
+        connection.execute(insert(LegalQuery.__table__), rows)
+    return engine
+
+
+def test_keyset_pages():
+    """Pages cover the history once, newest first, and stay on the composite index"""
+    print("Testing keyset pagination...")
+    with tempfile.TemporaryDirectory() as tmp:
+        engine = make_database(tmp)
+        with Session(engine) as session:
+            seen, cursor, pages = [], None, 0
+            while True:
+                page = database_service.get_user_query_page(session, "u1", limit=20, cursor=cursor)
+                seen += [item["query_id"] for item in page["items"]]
+                pages += 1
+                cursor = page["next_cursor"]
+                if cursor is None:
+                    break
+            assert pages == 3 and len(seen) == len(set(seen)) == HISTORY
+            assert seen == [f"u1-{n}" for n in reversed(range(HISTORY))]  # later rows win timestamp ties
+            assert [query.query_id for query in database_service.get_user_queries(session, "u1", limit=3)] == seen[:3]
+            assert database_service.get_user_query_page(session, "nobody") == {"items": [], "next_cursor": None}
+
+            plan = " ".join(str(row) for row in session.execute(text(
+                "EXPLAIN QUERY PLAN SELECT * FROM legal_queries WHERE user_id = 'u1' "
+                "AND (created_at, id) < ('2026-03-01 00:10:00', 30) ORDER BY created_at DESC, id DESC LIMIT 21"
+            )))
+            assert "ix_legal_queries_user_created_id" in plan and "TEMP B-TREE" not in plan, plan
+
+            for bad in ("not-a-cursor", "bm9waXBl"):
+                try:
+                    decode_history_cursor(bad)
+                    assert False, bad
+                except ValueError:
+                    pass
+            try:
+                database_service.get_user_query_page(session, "u1", limit=20, cursor="not-a-cursor")
+                assert False, "malformed cursor must be rejected"
+            except ValueError:
+                pass
+        engine.dispose()
+    print(f"PASS: {HISTORY} queries in {pages} pages")
+
+
+def test_stored_query_read_through():
+    """Stored query lookups load once, then serves from the cache until the row changes"""
+    print("Testing stored query lookups...")
+    with tempfile.TemporaryDirectory() as tmp:
+        engine = make_database(tmp)
+        stored_query_cache.clear()
+        hits, misses = stored_query_cache.hits, stored_query_cache.misses
+        with Session(engine) as session:
+            record = database_service.get_stored_query(session, "u1-7")
+            assert record["query"] == "query 7" and record["verified"] is False
+            assert record["created_at"] == (START + timedelta(minutes=3)).isoformat()
+            assert database_service.get_stored_query(session, "u1-7") is record
+            assert (stored_query_cache.hits - hits, stored_query_cache.misses - misses) == (1, 1)
+
+            database_service.update_query_verification(session, "u1-7", True)
+            assert database_service.get_stored_query(session, "u1-7")["verified"] is True
+
+            assert database_service.get_stored_query(session, "missing") is None
+            assert stored_query_cache.get("missing") is None  # misses are not cached
+
+        # Records cached by the pipeline before their batch is written read the same as stored ones
+        row = legal_query_row("u1-7", "query 7", "en", {}, [], "advice", 0.8, 0.1, user_id="u1", verified=True,
+                              created_at=START + timedelta(minutes=3))
+        assert stored_query_record(row) == record | {"verified": True}
+        stored_query_cache.clear()
+        engine.dispose()
+    print("PASS: read-through cache")
+
+
+if __name__ == "__main__":
+    test_keyset_pages()
+    test_stored_query_read_through()
@@ -0,0 +1,116 @@
+#!/usr/bin/env python3
+"""
+LEGALS Query Lookup Test (No Services Required)
+Section and entity lookups over stored queries and the schema upgrade that backfills query_sections,
+run against SQLite with the real models
+"""
+import os
+import sys
+import tempfile
+from datetime import datetime, timedelta, timezone
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from sqlalchemy import create_engine, insert, select
+from sqlalchemy.orm import Session
+
+from app.models.database import Base
+from app.models.user_models import LegalQuery, QueryDailyStats, QuerySection
+from app.services.database_schema import upgrade_schema
+from app.services.database_service import database_service
+
+MARCH = datetime(2026, 3, 1, tzinfo=timezone.utc)
+
+QUERIES = [
+    # (query_id, objects, sections, days after 1 March)
+    ("q1", ["gold chain"], ["BNS-304"], 0),
+    ("q2", ["chain", "phone"], ["BNS-303", "BNS-304"], 1),
+    ("q3", ["phone"], ["BNS-308"], 2),
+    ("q4", ["chain"], ["BNS-308", "BNS-303"], 3),
+    ("q5", ["laptop"], [], 4),
+]
+
+
+def store_queries(session):
+    for query_id, objects, sections, days in QUERIES:
+        database_service.save_legal_query(
+            session, f"query {query_id}", "en", {"objects": objects, "actions": ["stole"]},
+            [{"section": section, "confidence": 0.8} for section in sections], "advice", 0.8, 0.1, query_id=query_id
+        )
+        # Backdate both copies of the timestamp
+        session.query(LegalQuery).filter(LegalQuery.query_id == query_id).update(
+            {"created_at": MARCH + timedelta(days=days)})
+        session.query(QuerySection).filter(QuerySection.query_id == query_id).update(
+            {"created_at": MARCH + timedelta(days=days)})
+    session.commit()
+
+
+def ids(queries):
+    return [query.query_id for query in queries]
+
+
+def test_section_and_entity_lookups():
+    """query_sections answers section + date range lookups; JSON containment answers co-citation and entities"""
+    print("Testing section and entity lookups...")
+    with tempfile.TemporaryDirectory() as tmp:
+        engine = create_engine(f"sqlite:///{os.path.join(tmp, 'legals.db')}")
+        Base.metadata.create_all(engine)
+        with Session(engine) as session:
+            store_queries(session)
+            stored = session.execute(select(LegalQuery).where(LegalQuery.query_id == "q2")).scalar_one()
+            assert stored.extracted_entities["objects"] == ["chain", "phone"]  # a JSON document, not a string
+            assert sorted(section.section_number for section in stored.sections) == ["BNS-303", "BNS-304"]
+
+            assert ids(database_service.get_queries_by_section(session, "BNS-308")) == ["q4", "q3"]
+            assert ids(database_service.get_queries_by_section(
+                session, "BNS-303", start=MARCH, end=MARCH + timedelta(days=2))) == ["q2"]
+            assert ids(database_service.get_queries_by_section(session, "BNS-303", limit=1)) == ["q4"]
+            assert database_service.count_queries_by_section(session, end=MARCH + timedelta(days=3)) == {
+                "BNS-303": 1, "BNS-304": 2, "BNS-308": 1
+            }
+
+            assert ids(database_service.get_queries_citing_all(session, ["BNS-303", "BNS-304"])) == ["q2"]
+            assert ids(database_service.get_queries_by_entity(session, "objects", "chain")) == ["q4", "q2"]
+            assert ids(database_service.get_queries_by_entity(
+                session, "objects", "chain", end=MARCH + timedelta(days=2))) == ["q2"]
+            assert database_service.get_queries_by_entity(session, "objects", "bicycle") == []
+            try:
+                database_service.get_queries_by_entity(session, "objects') --", "chain")
+                assert False, "category must be validated"
+            except ValueError:
+                pass
+        engine.dispose()
+    print("PASS: section, co-citation and entity lookups")
+
+
+def test_upgrade_backfills_existing_rows():
+    """An existing legal_queries table gains query_sections and the rollup; re-running changes nothing"""
+    print("Testing schema upgrade...")
+    with tempfile.TemporaryDirectory() as tmp:
+        engine = create_engine(f"sqlite:///{os.path.join(tmp, 'legals.db')}")
+        Base.metadata.create_all(engine, tables=[LegalQuery.__table__])  # the pre-upgrade schema
+        with engine.begin() as connection:
+            connection.execute(insert(LegalQuery.__table__), [
+                {"query_id": query_id, "query_text": query_id, "language": "en",
+                 "extracted_entities": {"objects": objects}, "created_at": MARCH + timedelta(days=days),
+                 "applicable_laws": [{"section": section} for section in sections]}
+                for query_id, objects, sections, days in QUERIES
+            ])
+
+        report = upgrade_schema(engine)
+        assert {"query_sections", "query_daily_stats", "users"} <= set(report["tables"])
+        assert report["query_sections"] == 6 and report["rollup_rows"] > 0
+
+        again = upgrade_schema(engine)
+        assert again["tables"] == [] and again["indexes"] == []
+        with Session(engine) as session:
+            assert session.query(QuerySection).count() == 6
+            assert ids(database_service.get_queries_by_section(session, "BNS-304")) == ["q2", "q1"]
+            total = session.query(QueryDailyStats).filter(QueryDailyStats.section_number == "").all()
+            assert sum(row.query_count for row in total) == len(QUERIES)
+        engine.dispose()
+    print("PASS: upgrade is idempotent and backfills existing queries")
+
+
+if __name__ == "__main__":
+    test_section_and_entity_lookups()
+    test_upgrade_backfills_existing_rows()
@@ -0,0 +1,121 @@
+#!/usr/bin/env python3
+"""
+LEGALS Query Statistics Test (No Services Required)
+Runs the aggregates and the daily rollup against a SQLite database with the real models
+"""
+import os
+import sys
+import tempfile
+from datetime import date, datetime, timedelta, timezone
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from sqlalchemy import create_engine, select
+from sqlalchemy.orm import Session
+
+from app.models.database import Base
+from app.models.user_models import QueryDailyStats
+from app.services.database_service import database_service
+from app.services.persistence_queue import PersistenceQueue, legal_query_row
+from app.services.query_statistics import query_statistics
+
+DAY_ONE = datetime(2026, 3, 1, 10, 30, tzinfo=timezone.utc)
+# IST evening of 1 March is still 1 March in UTC; 2 March 01:00 IST is 1 March 19:30 UTC
+IST = timezone(timedelta(hours=5, minutes=30))
+
+QUERIES = [
+    # (query_id, language, sections, confidence, created_at)
+    ("q1", "en", ["BNS-303"], 0.8, DAY_ONE),
+    ("q2", "en", ["BNS-303", "BNS-305"], 0.9, DAY_ONE),
+    ("q3", "hi", ["BNS-304"], 0.7, DAY_ONE),
+    ("q4", "hi", [], None, datetime(2026, 3, 2, 1, 0, tzinfo=IST)),
+    ("q5", "en", ["BNS-303"], 0.6, DAY_ONE + timedelta(days=1)),
+]
+
+
+def make_rows():
+    return [
+        legal_query_row(query_id, f"query {query_id}", language, {"objects": ["phone"]},
+                        [{"section": section, "title": "Theft"} for section in sections],
+                        "advice", confidence, 0.5, created_at=created_at)
+        for query_id, language, sections, confidence, created_at in QUERIES
+    ]
+
+
+def rollup(session):
+    return sorted(
+        (row.day, row.language, row.section_number, row.query_count, row.verified_count, row.confidence_count)
+        for row in session.execute(select(QueryDailyStats)).scalars()
+    )
+
+
+def test_rollup_and_breakdowns():
+    """Rows stored through the write-behind queue are counted once, and the breakdowns add up"""
+    print("Testing rollup maintained by the persistence queue...")
+    with tempfile.TemporaryDirectory() as tmp:
+        engine = create_engine(f"sqlite:///{os.path.join(tmp, 'legals.db')}")
+        Base.metadata.create_all(engine)
+
+        persistence = PersistenceQueue(engine, enabled=True, batch_size=3, flush_interval=0.02, spill_path="")
+        persistence.start()
+        for row in make_rows() + make_rows()[:2]:  # the last two are replays of stored rows
+            persistence.submit(row)
+        persistence.stop(timeout=5)
+
+        with Session(engine) as session:
+            overview = database_service.get_query_statistics(session)
+            assert overview["total_queries"] == 5 and overview["verified_queries"] == 0
+            assert abs(overview["average_confidence"] - 0.75) < 1e-9  # NULL scores are skipped, as AVG does
+
+            daily = query_statistics.daily(session)
+            assert [(entry["day"], entry["queries"]) for entry in daily] == [(date(2026, 3, 1), 4), (date(2026, 3, 2), 1)]
+            assert abs(daily[0]["average_confidence"] - 0.8) < 1e-9
+
+            languages = {entry["language"]: entry["queries"] for entry in query_statistics.by_language(session)}
+            assert languages == {"en": 3, "hi": 2}
+
+            sections = [(entry["section_number"], entry["queries"]) for entry in query_statistics.by_section(session)]
+            assert sections == [("BNS-303", 3), ("BNS-304", 1), ("BNS-305", 1)]
+            assert query_statistics.by_section(session, start=date(2026, 3, 2))[0]["queries"] == 1
+            assert len(query_statistics.by_section(session, limit=1)) == 1
+
+            summary = database_service.get_statistics_summary(session, end=date(2026, 3, 1))
+            assert summary["total_queries"] == 4 and [entry["queries"] for entry in summary["daily"]] == [4]
+            assert abs(summary["average_confidence"] - 0.8) < 1e-9  # totals cover the same days as the breakdowns
+            later = database_service.get_statistics_summary(session, start=date(2026, 3, 2))
+            assert later["total_queries"] == sum(entry["queries"] for entry in later["languages"]) == 1
+            empty = query_statistics.overview(session, start=date(2027, 1, 1))
+            assert empty == {"total_queries": 0, "verified_queries": 0, "verification_rate": 0, "average_confidence": 0.0}
+        engine.dispose()
+    print("PASS: rollup counts every stored query once")
+
+
+def test_verification_and_rebuild():
+    """Verification updates the rollup, and a rebuild from legal_queries gives the same rollup"""
+    print("Testing verification updates and rebuild...")
+    with tempfile.TemporaryDirectory() as tmp:
+        engine = create_engine(f"sqlite:///{os.path.join(tmp, 'legals.db')}")
+        Base.metadata.create_all(engine)
+
+        with Session(engine) as session:
+            for query_id, language, sections, confidence, created_at in QUERIES:
+                stored = database_service.save_legal_query(
+                    session, f"query {query_id}", language, {}, [{"section": section} for section in sections],
+                    "advice", confidence, 0.5, query_id=query_id
+                )
+                assert stored.query_id == query_id
+
+            assert database_service.update_query_verification(session, "q2", True)
+            assert database_service.update_query_verification(session, "q2", True)  # unchanged flag, no double count
+            incremental = rollup(session)
+            assert query_statistics.overview(session)["verified_queries"] == 1
+            assert sum(row[4] for row in incremental) == 3  # q2's all-sections row plus BNS-303 and BNS-305
+
+            assert query_statistics.rebuild(session) == len(incremental)
+            assert rollup(session) == incremental
+        engine.dispose()
+    print("PASS: verification counted and rebuild matches the incremental rollup")
+
+
+if __name__ == "__main__":
+    test_rollup_and_breakdowns()
+    test_verification_and_rebuild()
@@ -0,0 +1,98 @@
+#!/usr/bin/env python3
+"""
+LEGALS Response Cache Test (No Neo4j Required)
+Checks normalisation, LRU/TTL behaviour and cache hits in the processing pipeline
+"""
+import sys
+import os
+import time
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from app.services.response_cache import ResponseCache, normalise_query
+from app.services.legal_processing_service import LegalProcessingService
+
+
+def test_normalisation():
+    """Case, whitespace and punctuation collapse; numbers keep their separators"""
+    print("Testing query normalisation...")
+    assert normalise_query("Someone STOLE my phone!!  from my house...") == "someone stole my phone from my house"
+    assert normalise_query("  someone stole my phone from my house") == "someone stole my phone from my house"
+    assert normalise_query("Worth Rs. 5,000 (approx 2.5 lakh)") == "worth rs 5,000 approx 2.5 lakh"
+    print("PASS: queries normalised")
+
+
+def test_lru_and_ttl():
+    """Oldest entry is evicted, expired entries miss, errors are not stored"""
+    print("Testing LRU eviction and TTL...")
+    cache = ResponseCache(max_size=2, ttl_seconds=60)
+    cache.put("query one", "en", {"legal_advice": "one"})
+    cache.put("query two", "en", {"legal_advice": "two"})
+    assert cache.get("Query one!", "en") == {"legal_advice": "one"}
+    cache.put("query three", "en", {"legal_advice": "three"})
+
+    assert cache.get("query two", "en") is None  # least recently used
+    assert cache.get("query one", "hi") is None  # language is part of the key
+    assert cache.stats()["evictions"] == 1
+
+    cache.put("failed query", "en", {"error": "boom"})
+    assert cache.get("failed query", "en") is None
+
+    cache.ttl_seconds = 0
+    time.sleep(0.01)
+    assert cache.get("query one", "en") is None
+    print(f"PASS: {cache.stats()}")
+
+
+def test_pipeline_hits():
+    """Second equivalent query is served from the cache with fresh identifiers"""
+    print("Testing cached pipeline responses...")
+    processor = LegalProcessingService()
+    processor.cache = ResponseCache(max_size=16, ttl_seconds=60)
+
+    first = processor.process_legal_query("Someone stole my phone from my house", "en")
+    second = processor.process_legal_query("someone stole my phone from my house!", "en")
+
+    assert processor.cache.stats()["hits"] == 1
+    assert second["query_id"] != first["query_id"]
+    assert second["query"] == "someone stole my phone from my house!"
+    assert second["applicable_laws"] == first["applicable_laws"]
+    assert second["legal_advice"] == first["legal_advice"]
+
+    # Callers get their own copy
+    second["applicable_laws"].clear()
+    third = processor.process_legal_query("Someone stole my phone from my house", "en")
+    assert third["applicable_laws"] == first["applicable_laws"]
+    print(f"PASS: cache hit in {second['processing_time'] * 1e6:.0f}us")
+
+
+def test_currency_markers_split_keys():
+    """A rupee marker makes a number a sum of money, so marked and bare amounts never share an answer"""
+    print("Testing currency markers in cache keys...")
+    marked = "Someone stole ₹9000 cash from my house"
+    bare = "Someone stole 9000 cash from my house"
+    assert normalise_query(marked) == normalise_query(bare)
+    assert ResponseCache.make_key(marked, "en") != ResponseCache.make_key(bare, "en")
+    assert ResponseCache.make_key(marked, "en") == ResponseCache.make_key("someone stole ₹9000 cash from my house!", "en")
+
+    processor = LegalProcessingService()
+    processor.cache = ResponseCache(max_size=16, ttl_seconds=60)
+    estimator = processor.neo4j.property_estimator
+    values = [estimator.estimate_value(["cash"], query=query)["total_estimated_value"] for query in (marked, bare)]
+    assert values[0] != values[1]  # the stated ₹9000 is credited, the bare number is not
+
+    processor.process_legal_query(marked, "en")
+    processor.process_legal_query(bare, "en")
+    assert processor.cache.stats()["hits"] == 0 and processor.cache.stats()["size"] == 2
+
+    processor.cache.clear()
+    results = processor.process_legal_query_batch([{"query": marked}, {"query": bare}])
+    assert processor.cache.stats()["size"] == 2  # separate batch jobs, not one fanned-out answer
+    assert [result["query"] for result in results] == [marked, bare]
+    print(f"PASS: marked and bare amounts cached separately (cash valued {values[0]} vs {values[1]})")
+
+
+if __name__ == "__main__":
+    test_normalisation()
+    test_lru_and_ttl()
+    test_pipeline_hits()
+    test_currency_markers_split_keys()
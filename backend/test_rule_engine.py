@@ -0,0 +1,48 @@
+#!/usr/bin/env python3
+"""
+LEGALS Rule Engine Test (No Neo4j Required)
+Checks compiled rule decisions for representative entity sets
+"""
+import sys
+import os
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from app.services.rule_engine import rule_engine
+
+# Expected sections come from the original per-section predicate methods
+SCENARIOS = [
+    ({"actions": ["stolen"], "objects": ["iPhone"], "locations": ["house"]}, [303, 305]),
+    ({"persons": ["employee"], "relationships": ["employer"], "actions": ["took"], "objects": ["laptop"]}, [303, 306]),
+    ({"actions": ["robbed", "threatened"], "objects": ["wallet"], "violence": ["knife"]}, [309, 308]),
+    ({"actions": ["snatched"], "objects": ["chain"], "locations": ["street"]}, [304]),
+    ({"actions": ["snatched"], "objects": ["chain"], "locations": ["house"]}, [305]),
+    ({"actions": ["tricked"], "circumstances": ["OTP"]}, []),
+    ({"actions": ["tricked"], "circumstances": ["bank account"]}, [318]),
+    ({"relationships": ["manager"], "actions": ["misappropriated"]}, [316]),
+    ({"circumstances": ["pay or"], "intentions": ["else"]}, [308]),
+    ({"actions": ["smashed"], "objects": ["car window"]}, [324]),
+    ({"actions": ["smashed"], "objects": ["car"], "circumstances": ["accidentally"]}, []),
+    ({"actions": ["climbed over"], "locations": ["garden"]}, [329]),
+]
+
+
+def test_rule_decisions():
+    """Compiled rules fire exactly the expected sections, in rule order"""
+    print("Testing compiled rule engine...")
+    for entities, expected in SCENARIOS:
+        fired = rule_engine.evaluate(entities)
+        status = "PASS" if fired == expected else "FAIL"
+        print(f"{status}: {entities} -> {fired}")
+        assert fired == expected
+
+
+def test_explain_matches_evaluate():
+    """Per-rule explanation agrees with the fired sections"""
+    entities, expected = SCENARIOS[0]
+    decisions = rule_engine.explain(entities)
+    assert [number for name, number, _ in rule_engine.rules if decisions[name]] == expected
+
+
+if __name__ == "__main__":
+    test_rule_decisions()
+    test_explain_matches_evaluate()
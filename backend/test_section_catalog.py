@@ -0,0 +1,203 @@
+#!/usr/bin/env python3
+"""
+LEGALS Section Catalogue Test (No Neo4j Required)
+Checks that find_applicable_laws is served from the in-memory catalogue
+"""
+import asyncio
+import sys
+import os
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from app.services.neo4j_service import Neo4jService, PoolMonitor
+from app.services.section_catalog import CATALOG_QUERY, SectionCatalog
+from app.services.rule_engine import rule_engine
+
+
+class FakeRecord:
+    def __init__(self, data):
+        self._data = data
+
+    def __getitem__(self, key):
+        return self._data[key]
+
+    def data(self):
+        return dict(self._data)
+
+
+class FakeSession:
+    """Counts queries and answers the catalogue query with two sections"""
+
+    def __init__(self, counter):
+        self.counter = counter
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        return False
+
+    def execute_read(self, work, *args, **kwargs):
+        # The session stands in for the managed transaction
+        return work(self, *args, **kwargs)
+
+    def run(self, query, **params):
+        self.counter["queries"] += 1
+        return [
+            FakeRecord({
+                "section_number": number, "section": f"BNS-{number}", "title": title,
+                "description": f"{title} description", "punishment": "Imprisonment",
+                "severity": "imprisonment_and_fine", "offence_type": title.lower()
+            })
+            for number, title in [(303, "Theft"), (305, "Theft in dwelling house")]
+        ]
+
+
+class FakeDriver:
+    def __init__(self):
+        self.counter = {"queries": 0}
+
+    def session(self, database=None):
+        return FakeSession(self.counter)
+
+
+class FakeAsyncResult:
+    def __init__(self, records):
+        self.records = records
+
+    async def data(self):
+        return [record.data() for record in self.records]
+
+
+class FakeAsyncSession(FakeSession):
+    """Async flavour of FakeSession"""
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *args):
+        return False
+
+    async def execute_read(self, work, *args, **kwargs):
+        return await work(self, *args, **kwargs)
+
+    async def run(self, query, **params):
+        return FakeAsyncResult(FakeSession.run(self, query, **params))
+
+
+class FakeAsyncDriver(FakeDriver):
+    def session(self, database=None):
+        return FakeAsyncSession(self.counter)
+
+
+class UnreachableSession(FakeSession):
+    """Every query fails, as when Neo4j goes down after startup"""
+
+    def run(self, query, **params):
+        self.counter["queries"] += 1
+        if query == CATALOG_QUERY:
+            self.counter["catalog_loads"] = self.counter.get("catalog_loads", 0) + 1
+        raise ConnectionError("Neo4j unreachable")
+
+
+class UnreachableAsyncSession(FakeAsyncSession):
+    async def run(self, query, **params):
+        return UnreachableSession.run(self, query, **params)
+
+
+class UnreachableDriver(FakeDriver):
+    def session(self, database=None):
+        return UnreachableSession(self.counter)
+
+
+class UnreachableAsyncDriver(FakeDriver):
+    def session(self, database=None):
+        return UnreachableAsyncSession(self.counter)
+
+
+def make_service():
+    service = Neo4jService.__new__(Neo4jService)
+    service.available = True
+    service.driver = FakeDriver()
+    service.async_driver = None
+    service._catalog_refresh = None
+    service.pool = PoolMonitor()
+    service.snapshot = None
+    service._fallback_snapshot = None
+    service.catalog = SectionCatalog(ttl_seconds=3600)
+    service.property_estimator = None
+    service.rule_engine = rule_engine
+    return service
+
+
+def test_catalog_serves_lookups_from_memory():
+    """Only the initial load touches the graph"""
+    print("Testing section catalogue...")
+    service = make_service()
+
+    entities = {"actions": ["stole"], "objects": ["phone"], "locations": ["house"]}
+    for _ in range(3):
+        laws = service.find_applicable_laws(entities)
+
+    print(f"Sections: {[law['section'] for law in laws]}, graph queries: {service.driver.counter['queries']}")
+    assert [law["section"] for law in laws] == ["BNS-303", "BNS-305"]
+    assert laws[0]["property_value_consideration"] is True
+    assert service.driver.counter["queries"] == 1
+
+    service.catalog.invalidate()
+    service.find_applicable_laws(entities)
+    assert service.driver.counter["queries"] == 2
+    print("PASS: catalogue reused until invalidated")
+
+
+def test_async_lookups_match_sync():
+    """The async path loads the catalogue through the async driver and returns the same laws"""
+    print("Testing async section lookups...")
+    entities = {"actions": ["stole"], "objects": ["phone"], "locations": ["house"]}
+    expected = make_service().find_applicable_laws(entities)
+
+    service = make_service()
+    service.async_driver = FakeAsyncDriver()
+
+    async def lookups():
+        return [await service.find_applicable_laws_async(entities) for _ in range(3)]
+
+    results = asyncio.run(lookups())
+    assert all(laws == expected for laws in results)
+    assert service.async_driver.counter["queries"] == 1
+    assert service.driver.counter["queries"] == 0
+    print("PASS: async lookups served from the catalogue")
+
+
+def test_failed_refresh_backs_off():
+    """While the graph is down the catalogue is reloaded once per retry interval, not on every lookup"""
+    print("Testing catalogue refresh back-off...")
+    entities = {"actions": ["stole"], "objects": ["phone"], "locations": ["house"]}
+    service = make_service()
+    service.driver = UnreachableDriver()
+    service.catalog = SectionCatalog(ttl_seconds=3600, retry_interval=60)
+
+    for _ in range(5):
+        service.find_applicable_laws(entities)  # served from the bundled snapshot meanwhile
+    assert service.driver.counter["catalog_loads"] == 1
+
+    service.catalog._failed_at -= 61  # retry interval elapsed, Neo4j is back
+    service.driver = FakeDriver()
+    laws = service.find_applicable_laws(entities)
+    assert [law["section"] for law in laws] == ["BNS-303", "BNS-305"]
+    assert not service.catalog.is_stale()
+
+    service.catalog.invalidate()
+    service.async_driver = UnreachableAsyncDriver()
+
+    async def lookups():
+        return [await service.find_applicable_laws_async(entities) for _ in range(5)]
+
+    asyncio.run(lookups())
+    assert service.async_driver.counter["catalog_loads"] == 1
+    print("PASS: one reload attempt per retry interval")
+
+
+if __name__ == "__main__":
+    test_catalog_serves_lookups_from_memory()
+    test_async_lookups_match_sync()
+    test_failed_refresh_backs_off()
@@ -0,0 +1,89 @@
+#!/usr/bin/env python3
+"""
+LEGALS Streaming Response Test (No Ollama or Neo4j Required)
+Drives stream_legal_query against a scripted Ollama streaming endpoint
+"""
+import asyncio
+import json
+import sys
+import os
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+import httpx
+
+from app.core.config import settings
+from app.services.legal_processing_service import LegalProcessingService
+from app.services.response_cache import ResponseCache
+
+QUERY = "Someone stole my phone from my house at night"
+TOKENS = ["**Legal ", "Guidance**\n", "BNS-303 applies. ", "Please consult a lawyer."]
+
+
+def ollama_stream(request):
+    """Ollama /api/generate answering with newline-delimited JSON chunks"""
+    body = json.loads(request.content)
+    assert body["stream"] is True
+    lines = [json.dumps({"response": token, "done": False}) for token in TOKENS]
+    lines.append(json.dumps({"response": "", "done": True}))
+    return httpx.Response(200, content="\n".join(lines).encode())
+
+
+def ollama_down(request):
+    return httpx.Response(503, content=b"unavailable")
+
+
+def collect(processor, handler, formatting):
+    """Run one streamed query and return its (event, data) pairs"""
+    async def run():
+        processor.ollama.async_client = httpx.AsyncClient(
+            base_url=settings.OLLAMA_BASE_URL, transport=httpx.MockTransport(handler)
+        )
+        previous = settings.OLLAMA_RESPONSE_FORMATTING
+        settings.OLLAMA_RESPONSE_FORMATTING = formatting
+        try:
+            return [event async for event in processor.stream_legal_query(QUERY, "en")]
+        finally:
+            settings.OLLAMA_RESPONSE_FORMATTING = previous
+            await processor.ollama.aclose()
+
+    return asyncio.run(run())
+
+
+def make_processor():
+    processor = LegalProcessingService()
+    processor.cache = ResponseCache(max_size=0)
+    return processor
+
+
+def test_tokens_are_streamed():
+    """Analysis arrives first, then one event per Phi-3 token, then done"""
+    print("Testing Phi-3 token streaming...")
+    events = collect(make_processor(), ollama_stream, formatting=True)
+    names = [name for name, _ in events]
+
+    assert names[0] == "analysis"
+    assert [law["section"] for law in events[0][1]["applicable_laws"]] == ["BNS-303", "BNS-305"]
+    assert [data["text"] for name, data in events if name == "token"] == TOKENS
+    assert names[-1] == "done"
+    assert events[-1][1]["legal_advice"] == "".join(TOKENS)
+    print(f"PASS: {len(TOKENS)} tokens streamed, first after {events[-1][1]['time_to_first_token'] * 1000:.1f}ms")
+
+
+def test_fallback_when_ollama_fails():
+    """An Ollama error before any token falls back to the templated response"""
+    print("Testing streaming fallback...")
+    processor = make_processor()
+    expected = processor.process_legal_query(QUERY, "en")["legal_advice"]
+
+    for handler, formatting in [(ollama_down, True), (ollama_stream, False)]:
+        events = collect(processor, handler, formatting)
+        tokens = "".join(data["text"] for name, data in events if name == "token")
+        assert [name for name, _ in events][-1] == "done"
+        assert tokens == expected
+        assert events[-1][1]["legal_advice"] == expected
+    print("PASS: templated advice streamed as a single response")
+
+
+if __name__ == "__main__":
+    test_tokens_are_streamed()
+    test_fallback_when_ollama_fails()
@@ -10,34 +10,46 @@
 // 3. Switch to legalknowledge database: :use legalknowledge
 // ==================================================================
 
+// ------------------------------------------------------------------
+// STEP 0: Constraints and Indexes
+// ------------------------------------------------------------------
+// Run before the import so every MERGE below is an index lookup instead
+// of a label scan. The backend creates the same schema on startup
+// (backend/app/services/graph_schema.py); both are idempotent.
+
+CREATE CONSTRAINT chapter_number_unique IF NOT EXISTS FOR (c:Chapter) REQUIRE c.number IS UNIQUE;
+CREATE CONSTRAINT section_id_unique IF NOT EXISTS FOR (s:Section) REQUIRE s.section_id IS UNIQUE;
+CREATE CONSTRAINT punishment_id_unique IF NOT EXISTS FOR (p:Punishment) REQUIRE p.punishment_id IS UNIQUE;
+CREATE CONSTRAINT offence_section_id_unique IF NOT EXISTS FOR (o:Offence) REQUIRE o.section_id IS UNIQUE;
+CREATE INDEX section_number_index IF NOT EXISTS FOR (s:Section) ON (s.section_number);
+CREATE INDEX offence_section_number_index IF NOT EXISTS FOR (o:Offence) ON (o.section_number);
+CREATE INDEX punishment_section_id_index IF NOT EXISTS FOR (p:Punishment) ON (p.section_id);
+
+
 // ------------------------------------------------------------------
 // STEP 1: Import Legal Data from CSV
 // ------------------------------------------------------------------
 // This creates Chapter, Section, Offence, and Punishment nodes
-// with proper relationships
+// with proper relationships. Nodes are merged on their constrained key
+// and the remaining properties are set, so re-running updates in place.
 
 LOAD CSV WITH HEADERS FROM 'file:///bns_ch17_final_cleaned.csv' AS row
 WITH row
 WHERE row.s_section_number IS NOT NULL AND trim(row.s_section_number) <> ""
 
 // Create Chapter node
-MERGE (c:Chapter {
-    number: "XVII",
-    title: "Of Offences Against Property"
-})
+MERGE (c:Chapter {number: "XVII"})
+SET c.title = "Of Offences Against Property"
 
 // Create Section nodes
-MERGE (s:Section {
-    section_id: "BNS-" + row.s_section_number,
-    section_number: toInteger(row.s_section_number),
-    title: row.s_section_title,
-    text: row.s_section_text
-})
+MERGE (s:Section {section_id: "BNS-" + row.s_section_number})
+SET s.section_number = toInteger(row.s_section_number),
+    s.title = row.s_section_title,
+    s.text = row.s_section_text
 
 // Create Offence nodes with proper type mapping
-MERGE (o:Offence {
-    section_id: "BNS-" + row.s_section_number,
-    type: CASE toInteger(row.s_section_number)
+MERGE (o:Offence {section_id: "BNS-" + row.s_section_number})
+SET o.type = CASE toInteger(row.s_section_number)
         WHEN 303 THEN 'theft'
         WHEN 304 THEN 'snatching'
         WHEN 305 THEN 'dwelling_theft'
@@ -53,20 +65,18 @@ MERGE (o:Offence {
         WHEN 329 THEN 'criminal_trespass'
         ELSE 'other'
     END,
-    section_number: toInteger(row.s_section_number)
-})
+    o.section_number = toInteger(row.s_section_number)
 
 // Create Punishment nodes
-MERGE (p:Punishment {
-    punishment_id: 'PUN_' + row.s_section_number,
-    section_id: "BNS-" + row.s_section_number,
-    description: row.punishment,
-    punishment_type: 'imprisonment_and_fine'
-})
+MERGE (p:Punishment {punishment_id: 'PUN_' + row.s_section_number})
+SET p.section_id = "BNS-" + row.s_section_number,
+    p.description = row.punishment,
+    p.punishment_type = 'imprisonment_and_fine'
 
 // Create relationships
 MERGE (c)-[:CONTAINS]->(s)
 MERGE (s)-[:DEFINES]->(o)
+MERGE (s)-[:PUNISHED_BY]->(p)
 
 RETURN
     count(DISTINCT c) as chapters_created,
@@ -86,9 +96,8 @@ RETURN
 // ------------------------------------------------------------------
 // Verify Section 303 (Theft) was imported correctly
 
-MATCH (s:Section)-[:DEFINES]->(o:Offence)
-MATCH (p:Punishment)
-WHERE s.section_number = 303 AND p.section_id = s.section_id
+MATCH (s:Section {section_number: 303})-[:DEFINES]->(o:Offence)
+MATCH (s)-[:PUNISHED_BY]->(p:Punishment)
 RETURN
     s.section_id as section_id,
     s.title as section_title,
@@ -118,9 +127,8 @@ MATCH (p:Punishment) RETURN 'Punishments' as type, count(p) as count;
 // ------------------------------------------------------------------
 // Visualize a sample of the knowledge graph
 
-MATCH path = (c:Chapter)-[:CONTAINS]->(s:Section)-[:DEFINES]->(o:Offence)
-MATCH (p:Punishment)
-WHERE s.section_number = 303 AND p.section_id = s.section_id
+MATCH path = (c:Chapter)-[:CONTAINS]->(s:Section {section_number: 303})-[:DEFINES]->(o:Offence)
+MATCH (s)-[:PUNISHED_BY]->(p:Punishment)
 RETURN path, p
 LIMIT 1;
 
@@ -153,6 +161,14 @@ ORDER BY s.section_number;
 // 3. Verify CSV filename matches: bns_ch17_final_cleaned.csv
 // 4. Check Neo4j Desktop → Database → Three dots → Open Folder → Import
 //
+// If STEP 0 fails on a uniqueness constraint:
+// 1. An older import left duplicate nodes; delete all and re-run from STEP 0
+//
+// If lookups return no punishments for a graph imported by an older script:
+// 1. Link the punishments to their sections:
+//    MATCH (p:Punishment) MATCH (s:Section {section_id: p.section_id})
+//    MERGE (s)-[:PUNISHED_BY]->(p);
+//
 // If nodes are created but properties are missing:
 // 1. Delete all and re-run: MATCH (n) DETACH DELETE n;
 // 2. Check CSV column headers match: s_section_number, s_section_title, etc.
@@ -25,10 +25,11 @@ def test_neo4j_direct():
 
     # Test the detection methods
     print("=== DETECTION TESTS ===")
-    print(f"Has theft elements: {neo4j_service._has_theft_elements(entities)}")
-    print(f"Has dwelling theft: {neo4j_service._has_dwelling_theft_elements(entities)}")
-    print(f"Has employee theft: {neo4j_service._has_employee_theft_elements(entities)}")
-    print(f"Has robbery: {neo4j_service._has_robbery_elements(entities)}")
+    decisions = neo4j_service.rule_engine.explain(entities)
+    print(f"Has theft elements: {decisions['theft']}")
+    print(f"Has dwelling theft: {decisions['dwelling_theft']}")
+    print(f"Has employee theft: {decisions['employee_theft']}")
+    print(f"Has robbery: {decisions['robbery']}")
 
     print()
     print("=== LEGAL REASONING TEST ===")
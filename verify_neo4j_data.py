@@ -56,9 +56,7 @@ with driver.session(database="legalknowledge") as session:
     # Check punishment
     print("\n=== PUNISHMENT FOR SECTION 303 ===")
     result = session.run("""
-        MATCH (s:Section)
-        MATCH (p:Punishment)
-        WHERE s.section_number = 303 AND p.section_id = s.section_id
+        MATCH (s:Section {section_number: 303})-[:PUNISHED_BY]->(p:Punishment)
         RETURN s.section_id, p.section_id, p.description
     """)
 
@@ -69,13 +67,13 @@ with driver.session(database="legalknowledge") as session:
     # Test the EXACT query from neo4j_service.py
     print("\n=== TESTING EXACT QUERY FROM CODE ===")
     result = session.run("""
-        MATCH (s:Section)-[:DEFINES]->(o:Offence)
-        MATCH (p:Punishment)
-        WHERE s.section_number = 303 AND p.section_id = s.section_id
-        RETURN s.section_id as section, s.title as title,
+        UNWIND $sections AS section_number
+        MATCH (s:Section {section_number: section_number})-[:DEFINES]->(o:Offence)
+        MATCH (s)-[:PUNISHED_BY]->(p:Punishment)
+        RETURN section_number, s.section_id as section, s.title as title,
                s.text as description, p.description as punishment,
                p.punishment_type as severity, o.type as offence_type
-    """)
+    """, sections=[303])
 
     count = 0
     for record in result: